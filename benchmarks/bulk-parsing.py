@@ -0,0 +1,81 @@
+# Benchmark Outline
+# 1. Generate synthetic contentDetails.duration and snippet.publishedAt values
+# 2. Parse them one record at a time with the previous helpers (re.match per call, dateutil)
+#    and with the current per-record Video helpers
+# 3. Parse them as whole columns with youtube.parsing (NumPy, requires pip install numpy)
+# 4. Print values per second for every approach, for a 50-item page and for a large column
+#
+# No API calls are made: YOUTUBE_API_KEY=dummy python benchmarks/bulk-parsing.py
+
+import os
+import re
+import sys
+import time
+import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dateutil.parser import parse
+from youtube import Video
+from youtube.parsing import parse_durations, parse_dates, classify_video_types
+
+N_VALUES = int(os.environ.get("N_VALUES", 200_000))
+os.environ.setdefault("YOUTUBE_API_KEY", "dummy")
+
+rng = random.Random(0)
+
+
+def random_duration() -> str:
+    if rng.random() < 0.02:
+        return "P0D"
+    days = f"{rng.randint(1, 3)}D" if rng.random() < 0.01 else ""
+    hours = f"{rng.randint(1, 10)}H" if rng.random() < 0.2 else ""
+    minutes = f"{rng.randint(0, 59)}M" if rng.random() < 0.8 else ""
+    return f"P{days}T{hours}{minutes}{rng.randint(0, 59)}S"
+
+
+def random_timestamp() -> str:
+    return f"20{rng.randint(10, 24)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}Z"
+
+
+def previous_convert_time_to_seconds(time_string: str) -> int:
+    try:
+        match = re.match(r'PT((\d+)H)?((\d+)M)?((\d+)S)?', time_string)
+        return int(match.group(2) or 0) * 3600 + int(match.group(4) or 0) * 60 + int(match.group(6) or 0)
+    except AttributeError:
+        return 0
+
+
+def previous_parse_date(date_string: str) -> str:
+    return parse(date_string).date().isoformat()
+
+
+def previous_per_record(durations: list, timestamps: list) -> None:
+    for duration, timestamp in zip(durations, timestamps):
+        Video._extract_video_type(previous_convert_time_to_seconds(duration))
+        previous_parse_date(timestamp)
+
+
+def per_record(durations: list, timestamps: list) -> None:
+    for duration, timestamp in zip(durations, timestamps):
+        Video._extract_video_type(Video._convert_time_to_seconds(duration))
+        Video._parse_date(timestamp)
+
+
+def bulk(durations: list, timestamps: list) -> None:
+    classify_video_types(parse_durations(durations))
+    parse_dates(timestamps)
+
+
+for size in [50, N_VALUES]:
+    durations = [random_duration() for _ in range(size)]
+    timestamps = [random_timestamp() for _ in range(size)]
+    # small pages are repeated so that timings are not dominated by noise
+    repeats = max(1, 20_000 // size)
+
+    print(f"{size:,} values")
+    for name, func in [("previous per-record", previous_per_record), ("per-record", per_record), ("bulk (numpy)", bulk)]:
+        start_time = time.perf_counter()
+        for _ in range(repeats):
+            func(durations, timestamps)
+        elapsed_time = time.perf_counter() - start_time
+        print(f"  {name:<20} {size * repeats / elapsed_time:>14,.0f} values/sec")
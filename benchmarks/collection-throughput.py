@@ -0,0 +1,136 @@
+# Benchmark Outline
+# 1. Start a local fake YouTube Data API server (synthetic data, optional latency and errors)
+# 2. Point the client registry at it and replace transcript scraping with a stub provider
+# 3. Run the collection paths: VideoDataCollector (channels, videos), Channel.get_channel_videos
+#    and YouTubeSearch.execute_search
+# 4. Print records/sec, API calls and quota units per record, p50/p99 request latency and peak RSS
+#
+# No quota is spent and no network is used, a dummy key is enough:
+#   YOUTUBE_API_KEY=dummy python benchmarks/collection-throughput.py --latency 0.02 --error-rate 0.01
+# With --json results are also written to a file, so CI can compare them against a baseline.
+
+import os
+import sys
+import json
+import time
+import resource
+import argparse
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# the fake API server is shared with the tests
+sys.path[:0] = [ROOT, os.path.join(ROOT, 'tests')]
+
+from youtube import registry, YoutubeContent, VideoDataCollector, Channel, YouTubeSearch, TranscriptFetcher, RequestExecutor
+from fake_api import FakeYouTubeServer, StubTranscriptProvider
+from youtube.retry import RetryPolicy
+
+os.environ.setdefault("YOUTUBE_API_KEY", "dummy")
+
+parser = argparse.ArgumentParser(description="Offline throughput benchmark of the collection paths.")
+parser.add_argument("--channels", type=int, default=10)
+parser.add_argument("--videos-per-channel", type=int, default=100)
+parser.add_argument("--keywords", type=int, default=10)
+parser.add_argument("--latency", type=float, default=0.0, help="injected API latency in seconds")
+parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of API requests failing with 503")
+parser.add_argument("--transcript-latency", type=float, default=0.0)
+parser.add_argument("--json", help="write results to this file")
+args = parser.parse_args()
+
+
+def percentile(values: list, q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+# client-side latency of every request sent to the (fake) API
+latencies = []
+send = YoutubeContent._send
+
+
+def timed_send(self, endpoint, params, units):
+    start_time = time.perf_counter()
+    try:
+        return send(self, endpoint, params, units)
+    finally:
+        latencies.append(time.perf_counter() - start_time)
+
+
+YoutubeContent._send = timed_send
+# retries of injected errors should not dominate the measurement
+YoutubeContent.request_executor = RequestExecutor(RetryPolicy(max_attempts=5, base_delay=0.01), requests_per_second=10_000)
+
+channel_ids = [f"UCbenchmark{i:04d}" for i in range(args.channels)]
+video_ids = [f"video{i:06d}" for i in range(args.channels * args.videos_per_channel)]
+keywords = [f"keyword {i}" for i in range(args.keywords)]
+
+
+def collect_channels() -> int:
+    with TranscriptFetcher(provider=StubTranscriptProvider(args.transcript_latency), requests_per_second=10_000) as fetcher:
+        collector = VideoDataCollector(channel_ids=channel_ids, transcript_fetcher=fetcher)
+        return sum(1 for _ in collector.iter_data_from_channels(max_videos=args.videos_per_channel))
+
+
+def collect_videos() -> int:
+    # video records have no transcripts, so no fetcher is needed
+    collector = VideoDataCollector(video_ids=video_ids)
+    return sum(1 for _ in collector.iter_data_from_videos())
+
+
+def channel_videos() -> int:
+    return sum(len(Channel(channel_id).get_channel_videos(args.videos_per_channel)) for channel_id in channel_ids)
+
+
+def search_videos() -> int:
+    return len(YouTubeSearch(keywords).execute_search("video", max_results=100))
+
+
+results = []
+with FakeYouTubeServer(latency=args.latency, error_rate=args.error_rate, videos_per_playlist=args.videos_per_channel) as server:
+    registry.api_endpoint = server.root_url
+
+    scenarios = [
+        ("VideoDataCollector channels", collect_channels),
+        ("VideoDataCollector videos", collect_videos),
+        ("Channel.get_channel_videos", channel_videos),
+        ("YouTubeSearch.execute_search", search_videos),
+    ]
+    for name, func in scenarios:
+        server.reset()
+        latencies.clear()
+        quota_before = YoutubeContent.quota_ledger.used
+
+        start_time = time.perf_counter()
+        records = func()
+        elapsed_time = time.perf_counter() - start_time
+
+        calls = sum(server.calls.values())
+        results.append({
+            "scenario": name,
+            "records": records,
+            "records_per_sec": records / elapsed_time,
+            "calls_per_record": calls / max(records, 1),
+            "quota_per_record": (YoutubeContent.quota_ledger.used - quota_before) / max(records, 1),
+            "p50_ms": percentile(latencies, 0.50) * 1000,
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+            "errors_injected": sum(server.errors.values()),
+            "peak_rss_mb": peak_rss_mb(),
+        })
+
+print(f"{'scenario':<30} {'records':>8} {'rec/s':>9} {'calls/rec':>9} {'quota/rec':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>6} {'RSS MB':>7}")
+for result in results:
+    print(
+        f"{result['scenario']:<30} {result['records']:>8,} {result['records_per_sec']:>9,.0f} "
+        f"{result['calls_per_record']:>9.3f} {result['quota_per_record']:>9.3f} {result['p50_ms']:>8.2f} "
+        f"{result['p99_ms']:>8.2f} {result['errors_injected']:>6} {result['peak_rss_mb']:>7.1f}"
+    )
+
+if args.json:
+    with open(args.json, "w") as file:
+        json.dump(results, file, indent=2)
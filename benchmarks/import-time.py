@@ -0,0 +1,71 @@
+# Benchmark Outline
+# 1. Import the package in fresh interpreters with `python -X importtime`
+# 2. Sum the cumulative import time of the top-level modules imported by each statement
+# 3. Check that heavy dependencies are not loaded before a client or transcript is used
+# 4. Print the median import time per statement and exit with status 1 over the startup budget
+#
+#   python benchmarks/import-time.py --budget-ms 50
+# Imports only, no API calls are made.
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# dependencies which must stay unloaded until a client, transcript or progress bar is used
+HEAVY_MODULES = ["googleapiclient", "httplib2", "youtube_transcript_api", "dateutil", "tqdm", "aiohttp", "pyarrow", "numpy"]
+
+STATEMENTS = [
+    "import youtube",
+    "from youtube import Playlist",
+    "from youtube import Video, Channel, VideoDataCollector",
+]
+
+parser = argparse.ArgumentParser(description="Import time of the youtube package.")
+parser.add_argument("--budget-ms", type=float, default=50.0, help="startup budget per statement")
+parser.add_argument("--runs", type=int, default=5)
+args = parser.parse_args()
+
+
+def import_time_ms(statement: str) -> float:
+    """
+    Returns the cumulative import time of the modules imported by the statement, as reported
+    by -X importtime for top-level imports (interpreter startup excluded).
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    # lines look like "import time:  self [us] | cumulative | imported package", site is startup
+    lines = [line for line in completed.stderr.splitlines() if line.startswith("import time:") and "|" in line]
+    start = max((i for i, line in enumerate(lines) if line.rsplit("|", 1)[1].strip() == "site"), default=-1)
+
+    total = 0
+    for line in lines[start + 1:]:
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        if not name.startswith("  ") and cumulative.strip().isdigit():
+            total += int(cumulative)
+    return total / 1000
+
+
+def loaded_heavy_modules(statement: str) -> list:
+    check = f"import sys; {statement}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", check], cwd=ROOT, capture_output=True, text=True, check=True)
+    return [module for module in completed.stdout.strip().split(",") if module]
+
+
+failed = False
+print(f"{'statement':<55} {'median ms':>10}  heavy modules loaded")
+for statement in STATEMENTS:
+    median = statistics.median(import_time_ms(statement) for _ in range(args.runs))
+    heavy = loaded_heavy_modules(statement)
+    over_budget = median > args.budget_ms or heavy
+
+    failed = failed or bool(over_budget)
+    status = "  OVER BUDGET" if over_budget else ""
+    print(f"{statement:<55} {median:>10.1f}  {', '.join(heavy) or '-'}{status}")
+
+sys.exit(1 if failed else 0)
@@ -0,0 +1,42 @@
+# Benchmark Outline
+# 1. Hold N video ids as a list of Video objects
+# 2. Hold the same ids as a compact VideoIds collection
+# 3. Print the memory held by both approaches (tracemalloc) at 100k and 1M ids
+#
+# No API calls are made, a dummy key is enough: YOUTUBE_API_KEY=dummy python benchmarks/memory-ids.py
+
+import os
+import sys
+import time
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from youtube import Video, VideoIds
+
+SIZES = [int(size) for size in os.environ.get("SIZES", "100000,1000000").split(",")]
+
+
+def video_id(i: int) -> str:
+    # 11 characters, like real video ids
+    return f"v{i:010d}"
+
+
+def create_video_list(n: int) -> list:
+    return [Video(video_id(i)) for i in range(n)]
+
+
+def create_video_ids(n: int) -> VideoIds:
+    return VideoIds(video_id(i) for i in range(n))
+
+
+for n in SIZES:
+    for name, func in [("list of Video", create_video_list), ("VideoIds", create_video_ids)]:
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        videos = func(n)
+        elapsed_time = time.perf_counter() - start_time
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{n:>9,} ids  {name:<15} {memory / 2**20:>9,.1f} MiB  {memory / n:>7,.1f} B/id  {elapsed_time:>6.2f}s")
+        del videos
@@ -0,0 +1,36 @@
+# Benchmark Outline
+# 1. Create Video objects the old way (one discovery build() per object)
+# 2. Create Video objects borrowing the shared client from the registry
+# 3. Print objects per second for both approaches
+#
+# No API calls are made, a dummy key is enough: YOUTUBE_API_KEY=dummy python benchmarks/object-creation.py
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from googleapiclient.discovery import build
+from youtube import Video
+
+N_OBJECTS = int(os.environ.get("N_OBJECTS", 2000))
+os.environ.setdefault("YOUTUBE_API_KEY", "dummy")
+
+
+def create_with_build(n: int) -> None:
+    for i in range(n):
+        video = Video(f"video{i:06d}")
+        video.youtube = build('youtube', 'v3', developerKey=os.environ["YOUTUBE_API_KEY"])
+
+
+def create_with_registry(n: int) -> None:
+    for i in range(n):
+        video = Video(f"video{i:06d}")
+        video.youtube
+
+
+for name, func in [("build() per object", create_with_build), ("shared registry", create_with_registry)]:
+    start_time = time.perf_counter()
+    func(N_OBJECTS)
+    elapsed_time = time.perf_counter() - start_time
+    print(f"{name:<20} {N_OBJECTS / elapsed_time:>12,.0f} objects/sec")
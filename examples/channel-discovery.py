@@ -4,7 +4,7 @@ from tqdm import tqdm
 
 # Appending folder with youtube module 
 sys.path.append('/Users/chrisbudnik/Desktop/Projects/youtube-data')
-from youtube import YouTubeSearch
+from youtube import YouTubeSearch, Channel
 
 # Parsing search terms saved in .txt file.
 with open('examples/data/keywords-business.txt', 'r') as file:
@@ -19,6 +19,9 @@ results = search.collect_best_ranking_channels(max_results = 50,
                                                order_by="relevance", 
                                                only_unique=True)
 
+# Fetching details of all channels in batches of 50 (one API call per batch)
+Channel.hydrate_many(results)
+
 # Saving results into csv file
 with open('examples/data/channel-search-business-v2.csv', 'w') as file:
     writer = csv.writer(file)
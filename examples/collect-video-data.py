@@ -5,35 +5,28 @@ import csv
 import time
 
 from tqdm import tqdm
-from youtube import Channel
+from youtube import Channel, CsvSink, metrics, JsonExporter
 
 PATH_TO_CHANNEL_DATA = "examples/data/channel-search-business-v2.csv"
 PATH_TO_PROPERTIES = "examples/data/video-properties-business-v2.csv"
 PATH_TO_STATS = "examples/data/video-stats-business-v2.csv"
 
+# csv header names differing from the record keys
+PROPERTIES_COLUMNS = {"length": "video_length"}
+
 p_errors = 0
 s_errors = 0
 n_videos = 0
 
+# per-endpoint latency, quota and error metrics, printed as JSON at the end
+metrics.enable(JsonExporter())
+
 start_time = time.time()
 
-with open(PATH_TO_CHANNEL_DATA, 'r') as channelid_csv, open(PATH_TO_PROPERTIES, "w") as properties_csv, open(PATH_TO_STATS, "w") as stats_csv:
+with open(PATH_TO_CHANNEL_DATA, 'r') as channelid_csv, CsvSink(PATH_TO_PROPERTIES, columns=PROPERTIES_COLUMNS) as properties_sink, CsvSink(PATH_TO_STATS) as stats_sink:
     # reader
     reader = csv.DictReader(channelid_csv)
 
-    # properties writer
-    pwriter = csv.writer(properties_csv)
-    pheader = ["video_id", "video_name", "channel_id", "channel_name",
-               "category_id", "published_at", "video_length", "type",
-               "license", "made_for_kids", "user_tags", "description",
-               "transcript"]
-    pwriter.writerow(pheader)
-
-    # stats writer 
-    swriter = csv.writer(stats_csv)
-    sheader = ["date", "video_id", "views", "likes", "comments"]
-    swriter.writerow(sheader)
-
     # iteration
     for row in tqdm(reader, desc="Processing channels..."):
         # get channel videos
@@ -46,15 +39,13 @@ with open(PATH_TO_CHANNEL_DATA, 'r') as channelid_csv, open(PATH_TO_PROPERTIES,
 
             try:
                 # extract properties
-                properties = video.get_video_properties()
-                pwriter.writerow(list(properties.values()))
+                properties_sink.write(video.get_video_properties())
             except Exception:
                 p_errors += 1
 
             try: 
                 # extract stats
-                stats = video.get_video_statistics()
-                swriter.writerow(list(stats.values()))
+                stats_sink.write(video.get_video_statistics())
             except Exception:
                 s_errors += 1
 
@@ -69,4 +60,6 @@ print(f"Videos retrived: {n_videos}")
 print(f"Stats extraction errors: {s_errors}")
 print(f"Property extraction errors: {p_errors}")
 
+metrics.export()
+
 
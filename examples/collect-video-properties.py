@@ -7,7 +7,7 @@ import sys
 sys.path.append('/Users/chrisbudnik/Desktop/Projects/youtube-data')
 
 import csv
-from youtube import VideoDataCollector
+from youtube import VideoDataCollector, CsvSink
 
 
 # Save channel ids in list format from csv file
@@ -20,20 +20,8 @@ with open('/Users/chrisbudnik/Desktop/Projects/youtube-data/examples/data/channe
 # Create an instance of VideoDataCollector
 collector = VideoDataCollector(channel_ids=channel_ids)
 
-# Collect video data from channel ids
-data_from_channels = collector.collect_data_from_channels(max_videos=25)
+# Stream video data from channel ids straight into a csv file (written in batches)
+with CsvSink('/Users/chrisbudnik/Desktop/Projects/youtube-data/examples/data/video-properties-business.csv', columns={'length': 'video_length'}) as sink:
+    n_videos = sink.write_many(collector.iter_data_from_channels(max_videos=25))
 
-with open('/Users/chrisbudnik/Desktop/Projects/youtube-data/examples/data/video-properties-business.csv', 'w') as file:
-    writer = csv.writer(file)
-    header = ["video_id", "video_name", "channel_id", "channel_name",
-              "category_id", "published_at", "video_length", "type",
-              "license", "made_for_kids", "user_tags", "description",
-              "transcript"]
-    
-    writer.writerow(header)
-
-    for video in data_from_channels:
-        properties = list(video.values())
-        writer.writerow(properties)
-
-print(f"Successfuly saved data from {len(data_from_channels)} video.")
+print(f"Successfuly saved data from {n_videos} video.")
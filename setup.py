@@ -8,6 +8,12 @@ setup(
     version="0.1",
     packages=find_packages(),
     install_requires=required,
+    extras_require={
+        "async": ["aiohttp"],
+        "parquet": ["pyarrow"],
+        "stats": ["numpy"],
+        "zstd": ["zstandard"],
+    },
     author="Krzysztof Budnik",
     author_email="chris.studyx@gmail.com",
     description="A simple interface for extracting data from YouTube via offical v3 api.",
@@ -0,0 +1,44 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fake_api import FakeYouTubeServer
+from youtube import registry, Video, YoutubeContent, ApiKeyPool, QuotaLedger, RequestExecutor
+from youtube.metrics import metrics
+from youtube.retry import RetryPolicy
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """
+    Local fake API with the shared client state of YoutubeContent (keys, ledger, executor,
+    caches) replaced for the test, so tests neither spend quota nor affect each other.
+    """
+    with FakeYouTubeServer() as server:
+        monkeypatch.setattr(registry, 'api_endpoint', server.root_url)
+        monkeypatch.setattr(YoutubeContent, 'key_pool', ApiKeyPool(['test-key']))
+        monkeypatch.setattr(YoutubeContent, 'quota_ledger', QuotaLedger())
+        monkeypatch.setattr(YoutubeContent, 'request_executor', RequestExecutor(RetryPolicy(5, base_delay=0.001)))
+        monkeypatch.setattr(YoutubeContent, 'response_cache', None)
+        monkeypatch.setattr(YoutubeContent, 'etag_store', None)
+        yield server
+
+
+
+@pytest.fixture
+def enabled_metrics():
+    metrics.reset()
+    metrics.enable()
+    yield metrics
+    metrics.disable()
+    metrics.reset()
+
+
+@pytest.fixture
+def stub_transcripts(monkeypatch):
+    # transcripts are scraped from youtube.com, not from the API
+    monkeypatch.setattr(Video, 'get_video_transcript', lambda self, **kwargs: {"transcript": f"transcript of {self.video_id}"})
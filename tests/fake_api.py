@@ -0,0 +1,339 @@
+import json
+import time
+import random
+import hashlib
+import threading
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Optional
+from urllib.parse import urlparse, parse_qs
+
+SERVICE_PATH = '/youtube/v3/'
+
+
+def _number(seed: str, low: int, high: int) -> int:
+    """
+    Deterministic pseudo-random number for synthetic data, so runs are repeatable.
+    """
+    digest = hashlib.md5(seed.encode('utf-8')).digest()
+    return low + int.from_bytes(digest[:8], 'big') % (high - low + 1)
+
+
+def _video_id(seed: str) -> str:
+    return hashlib.md5(seed.encode('utf-8')).hexdigest()[:11]
+
+
+class FakeYouTubeServer:
+    """
+    Local HTTP server imitating the list endpoints of the YouTube Data API v3 (videos, including
+    mostPopular charts, channels, playlistItems, search) with deterministic synthetic data, or with recorded responses given
+    per endpoint. Latency and errors can be injected to measure retries and throughput.
+    Responses carry an etag and conditional requests (If-None-Match) are answered with
+    304 Not Modified while the content is unchanged.
+    Point the client registry (registry.api_endpoint = server.root_url) or AsyncVideoDataCollector
+    (base_url=server.url) at it; no quota is spent. Usable as a context manager.
+    """
+    def __init__(
+            self,
+            latency: float = 0.0,
+            latency_jitter: float = 0.0,
+            error_rate: float = 0.0,
+            error_status: int = 503,
+            error_reason: str = 'backendError',
+            videos_per_playlist: int = 200,
+            results_per_search: int = 500,
+            videos_per_chart: int = 200,
+            recorded: Optional[Dict[str, dict]] = None,
+            seed: int = 0,
+            port: int = 0
+        ):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.error_reason = error_reason
+        self.videos_per_playlist = videos_per_playlist
+        self.results_per_search = results_per_search
+        self.videos_per_chart = videos_per_chart
+        self.recorded = recorded or {}
+
+        self.calls = Counter()
+        self.errors = Counter()
+        # conditional requests answered with 304 Not Modified (If-None-Match matching the etag)
+        self.not_modified = Counter()
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def __repr__(self) -> str:
+        return f"FakeYouTubeServer(url={self.url})"
+
+    def __enter__(self) -> "FakeYouTubeServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @property
+    def root_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def url(self) -> str:
+        """
+        Base URL of the API, including the service path.
+        """
+        return self.root_url.rstrip('/') + SERVICE_PATH
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-youtube-api', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.errors.clear()
+            self.not_modified.clear()
+
+    # request handling
+
+    def count_not_modified(self, path: str) -> None:
+        endpoint = urlparse(path).path[len(SERVICE_PATH):]
+        with self._lock:
+            self.not_modified[endpoint] += 1
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # headers and body are written separately, without this every response waits for a delayed ACK
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                status, body = server.handle(self.path)
+
+                etag = None
+                if status == 200:
+                    # like the API, the etag identifies the content and is part of the body
+                    etag = f'"{hashlib.md5(json.dumps(body, sort_keys=True).encode("utf-8")).hexdigest()}"'
+                    body = {"etag": etag, **body}
+
+                    if self.headers.get('If-None-Match') == etag:
+                        server.count_not_modified(self.path)
+                        self.send_response(304)
+                        self.send_header('ETag', etag)
+                        self.send_header('Content-Length', '0')
+                        self.end_headers()
+                        return
+
+                content = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=UTF-8')
+                self.send_header('Content-Length', str(len(content)))
+                if etag is not None:
+                    self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(content)
+
+        return Handler
+
+    def handle(self, path: str):
+        """
+        Returns the status and JSON body of a GET request path, e.g. /youtube/v3/videos?id=...
+        """
+        url = urlparse(path)
+        endpoint = url.path[len(SERVICE_PATH):] if url.path.startswith(SERVICE_PATH) else url.path.strip('/')
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+
+        with self._lock:
+            self.calls[endpoint] += 1
+            delay = self.latency + self._random.uniform(0, self.latency_jitter)
+            failed = self._random.random() < self.error_rate
+
+        if delay:
+            time.sleep(delay)
+
+        if failed:
+            with self._lock:
+                self.errors[endpoint] += 1
+            return self.error_status, self._error(self.error_status, self.error_reason, "Injected error.")
+
+        if endpoint in self.recorded:
+            return 200, self.recorded[endpoint]
+
+        responders = {
+            'videos': self._videos,
+            'channels': self._channels,
+            'playlistItems': self._playlist_items,
+            'search': self._search,
+        }
+        if endpoint not in responders:
+            return 404, self._error(404, 'notFound', f"Unknown endpoint {endpoint}.")
+        return 200, responders[endpoint](params)
+
+    @staticmethod
+    def _error(status: int, reason: str, message: str) -> dict:
+        return {"error": {"code": status, "message": message, "errors": [{"reason": reason, "message": message}]}}
+
+    @staticmethod
+    def _parts(params: dict) -> list:
+        return [part.strip() for part in params.get('part', '').split(',') if part.strip()]
+
+    def _videos(self, params: dict) -> dict:
+        parts = self._parts(params)
+        if params.get('chart') == 'mostPopular':
+            return self._chart(params, parts)
+
+        items = [self._video_item(video_id, parts) for video_id in params.get('id', '').split(',') if video_id]
+        return {"kind": "youtube#videoListResponse", "items": items}
+
+    def _chart(self, params: dict, parts: list) -> dict:
+        region_code, category_id = params.get('regionCode', 'US'), params.get('videoCategoryId', '0')
+        positions, next_page_token = self._page(params, self.videos_per_chart)
+
+        # charts of different regions are shifted views of one pool, so videos trend in several regions
+        shift = _number(region_code, 0, self.videos_per_chart // 4)
+        items = [self._video_item(_video_id(f"chart/{category_id}/{position + shift}"), parts) for position in positions]
+
+        response = {"kind": "youtube#videoListResponse", "items": items,
+                    "pageInfo": {"totalResults": self.videos_per_chart}}
+        if next_page_token:
+            response["nextPageToken"] = next_page_token
+        return response
+
+    def _video_item(self, video_id: str, parts: list) -> dict:
+        minutes, seconds = _number(video_id + 'm', 0, 59), _number(video_id + 's', 0, 59)
+        views = _number(video_id + 'v', 100, 10_000_000)
+        data = {
+            "snippet": {
+                "publishedAt": f"2024-{_number(video_id + 'M', 1, 12):02d}-{_number(video_id + 'd', 1, 28):02d}T12:00:00Z",
+                "channelId": f"UC{_video_id(video_id + 'c')}",
+                "title": f"Video {video_id}",
+                "description": f"Synthetic description of {video_id}.",
+                "channelTitle": f"Channel {video_id[:4]}",
+                "tags": ["synthetic", "benchmark"],
+                "categoryId": str(_number(video_id + 'cat', 1, 29)),
+            },
+            "contentDetails": {"duration": f"PT{minutes}M{seconds}S"},
+            "status": {"license": "youtube", "madeForKids": False},
+            "statistics": {
+                "viewCount": str(views),
+                "likeCount": str(views // 20),
+                "commentCount": str(views // 400),
+            },
+        }
+        return {"kind": "youtube#video", "id": video_id, **{part: data[part] for part in parts if part in data}}
+
+    def _channels(self, params: dict) -> dict:
+        parts = self._parts(params)
+        items = []
+        for channel_id in params.get('id', '').split(','):
+            if not channel_id:
+                continue
+            data = {
+                "snippet": {"title": f"Channel {channel_id}", "publishedAt": "2020-01-01T00:00:00Z"},
+                "contentDetails": {"relatedPlaylists": {"likes": "", "uploads": self.uploads_playlist_id(channel_id)}},
+                "statistics": {"subscriberCount": str(_number(channel_id, 10, 5_000_000)), "videoCount": str(self.videos_per_playlist)},
+            }
+            items.append({"kind": "youtube#channel", "id": channel_id, **{part: data[part] for part in parts if part in data}})
+        return {"kind": "youtube#channelListResponse", "items": items}
+
+    @staticmethod
+    def uploads_playlist_id(channel_id: str) -> str:
+        return 'UU' + (channel_id[2:] if channel_id.startswith('UC') else channel_id)
+
+    def _page(self, params: dict, total: int):
+        start = int(params.get('pageToken') or 0)
+        size = min(int(params.get('maxResults') or 5), 50)
+        end = min(start + size, total)
+        next_page_token = str(end) if end < total else None
+        return range(start, end), next_page_token
+
+    def _playlist_items(self, params: dict) -> dict:
+        playlist_id = params.get('playlistId', '')
+        positions, next_page_token = self._page(params, self.videos_per_playlist)
+
+        items = []
+        for position in positions:
+            video_id = _video_id(f"{playlist_id}/{position}")
+            # newest first, like uploads playlists
+            day = max(1, 28 - position % 28)
+            items.append({
+                "kind": "youtube#playlistItem",
+                "contentDetails": {"videoId": video_id, "videoPublishedAt": f"2024-01-{day:02d}T12:00:00Z"},
+            })
+
+        response = {"kind": "youtube#playlistItemListResponse", "items": items,
+                    "pageInfo": {"totalResults": self.videos_per_playlist}}
+        if next_page_token:
+            response["nextPageToken"] = next_page_token
+        return response
+
+    def _search(self, params: dict) -> dict:
+        query, result_type = params.get('q', ''), params.get('type', 'video')
+        positions, next_page_token = self._page(params, self.results_per_search)
+
+        items = []
+        for position in positions:
+            video_id = _video_id(f"{query}/{position}")
+            channel_id = f"UC{_video_id(f'{query}/channel/{position % 25}')}"
+            result_id = {"videoId": video_id} if result_type == 'video' else {"channelId": channel_id}
+            items.append({
+                "kind": "youtube#searchResult",
+                "id": {"kind": f"youtube#{result_type}", **result_id},
+                "snippet": {
+                    "publishedAt": "2024-01-15T12:00:00Z",
+                    "channelId": channel_id,
+                    "title": f"{query} result {position}",
+                    "channelTitle": f"Channel {channel_id}",
+                },
+            })
+
+        response = {"kind": "youtube#searchListResponse", "items": items,
+                    "pageInfo": {"totalResults": self.results_per_search}}
+        if next_page_token:
+            response["nextPageToken"] = next_page_token
+        return response
+
+
+class StubTranscriptProvider:
+    """
+    Transcript provider for TranscriptFetcher(provider=...) returning synthetic transcripts
+    after an optional delay, failing with ValueError (retried by the fetcher) at error_rate.
+    """
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, words: int = 300, seed: int = 0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.words = words
+        self.calls = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"StubTranscriptProvider(latency={self.latency}, error_rate={self.error_rate})"
+
+    def __call__(self, video) -> dict:
+        with self._lock:
+            self.calls += 1
+            failed = self._random.random() < self.error_rate
+
+        if self.latency:
+            time.sleep(self.latency)
+        if failed:
+            raise ValueError("Could not extract video transcript, injected error.")
+
+        return {"transcript": " ".join(f"word{position}" for position in range(self.words))}
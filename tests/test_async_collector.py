@@ -0,0 +1,96 @@
+import asyncio
+from collections import Counter
+
+import pytest
+
+from youtube import VideoDataCollector, TranscriptFetcher, AsyncVideoDataCollector, YoutubeContent
+
+pytest.importorskip('aiohttp')
+pytestmark = pytest.mark.usefixtures('stub_transcripts')
+
+CHANNEL_IDS = ['UCa', 'UCb', 'UCc']
+
+
+def collect_sync(max_videos: int) -> list:
+    fetcher = TranscriptFetcher(requests_per_second=10_000)
+    with fetcher:
+        return VideoDataCollector(channel_ids=CHANNEL_IDS, transcript_fetcher=fetcher).collect_data_from_channels(max_videos)
+
+
+def collect_async(server, max_videos: int) -> list:
+    with TranscriptFetcher(requests_per_second=10_000) as fetcher:
+        collector = AsyncVideoDataCollector(channel_ids=CHANNEL_IDS, base_url=server.url, transcript_fetcher=fetcher)
+        return asyncio.run(collector.collect_data_from_channels(max_videos=max_videos))
+
+
+def test_channels_match_sync_collector(server):
+    records = collect_async(server, max_videos=60)
+
+    assert len(records) == 3 * 60
+    assert records == collect_sync(max_videos=60)
+
+
+def test_videos_match_sync_collector(server):
+    video_ids = [record['video_id'] for record in collect_sync(max_videos=30)]
+
+    collector = AsyncVideoDataCollector(video_ids=video_ids, base_url=server.url)
+    records = asyncio.run(collector.collect_data_from_videos())
+
+    assert records == VideoDataCollector(video_ids=video_ids).collect_data_from_videos()
+
+
+def test_transient_errors_are_retried(server):
+    server.error_rate = 0.2
+    executor = YoutubeContent.request_executor
+
+    records = collect_async(server, max_videos=60)
+
+    assert len(records) == 3 * 60
+    assert executor.retries == sum(server.errors.values()) > 0
+
+
+def test_failed_channel_is_skipped(server, monkeypatch, capsys):
+    handle = server.handle
+
+    def handle_missing_playlist(path: str):
+        if 'playlistId=UUb' in path:
+            return 404, server._error(404, 'playlistNotFound', "Playlist not found.")
+        return handle(path)
+
+    monkeypatch.setattr(server, 'handle', handle_missing_playlist)
+
+    records = collect_async(server, max_videos=20)
+
+    assert len(records) == 2 * 20
+    assert "channel 'UCb' failed" in capsys.readouterr().out
+
+
+def test_transcripts_reuse_fetcher_retries_and_store(server, monkeypatch, tmp_path):
+    from youtube import Video, TranscriptStore
+    from youtube.retry import RetryPolicy
+
+    calls = Counter()
+
+    def flaky_transcript(self, **kwargs):
+        calls[self.video_id] += 1
+        if self.video_id.endswith('0'):
+            return {"transcript": 'transcript-disabled'}
+        if calls[self.video_id] == 1:
+            raise ValueError("Could not extract video transcript, unconventional api error occured.")
+        return {"transcript": f"transcript of {self.video_id}", "segments": []}
+
+    monkeypatch.setattr(Video, 'get_video_transcript', flaky_transcript)
+    store = TranscriptStore(str(tmp_path / 'transcripts.sqlite'))
+    retry = RetryPolicy(max_attempts=3, base_delay=0.001, retry_on=(ValueError,))
+
+    def collect() -> list:
+        with TranscriptFetcher(requests_per_second=10_000, retry=retry, store=store) as fetcher:
+            collector = AsyncVideoDataCollector(channel_ids=['UCa'], base_url=server.url, transcript_fetcher=fetcher)
+            return asyncio.run(collector.collect_data_from_channels(max_videos=20))
+
+    first, second = collect(), collect()
+
+    assert first == second
+    assert all(calls[video_id] == 1 for video_id in calls if video_id.endswith('0'))
+    assert all(calls[video_id] == 2 for video_id in calls if not video_id.endswith('0'))
+    assert store.negative_hits == sum(1 for video_id in calls if video_id.endswith('0'))
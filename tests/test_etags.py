@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from youtube import Channel, EtagStore, YoutubeContent, AsyncYouTubeClient
+
+PARAMS = {'part': 'snippet, contentDetails', 'id': 'UCa'}
+
+
+@pytest.fixture
+def etag_store(server, monkeypatch):
+    store = EtagStore()
+    monkeypatch.setattr(YoutubeContent, 'etag_store', store)
+    yield store
+    store.close()
+
+
+def test_first_request_stores_etag(server, etag_store):
+    response = Channel('UCa')._execute('channels', **PARAMS)
+
+    etag, body = etag_store.get('channels', PARAMS)
+    assert etag == response['etag']
+    assert body == response
+    assert not server.not_modified
+
+
+def test_repeated_request_is_answered_not_modified(server, etag_store, enabled_metrics):
+    first = Channel('UCa')._execute('channels', **PARAMS)
+    second = Channel('UCa')._execute('channels', **PARAMS)
+
+    assert second == first
+    assert server.not_modified['channels'] == 1
+    assert server.calls['channels'] == 2
+
+    stats = etag_store.stats()
+    assert stats['conditional_requests'] == 1
+    assert stats['not_modified'] == 1
+    assert stats['endpoints']['channels']['hit_rate'] == 1.0
+    assert enabled_metrics.not_modified['channels'] == 1
+    assert enabled_metrics.summary()['endpoints']['channels']['not_modified'] == 1
+
+
+def test_changed_resource_replaces_stored_body(server, etag_store):
+    params = {'part': 'statistics', 'id': 'UCa'}
+    first = Channel('UCa')._execute('channels', **params)
+    server.videos_per_playlist += 1
+    changed = Channel('UCa')._execute('channels', **params)
+
+    assert changed != first
+    assert not server.not_modified
+    assert etag_store.get('channels', params) == (changed['etag'], changed)
+    assert etag_store.stats()['hit_rate'] == 0.0
+
+
+def test_async_client_sends_conditional_requests(server, etag_store, enabled_metrics):
+    pytest.importorskip('aiohttp')
+
+    async def execute_twice():
+        async with AsyncYouTubeClient(server.url) as client:
+            return [await client.execute('channels', **PARAMS) for _ in range(2)]
+
+    first, second = asyncio.run(execute_twice())
+
+    assert second == first
+    assert etag_store.get('channels', PARAMS)[0] == first['etag']
+    assert server.not_modified['channels'] == 1
+    assert etag_store.stats()['not_modified'] == 1
+    assert enabled_metrics.not_modified['channels'] == 1
+    assert enabled_metrics.quota_units['channels'] == 2
@@ -0,0 +1,55 @@
+import pytest
+
+from youtube import VideoDataCollector, TranscriptFetcher, RunJournal
+
+pytestmark = pytest.mark.usefixtures('stub_transcripts')
+
+CHANNEL_IDS = ['UCa', 'UCb']
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = RunJournal(str(tmp_path / 'journal.sqlite'))
+    yield journal
+    journal.close()
+
+
+def channel_records(journal: RunJournal):
+    with TranscriptFetcher(requests_per_second=10_000) as fetcher:
+        collector = VideoDataCollector(channel_ids=CHANNEL_IDS, transcript_fetcher=fetcher, journal=journal)
+        yield from collector.iter_data_from_channels(max_videos=120)
+
+
+def test_record_of_failed_consumer_is_produced_again(server, journal):
+    written = []
+    with pytest.raises(RuntimeError):
+        for position, record in enumerate(channel_records(journal)):
+            if position == 70:
+                raise RuntimeError("sink failed")
+            written.append(record['video_id'])
+
+    written += [record['video_id'] for record in channel_records(journal)]
+
+    assert len(written) == len(set(written)) == 2 * 120
+
+
+def test_resumed_run_repeats_at_most_the_last_handed_out_record(server, journal):
+    records = channel_records(journal)
+    produced = [next(records)['video_id'] for _ in range(130)]
+    records.close()
+
+    produced += [record['video_id'] for record in channel_records(journal)]
+
+    assert len(set(produced)) == 2 * 120
+    assert len(produced) - len(set(produced)) <= 1
+
+
+def test_videos_are_journaled_after_they_are_consumed(server, journal):
+    video_ids = [f'video{position}' for position in range(60)]
+    records = VideoDataCollector(video_ids=video_ids, journal=journal).iter_data_from_videos()
+    next(records)
+    records.close()
+
+    resumed = VideoDataCollector(video_ids=video_ids, journal=journal).collect_data_from_videos()
+
+    assert [record['video_id'] for record in resumed] == video_ids
@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from youtube import VideoDataCollector, TranscriptFetcher, YoutubeContent, QuotaScheduler
+
+pytestmark = pytest.mark.usefixtures('stub_transcripts')
+
+
+def collect(channel_ids: list, quota_budget: int) -> VideoDataCollector:
+    with TranscriptFetcher(requests_per_second=10_000) as fetcher:
+        collector = VideoDataCollector(channel_ids=channel_ids, quota_budget=quota_budget, transcript_fetcher=fetcher)
+        collector.collect_data_from_channels(max_videos=50)
+    return collector
+
+
+def test_budget_applies_to_the_configured_ledger(server):
+    # each channel is projected at 3 units: uploads playlist, one playlistItems and one videos page
+    collector = collect(['UCa', 'UCb', 'UCc', 'UCd'], quota_budget=6)
+
+    ledger = YoutubeContent.quota_ledger
+    assert collector.quota_report['scheduled'] == 2
+    assert collector.quota_report['actual'] == ledger.used == 6
+    assert collector.quota_report['actual_by_endpoint'] == dict(ledger.units)
+    assert ledger.budget is None
+
+
+def test_run_stops_once_budget_is_spent(server):
+    scheduler = QuotaScheduler(budget=2, ledger=YoutubeContent.quota_ledger)
+
+    with scheduler.run():
+        for _ in range(3):
+            YoutubeContent.quota_ledger.charge('videos')
+
+    assert scheduler.exhausted
+    assert scheduler.report()['actual'] == 2
+    assert YoutubeContent.quota_ledger.used == 2
+
+
+def test_concurrent_runs_keep_their_own_budget(server):
+    collectors = {}
+
+    def run(name: str, channel_ids: list, budget: int) -> None:
+        collectors[name] = collect(channel_ids, budget)
+
+    threads = [
+        threading.Thread(target=run, args=('small', ['UCa', 'UCb'], 3)),
+        threading.Thread(target=run, args=('large', ['UCc', 'UCd', 'UCe'], 9)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert collectors['small'].quota_report['actual'] == 3
+    assert collectors['large'].quota_report['actual'] == 9
+    assert YoutubeContent.quota_ledger.used == 12
+
+
+def test_abandoned_run_leaves_ledger_unchanged(server):
+    fetcher = TranscriptFetcher(requests_per_second=10_000)
+    collector = VideoDataCollector(channel_ids=['UCa', 'UCb'], quota_budget=3, transcript_fetcher=fetcher)
+    records = collector.iter_data_from_channels(max_videos=50)
+    next(records)
+
+    # the budget of the suspended run applies to its own context only
+    thread = threading.Thread(target=YoutubeContent.quota_ledger.charge, args=('search',))
+    thread.start()
+    thread.join()
+    records.close()
+    fetcher.close()
+
+    assert YoutubeContent.quota_ledger.budget is None
+    assert YoutubeContent.quota_ledger.units['search'] == 100
+
+
+def test_concurrent_fetches_stop_once_quota_runs_out(server, monkeypatch, capsys):
+    from youtube import YoutubeTrending, QuotaLedger
+
+    monkeypatch.setattr(YoutubeContent, 'quota_ledger', QuotaLedger(budget=1))
+    snapshot = YoutubeTrending(['US', 'GB', 'DE'], max_workers=1).get_trending_snapshot(max_results=50)
+
+    assert snapshot.charts == {'US': 50, 'GB': 0, 'DE': 0}
+    assert capsys.readouterr().out.count("Quota budget reached!") == 1
+    assert YoutubeContent.quota_ledger.used == 1
+
+
+def test_worker_threads_charge_the_active_run(server):
+    from youtube import YouTubeSearch
+
+    scheduler = QuotaScheduler(budget=200, ledger=YoutubeContent.quota_ledger)
+    with scheduler.run():
+        YouTubeSearch(['a', 'b']).execute_search("video", max_results=50)
+
+    assert scheduler.report()['actual_by_endpoint']['search'] == 200
+    assert YoutubeContent.quota_ledger.units['search'] == 200
@@ -0,0 +1,24 @@
+import pytest
+
+from youtube import SearchIndex, VideoDataCollector, TranscriptFetcher
+
+pytest.importorskip('numpy')
+pytestmark = pytest.mark.usefixtures('stub_transcripts')
+
+
+def test_search_videos_load_published_at_from_the_api(server, tmp_path):
+    with TranscriptFetcher(requests_per_second=10_000) as fetcher:
+        records = VideoDataCollector(channel_ids=['UCa'], transcript_fetcher=fetcher).collect_data_from_channels(10)
+
+    index = SearchIndex(str(tmp_path))
+    index.write_many(records)
+    index.flush()
+
+    video = index.search_videos(records[0]['video_name'], max_results=1)[0]
+    calls = sum(server.calls.values())
+
+    assert video.video_id == records[0]['video_id']
+    assert video.channel_id == records[0]['channel_id']
+    assert video.published_at.startswith(records[0]['published_at'])
+    assert video.published_at.endswith('Z')
+    assert sum(server.calls.values()) == calls + 1
@@ -0,0 +1,47 @@
+import os
+
+import numpy as np
+
+from youtube import StatisticsStore
+
+
+def test_ids_are_saved_with_the_state(tmp_path):
+    store = StatisticsStore(str(tmp_path))
+    store.set_channels({'a': 'UCa', 'b': 'UCa'})
+    store.append([
+        {"date": "2024-01-01", "video_id": 'a', "views": 10},
+        {"date": "2024-01-01", "video_id": 'c', "views": 5},
+    ])
+
+    reopened = StatisticsStore(str(tmp_path))
+    assert reopened.video_ids == ['a', 'b', 'c']
+    assert reopened.channel_ids == ['UCa']
+    assert reopened.latest('c')['views'] == 5
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_ids_saved_ahead_of_the_state_are_padded(tmp_path):
+    store = StatisticsStore(str(tmp_path))
+    store.append([{"date": "2024-01-01", "video_id": 'a', "views": 10}])
+    # interrupted after the ids were written, before the arrays
+    with open(tmp_path / 'video_ids.txt', 'a') as file:
+        file.write('b\n')
+
+    reopened = StatisticsStore(str(tmp_path))
+    reopened.append([{"date": "2024-01-02", "video_id": 'b', "views": 3}])
+    assert reopened.latest('b')['views'] == 3
+    assert len(reopened._latest) == len(reopened._seen) == len(reopened.video_ids) == 2
+
+
+def test_channel_rollup_sums_exact_integers(tmp_path):
+    store = StatisticsStore(str(tmp_path))
+    store.set_channels({'a': 'UCa', 'b': 'UCa'})
+    big = 2 ** 53
+    store.append([{"date": "2024-01-01", "video_id": video_id, "views": 0} for video_id in 'ab'])
+    store.append([
+        {"date": "2024-01-02", "video_id": 'a', "views": big},
+        {"date": "2024-01-02", "video_id": 'b', "views": 1},
+    ])
+
+    assert store.channel_rollup('views') == {'UCa': big + 1}
+    assert store.growth('views').dtype == np.int64
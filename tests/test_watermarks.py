@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from youtube import Channel, WatermarkStore
+
+
+@pytest.fixture
+def watermarks(tmp_path):
+    return WatermarkStore(str(tmp_path / 'watermarks.json'))
+
+
+def test_new_videos_move_and_save_watermark(server, watermarks):
+    videos = Channel('UCa').get_new_videos(watermarks, max_results=500)
+
+    assert len(videos) == server.videos_per_playlist
+    assert watermarks.get('UCa').video_id == videos[0].video_id
+    with open(watermarks.path) as file:
+        assert json.load(file)['UCa'][0] == videos[0].video_id
+
+    assert Channel('UCa').get_new_videos(WatermarkStore(watermarks.path)) == []
+
+
+def test_watermark_is_kept_until_gap_is_collected(server, watermarks):
+    partial = Channel('UCa').get_new_videos(watermarks, max_results=50)
+
+    assert len(partial) == 50
+    assert watermarks.get('UCa') is None
+
+    complete = Channel('UCa').get_new_videos(watermarks, max_results=500)
+
+    assert len(complete) == server.videos_per_playlist
+    assert watermarks.get('UCa').video_id == complete[0].video_id
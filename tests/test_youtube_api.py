@@ -0,0 +1,22 @@
+from youtube import YouTubeAPI, YoutubeContent
+
+
+def test_requests_go_through_executor_and_ledger(server):
+    server.error_rate = 0.3
+    api = YouTubeAPI()
+
+    video = api.get_video_response('abc', 'snippet')
+    channel = api.get_channel_response('UCa', 'snippet')
+    playlist = api.get_playlist_response('UUa', 'contentDetails', max_results=10)
+    search = api.get_search_response('python', 'id, snippet', 'video', 'relevance', 5)
+
+    assert video['items'][0]['id'] == 'abc'
+    assert channel['items'][0]['id'] == 'UCa'
+    assert len(playlist['items']) == 10
+    assert len(search['items']) == 5
+
+    executor = YoutubeContent.request_executor
+    assert executor.retries == sum(server.errors.values())
+    # retried requests are charged again
+    calls = YoutubeContent.quota_ledger.calls
+    assert all(calls[endpoint] == 1 + server.errors[endpoint] for endpoint in ('videos', 'channels', 'playlistItems', 'search'))
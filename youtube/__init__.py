@@ -1,8 +1,87 @@
-from .content import YoutubeContent
-from .youtube_api import YouTubeAPI
-from .video import Video
-from .playlist import Playlist
-from .channel import Channel
-from .search import YouTubeSearch
-from .trending import YoutubeTrending
-from .video_data_collector import VideoDataCollector
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+# Public names and the modules defining them. Modules are imported upon first attribute access
+# (PEP 562), so `import youtube` stays cheap and heavy dependencies (googleapiclient,
+# youtube_transcript_api, dateutil, tqdm, aiohttp, pyarrow, numpy) load only when used.
+_EXPORTS = {
+    'client': ['ClientRegistry', 'registry'],
+    'cache': ['ResponseCache'],
+    'etags': ['EtagStore'],
+    'quota': ['QuotaLedger', 'QuotaScheduler', 'QuotaExceededError'],
+    'keys': ['ApiKey', 'ApiKeyPool'],
+    'executor': ['RequestExecutor', 'CircuitBreaker', 'CircuitOpenError'],
+    'metrics': ['Metrics', 'metrics', 'JsonExporter', 'PrometheusExporter', 'CallbackExporter'],
+    'watermarks': ['Watermark', 'WatermarkStore'],
+    'journal': ['RunJournal'],
+    'content': ['YoutubeContent'],
+    'youtube_api': ['YouTubeAPI'],
+    'video': ['Video'],
+    'compact': ['IdArray', 'VideoIds', 'ChannelIds'],
+    'playlist': ['Playlist'],
+    'channel': ['Channel'],
+    'search': ['YouTubeSearch'],
+    'trending': ['YoutubeTrending', 'TrendingSnapshot'],
+    'transcripts': ['TranscriptFetcher'],
+    'transcript_store': ['TranscriptStore'],
+    'video_data_collector': ['VideoDataCollector'],
+    'sinks': ['Sink', 'CsvSink', 'JsonlSink', 'CallbackSink'],
+    'parquet': ['ParquetSink', 'video_properties_schema', 'video_statistics_schema'],
+    'stats_store': ['StatisticsStore'],
+    'search_index': ['SearchIndex'],
+    'parsing': ['parse_durations', 'parse_timestamps', 'parse_dates', 'classify_video_types', 'parse_video_items'],
+    'async_collector': ['AsyncVideoDataCollector', 'AsyncYouTubeClient'],
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(f'.{_MODULES[name]}', __name__), name)
+    # cached on the package, later lookups do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+# `metrics` is both a module and an object exported from it. Once the submodule is imported,
+# the import system binds youtube.metrics to the module, bypassing __getattr__, so the object
+# is imported eagerly (the module is light) and the name is bound to it instead.
+from .metrics import metrics
+
+
+if TYPE_CHECKING:
+    from .client import ClientRegistry, registry
+    from .cache import ResponseCache
+    from .etags import EtagStore
+    from .quota import QuotaLedger, QuotaScheduler, QuotaExceededError
+    from .keys import ApiKey, ApiKeyPool
+    from .executor import RequestExecutor, CircuitBreaker, CircuitOpenError
+    from .metrics import Metrics, metrics, JsonExporter, PrometheusExporter, CallbackExporter
+    from .watermarks import Watermark, WatermarkStore
+    from .journal import RunJournal
+    from .content import YoutubeContent
+    from .youtube_api import YouTubeAPI
+    from .video import Video
+    from .compact import IdArray, VideoIds, ChannelIds
+    from .playlist import Playlist
+    from .channel import Channel
+    from .search import YouTubeSearch
+    from .trending import YoutubeTrending, TrendingSnapshot
+    from .transcripts import TranscriptFetcher
+    from .transcript_store import TranscriptStore
+    from .video_data_collector import VideoDataCollector
+    from .sinks import Sink, CsvSink, JsonlSink, CallbackSink
+    from .parquet import ParquetSink, video_properties_schema, video_statistics_schema
+    from .stats_store import StatisticsStore
+    from .search_index import SearchIndex
+    from .parsing import parse_durations, parse_timestamps, parse_dates, classify_video_types, parse_video_items
+    from .async_collector import AsyncVideoDataCollector, AsyncYouTubeClient
@@ -0,0 +1,359 @@
+import json
+import time
+import asyncio
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from .content import YoutubeContent, chunked, MAX_IDS_PER_REQUEST
+from .errors import is_quota_exceeded
+from .keys import ApiKeyPool, get_default_pool
+from .metrics import metrics
+from .transcript_store import TranscriptStore
+from .transcripts import TranscriptFetcher
+from .video import Video, PROPERTIES_PARTS, STATISTICS_PARTS
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+API_BASE_URL = 'https://youtube.googleapis.com/youtube/v3/'
+
+# maximum number of requests in flight per endpoint
+# (transcripts: worker threads of the default TranscriptFetcher)
+DEFAULT_CONCURRENCY = {
+    'channels': 4,
+    'playlistItems': 8,
+    'videos': 8,
+    'search': 2,
+    'transcripts': 4,
+}
+
+
+class AsyncYouTubeClient:
+    """
+    Non-blocking client for the YouTube Data API list endpoints, built on aiohttp.
+    Requests share the response cache, quota ledger, key pool and request executor configured on
+    YoutubeContent, and the number of concurrent requests is bounded per endpoint. The base_url can point
+    to a local stub server serving canned JSON responses.
+    """
+    def __init__(
+            self,
+            base_url: str = API_BASE_URL,
+            concurrency: Optional[dict] = None,
+            key_pool: Optional[ApiKeyPool] = None,
+            timeout: float = 30
+        ):
+        if aiohttp is None:
+            raise ImportError("AsyncYouTubeClient requires aiohttp, install it with: pip install aiohttp")
+
+        self.base_url = base_url.rstrip('/') + '/'
+        self.concurrency = DEFAULT_CONCURRENCY | (concurrency or {})
+        self.key_pool = key_pool
+        self.timeout = timeout
+
+        self._session = None
+        self._semaphores = {}
+
+    async def __aenter__(self) -> "AsyncYouTubeClient":
+        self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        self._semaphores = {endpoint: asyncio.Semaphore(limit) for endpoint, limit in self.concurrency.items()}
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._session.close()
+        self._session = None
+
+    def limit(self, endpoint: str) -> asyncio.Semaphore:
+        """
+        Returns the semaphore bounding concurrent requests to the endpoint.
+        """
+        if endpoint not in self._semaphores:
+            self._semaphores[endpoint] = asyncio.Semaphore(self.concurrency.get(endpoint, 4))
+        return self._semaphores[endpoint]
+
+    async def execute(self, endpoint: str, **params) -> dict:
+        """
+        Asynchronous counterpart of YoutubeContent._execute: serves the request from the response
+        cache if possible, charges the quota ledger and sends it with a key from the key pool
+        through the shared request executor (YoutubeContent.request_executor), which retries
+        transient errors, timeouts and rate limits with backoff and keeps a circuit breaker per
+        endpoint. Requests are retried on another key when the API reports quotaExceeded.
+        The response cache and etag store are SQLite backed, they are used from worker threads
+        so that they do not block the event loop.
+        """
+        cache = YoutubeContent.response_cache
+        if cache is not None:
+            response = await asyncio.to_thread(cache.get, endpoint, params)
+            if response is not None:
+                if metrics.enabled:
+                    metrics.count_cache_hit(endpoint)
+                return response
+
+        units = self._charge(endpoint)
+        pool = self.key_pool or YoutubeContent.key_pool or get_default_pool()
+        executor = YoutubeContent.request_executor
+        query = {name: value for name, value in params.items() if value is not None}
+
+        # conditional request, a 304 Not Modified answer is served from the etag store
+        etag_store = YoutubeContent.etag_store
+        stored = await asyncio.to_thread(etag_store.get, endpoint, params) if etag_store is not None else None
+        headers = {'If-None-Match': stored[0]} if stored is not None else {}
+
+        async with self.limit(endpoint):
+            while True:
+                key = pool.acquire(units)
+
+                # a retried request is sent with the same key, so it is charged there too
+                def on_retry(key=key) -> None:
+                    pool.charge(key, self._charge(endpoint))
+
+                try:
+                    response = await executor.execute_async(
+                        endpoint,
+                        lambda: self._send(endpoint, query | {'key': key.value}, headers, params.get('part')),
+                        on_retry=on_retry
+                    )
+                    break
+
+                except HttpError as error:
+                    if not is_quota_exceeded(error):
+                        raise
+                    pool.retire(key)
+
+        if response is None:
+            await asyncio.to_thread(etag_store.record, endpoint, not_modified=True)
+            if metrics.enabled:
+                metrics.count_not_modified(endpoint)
+            return stored[1]
+
+        if cache is not None:
+            await asyncio.to_thread(cache.set, endpoint, params, response)
+        if etag_store is not None:
+            await asyncio.to_thread(self._store_etag, etag_store, endpoint, params, response, stored is not None)
+        return response
+
+    @staticmethod
+    def _store_etag(etag_store, endpoint: str, params: dict, response: dict, conditional: bool) -> None:
+        if conditional:
+            etag_store.record(endpoint, not_modified=False)
+        etag_store.set(endpoint, params, response)
+
+    @staticmethod
+    def _charge(endpoint: str) -> int:
+        units = YoutubeContent.quota_ledger.charge(endpoint)
+        if metrics.enabled:
+            metrics.count_quota(endpoint, units)
+        return units
+
+    async def _send(self, endpoint: str, query: dict, headers: dict, parts: Optional[str]) -> Optional[dict]:
+        """
+        Sends a single request, returns its decoded response or None when the API answered
+        a conditional request with 304 Not Modified. Error statuses raise HttpError, like
+        googleapiclient, so that the executor classifies them the same way. Latency, bytes
+        received and parse time are recorded like those of synchronous requests.
+        """
+        start_time = time.perf_counter()
+        try:
+            async with self._session.get(self.base_url + endpoint, params=query, headers=headers) as http_response:
+                content = await http_response.read()
+                status, reason, url = http_response.status, http_response.reason, str(http_response.url)
+        finally:
+            if metrics.enabled:
+                metrics.observe_request(endpoint, parts, time.perf_counter() - start_time)
+
+        if status == 304 and headers:
+            return None
+        if status >= 300:
+            raise HttpError(httplib2.Response({'status': status, 'reason': reason}), content, uri=url)
+
+        if not metrics.enabled:
+            return json.loads(content)
+
+        start_time = time.perf_counter()
+        response = json.loads(content)
+        metrics.observe_response(endpoint, len(content), time.perf_counter() - start_time)
+        return response
+
+
+class AsyncVideoDataCollector:
+    """
+    Asynchronous counterpart of VideoDataCollector. Channels and videos are processed concurrently
+    (bounded per endpoint) over a non-blocking HTTP transport, producing the same records as
+    the synchronous collector.
+    """
+    def __init__(self, channel_ids: Optional[list[str]] = None,
+                 video_ids: Optional[list[str]] = None,
+                 base_url: str = API_BASE_URL,
+                 concurrency: Optional[dict] = None,
+                 key_pool: Optional[ApiKeyPool] = None,
+                 transcript_fetcher: Optional[TranscriptFetcher] = None,
+                 transcript_store: Optional[TranscriptStore] = None):
+
+        self.channel_ids = channel_ids or []
+        self.video_ids = video_ids or []
+
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.key_pool = key_pool
+        # thread pool fetching transcripts (with retries, rate limiting and the transcript store)
+        self.transcript_fetcher = transcript_fetcher
+        # transcripts known from previous runs are read from the store instead of being scraped
+        # (used by the default fetcher, a configured transcript_fetcher takes its own store)
+        self.transcript_store = transcript_store
+
+    def _client(self) -> AsyncYouTubeClient:
+        return AsyncYouTubeClient(self.base_url, self.concurrency, self.key_pool)
+
+    @contextmanager
+    def _transcripts(self) -> Iterator[TranscriptFetcher]:
+        """
+        Yields the configured transcript fetcher, or a default one closed after the run.
+        """
+        if self.transcript_fetcher is not None:
+            yield self.transcript_fetcher
+            return
+
+        max_workers = (DEFAULT_CONCURRENCY | (self.concurrency or {}))['transcripts']
+        with TranscriptFetcher(max_workers=max_workers, store=self.transcript_store) as fetcher:
+            yield fetcher
+
+    async def collect_data_from_channels(self, max_videos: int = 50) -> list[dict]:
+        """
+        Collects video properties and transcripts of the latest max_videos uploads of each channel.
+        """
+        if not len(self.channel_ids):
+            raise ValueError("Methods requires channel_ids to collect data.")
+
+        with self._transcripts() as fetcher:
+            async with self._client() as client:
+                uploads = await self._get_uploads_playlists(client, self.channel_ids)
+
+                # a channel failing after all retries is skipped, the other channels go on
+                channel_ids = [channel_id for channel_id in self.channel_ids if channel_id in uploads]
+                channel_records = await asyncio.gather(*(
+                    self._collect_channel(client, fetcher, uploads[channel_id], max_videos) for channel_id in channel_ids
+                ), return_exceptions=True)
+
+        channel_records = self._skip_failed(channel_records, [f"channel '{channel_id}'" for channel_id in channel_ids])
+        return [record for records in channel_records for record in records]
+
+    async def collect_data_from_videos(self) -> list[dict]:
+        """
+        Collects statistics of the provided video ids.
+        """
+        if not len(self.video_ids):
+            raise ValueError("Methods requires video_ids to collect data.")
+
+        async with self._client() as client:
+            videos = await self._hydrate(client, self.video_ids, STATISTICS_PARTS)
+
+        return [video.get_video_statistics() for video in videos]
+
+    async def _get_uploads_playlists(self, client: AsyncYouTubeClient, channel_ids: list[str]) -> dict:
+        """
+        Maps channel ids to their uploads playlist ids, 50 channels per channels.list request.
+        """
+        chunks = list(chunked(list(dict.fromkeys(channel_ids))))
+        responses = await asyncio.gather(*(
+            client.execute('channels', part='contentDetails', id=','.join(chunk)) for chunk in chunks
+        ), return_exceptions=True)
+        responses = self._skip_failed(responses, [f"channels lookup of {', '.join(chunk)}" for chunk in chunks])
+
+        return {
+            item['id']: item['contentDetails']['relatedPlaylists']['uploads']
+            for response in responses for item in response.get('items', [])
+        }
+
+    async def _collect_channel(
+            self,
+            client: AsyncYouTubeClient,
+            fetcher: TranscriptFetcher,
+            playlist_id: str,
+            max_videos: int
+        ) -> list[dict]:
+        video_ids = await self._get_playlist_video_ids(client, playlist_id, max_videos)
+        videos = await self._hydrate(client, video_ids, PROPERTIES_PARTS)
+        transcripts = await asyncio.gather(*(self._get_transcript(fetcher, video) for video in videos))
+
+        # videos whose transcript could not be extracted are skipped, as in VideoDataCollector
+        return [
+            video.get_video_properties() | transcript
+            for video, transcript in zip(videos, transcripts) if transcript is not None
+        ]
+
+    async def _get_playlist_video_ids(self, client: AsyncYouTubeClient, playlist_id: str, max_videos: int) -> list[str]:
+        video_ids = []
+        page_token = None
+
+        while len(video_ids) < max_videos:
+            response = await client.execute(
+                'playlistItems',
+                part='contentDetails',
+                playlistId=playlist_id,
+                maxResults=min(max_videos - len(video_ids), MAX_IDS_PER_REQUEST),
+                pageToken=page_token
+            )
+            video_ids.extend(item['contentDetails']['videoId'] for item in response.get('items', []))
+
+            page_token = response.get('nextPageToken')
+            if page_token is None:
+                break
+
+        return video_ids[:max_videos]
+
+    async def _hydrate(self, client: AsyncYouTubeClient, video_ids: list[str], parts: str) -> list[Video]:
+        """
+        Asynchronous counterpart of Video.hydrate_many, 50 ids per videos.list request.
+        """
+        videos = [Video(video_id) for video_id in video_ids]
+        requested = Video._split_parts(parts)
+
+        by_id = {}
+        for video in videos:
+            by_id.setdefault(video.video_id, []).append(video)
+
+        chunks = list(chunked(list(by_id)))
+        responses = await asyncio.gather(*(
+            client.execute('videos', part=', '.join(requested), id=','.join(chunk)) for chunk in chunks
+        ), return_exceptions=True)
+        responses = self._skip_failed(responses, [f"videos lookup of {len(chunk)} ids" for chunk in chunks])
+
+        for response in responses:
+            for item in response.get('items', []):
+                for video in by_id.get(item['id'], []):
+                    video._store_item(item, requested)
+
+        return [video for video in videos if video._has_parts(requested)]
+
+    @staticmethod
+    def _skip_failed(results: list, names: list[str]) -> list:
+        """
+        Drops the failed results of gathered requests (retries exhausted, quota reached, open
+        circuit) with a warning, as the synchronous paths do, so one failure does not abort the run.
+        """
+        succeeded = []
+        for name, result in zip(names, results):
+            if not isinstance(result, BaseException):
+                succeeded.append(result)
+            elif isinstance(result, Exception):
+                print(f"Warning: {name} failed: {result}")
+            else:
+                # cancellation and interrupts are not failures of a single request
+                raise result
+        return succeeded
+
+    @staticmethod
+    async def _get_transcript(fetcher: TranscriptFetcher, video: Video) -> Optional[dict]:
+        """
+        Awaits the transcript of the video from the fetcher's thread pool, which serves the
+        transcript store (including negative results), rate limits and retries scraping.
+        Returns None if it could not be extracted after retries, like TranscriptFetcher.result.
+        """
+        try:
+            return await asyncio.wrap_future(fetcher.submit(video))
+        except ValueError:
+            return None
@@ -0,0 +1,203 @@
+import json
+import time
+import sqlite3
+import threading
+from typing import Optional
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# default time-to-live (in seconds) of a cached response part, None disables caching
+DEFAULT_PART_TTLS = {
+    'id': 30 * DAY,
+    'snippet': 7 * DAY,
+    'contentDetails': 7 * DAY,
+    'status': DAY,
+    'topicDetails': 7 * DAY,
+    'brandingSettings': 7 * DAY,
+    'statistics': HOUR,
+}
+
+# endpoint level overrides: search results are not cached unless asked and playlist
+# pages are short-lived, since new uploads shift every page of the uploads playlist
+DEFAULT_ENDPOINT_TTLS = {
+    'search': None,
+    'playlistItems': HOUR,
+}
+
+
+class ResponseCache:
+    """
+    Persistent SQLite cache of YouTube API responses. Entries are keyed by endpoint and request
+    parameters (ids, part set, page token, ...) and expire after the shortest TTL of the requested
+    parts. The cache is bounded by max_entries / max_bytes, evicting least recently used entries.
+    """
+    def __init__(
+            self,
+            path: str = 'youtube-cache.sqlite',
+            part_ttls: Optional[dict] = None,
+            endpoint_ttls: Optional[dict] = None,
+            default_ttl: Optional[float] = HOUR,
+            max_entries: Optional[int] = 100_000,
+            max_bytes: Optional[int] = 1024 ** 3
+        ):
+        self.path = path
+        self.part_ttls = DEFAULT_PART_TTLS | (part_ttls or {})
+        self.endpoint_ttls = DEFAULT_ENDPOINT_TTLS | (endpoint_ttls or {})
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, endpoint TEXT, body TEXT, size INTEGER, "
+            "expires_at REAL, accessed_at REAL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+        # running totals, so that size limits are checked without scanning the table
+        self._count, self._size = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(path={self.path})"
+
+    def __len__(self) -> int:
+        return self._count
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict) -> str:
+        """
+        Builds a stable cache key from the endpoint and request parameters,
+        independent of parameter order, part order and whitespace in the part list.
+        """
+        normalized = {name: value for name, value in params.items() if value is not None}
+        if 'part' in normalized:
+            normalized['part'] = ','.join(sorted(part.strip() for part in normalized['part'].split(',')))
+        return json.dumps([endpoint, normalized], sort_keys=True)
+
+    def ttl(self, endpoint: str, params: dict) -> Optional[float]:
+        """
+        Returns the time-to-live of a response, which is the shortest TTL of its parts.
+        None means the response should not be cached.
+        """
+        if endpoint in self.endpoint_ttls:
+            return self.endpoint_ttls[endpoint]
+
+        ttls = []
+        for part in params.get('part', '').split(','):
+            ttl = self.part_ttls.get(part.strip(), self.default_ttl)
+            if ttl is None:
+                return None
+            ttls.append(ttl)
+        return min(ttls, default=self.default_ttl)
+
+    def get(self, endpoint: str, params: dict) -> Optional[dict]:
+        """
+        Returns the cached response or None if it is missing or expired.
+        """
+        if not self.ttl(endpoint, params):
+            return None
+
+        key = self.make_key(endpoint, params)
+        now = time.time()
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or row[1] < now:
+                self.misses += 1
+                return None
+
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def set(self, endpoint: str, params: dict, response: dict) -> None:
+        """
+        Stores the response if its parts are cacheable and evicts entries above the size limits.
+        """
+        ttl = self.ttl(endpoint, params)
+        if not ttl:
+            return
+
+        key = self.make_key(endpoint, params)
+        body = json.dumps(response)
+        now = time.time()
+
+        with self._lock:
+            previous = self._connection.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if previous is not None:
+                self._count -= 1
+                self._size -= previous[0]
+
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, body, len(body), now + ttl, now)
+            )
+            self._count += 1
+            self._size += len(body)
+
+            if self._over_limit():
+                self._evict()
+
+    def _over_limit(self) -> bool:
+        return ((self.max_entries is not None and self._count > self.max_entries)
+                or (self.max_bytes is not None and self._size > self.max_bytes))
+
+    def _evict(self) -> None:
+        # expired entries go first, then the least recently used ones
+        expired = self._connection.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),)).rowcount
+        if expired:
+            self.evictions += expired
+            self._count, self._size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+        stale_keys = []
+        rows = self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at")
+        for key, size in rows:
+            if not self._over_limit():
+                break
+            stale_keys.append((key,))
+            self._count -= 1
+            self._size -= size
+
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+        self.evictions += len(stale_keys)
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the counters.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._count = self._size = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Returns hit / miss / eviction counters and the hit rate.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
+
+    def close(self) -> None:
+        self._connection.close()
@@ -1,6 +1,11 @@
+import html
+from typing import Iterable, Iterator, List, Optional, Tuple
 from .content import YoutubeContent
 from .video import Video
 from .playlist import Playlist
+from .watermarks import Watermark, WatermarkStore
+
+INFO_PARTS = 'snippet, contentDetails, statistics'
 
 
 class Channel(YoutubeContent):
@@ -12,10 +17,25 @@ class Channel(YoutubeContent):
     def __init__(self, channel_id: str) -> None:
         super().__init__()
         self.channel_id = channel_id
+
+        self._channel_name = None
     
     def __repr__(self) -> str:
         return f"Channel(channel_id={self.channel_id})"
 
+    @classmethod
+    def from_search_result(cls, item: dict) -> "Channel":
+        """
+        Creates a channel from a search.list result item, keeping the channel name it carries,
+        so that it is not requested again.
+        """
+        channel = cls(item['id']['channelId'])
+        snippet = item.get('snippet', {})
+        if 'title' in snippet:
+            # search snippets are HTML-escaped, unlike channels.list snippets
+            channel._channel_name = html.unescape(snippet['title'])
+        return channel
+
     def __eq__(self, other):
         if isinstance(other, Channel):
             return self.channel_id == other.channel_id
@@ -29,11 +49,8 @@ class Channel(YoutubeContent):
         """
         The name of the channel, lazily loaded upon first access.
         """
-        if not hasattr(self, '_channel_name'):
-            response = self.get_response(self.channel_id, 'snippet')
-            self._channel_name = response['items'][0]['snippet']['title']
-            return self._channel_name
-        
+        if self._channel_name is None:
+            self._channel_name = self._get_item(self.channel_id, 'snippet')['snippet']['title']
         return self._channel_name
 
     @property
@@ -42,62 +59,127 @@ class Channel(YoutubeContent):
         The ID of the playlist containing all the uploads of the channel, 
         lazily loaded upon first access.
         """
-        if not hasattr(self, '_uploads_playlist_id'):
-            self._uploads_playlist_id = self.get_playlist_id(type="uploads")
-            return self._uploads_playlist_id
-        
-        return self._uploads_playlist_id
+        return self.get_playlist_id(type="uploads")
     
     @property
     def subscriber_count(self) -> int:
         """
         The number of subscribers to the channel, lazily loaded upon first access.
         """
-        if not hasattr(self, '_subscriber_count'):
-            response = self.get_response(self.channel_id, 'statistics')
-            self._subscriber_count = int(response['items'][0]['statistics']['subscriberCount'])
-            return self._subscriber_count
-        
-        return self._subscriber_count
+        return int(self._get_item(self.channel_id, 'statistics')['statistics']['subscriberCount'])
     
+    @classmethod
+    def hydrate_many(cls, channels: Iterable["Channel"], parts: str = INFO_PARTS) -> List["Channel"]:
+        """
+        Fetches snippet, contentDetails and statistics for many channels at once, sending one
+        channels.list request per 50 ids instead of one per channel and property. Afterwards
+        channel_name, uploads_playlist_id, subscriber_count and info() are served from the cache.
+        Returns the channels found by the API.
+        """
+        return cls._hydrate_many(channels, parts, lambda channel: channel.channel_id)
+
     def get_response(self, channel_id: str, part: str):
-        return self.youtube.channels().list(
+        return self._execute(
+            'channels',
             part=part,
             id=channel_id
-        ).execute()
+        )
     
     def info(self) -> tuple:
         """
         Returns in a tuple: channel ID, channel name, channel uploads playlist ID and subscriber count.
         """
+        # all parts are fetched together in a single channels.list request
+        self._get_item(self.channel_id, INFO_PARTS)
         return (self.channel_id, self.channel_name, self.uploads_playlist_id, self.subscriber_count)
     
-    def get_channel_videos(self, max_results=5) -> list[Video]:
+    def get_channel_videos(self, max_results=5, watermark: Optional[Watermark] = None) -> list[Video]:
         """
         Fetches a specified number of videos uploaded to the channel. 
         Returns a list of Video objects representing the uploaded videos.
+        With a watermark, only videos uploaded after the watermark video are returned.
         """
         videos = []
-        next_page_token = None
-        playlist = Playlist(self.uploads_playlist_id)
+        for page, _ in self.iter_video_pages(max_results, watermark):
+            videos.extend(page)
+
+        return videos
+
+    def get_new_videos(self, watermarks: WatermarkStore, max_results=500) -> list[Video]:
+        """
+        Incremental version of get_channel_videos: returns only videos uploaded since the previous call
+        (as recorded in the watermark store), then moves the channel's watermark to the newest upload
+        and saves the store. On a channel without new uploads this costs a single playlistItems.list call.
+        The watermark only moves once all new uploads were returned: with more than max_results new
+        uploads, the newest max_results are returned and the watermark is kept, so that no upload
+        is skipped (call again with a larger max_results).
+        """
+        watermark = watermarks.get(self.channel_id)
+        # one video more than requested tells whether the whole gap fits in max_results
+        videos = self.get_channel_videos(max_results + 1, watermark)
+
+        if len(videos) > max_results:
+            print(f"Warning: channel {self.channel_id} has more than {max_results} new uploads, "
+                  f"its watermark is kept until all of them are collected.")
+            return videos[:max_results]
+
+        if videos:
+            self.update_watermark(watermarks, videos[0])
+            watermarks.save()
+        
+        return videos
+
+    def update_watermark(self, watermarks: WatermarkStore, newest: Video) -> None:
+        """
+        Moves the channel's watermark to the given video, the newest upload seen by a crawl.
+        """
+        watermark = Watermark(newest.video_id, newest.published_at, self._uploads_id(watermarks.get(self.channel_id)))
+        watermarks.set(self.channel_id, watermark)
+
+    def iter_video_pages(
+            self, 
+            max_results=5, 
+            watermark: Optional[Watermark] = None, 
+            page_token: Optional[str] = None
+        ) -> Iterator[Tuple[list[Video], Optional[str]]]:
+        """
+        Yields videos uploaded to the channel page by page (up to 50 per page) together with 
+        the token of the next page, so that callers can process a page while the next one is 
+        being requested and resume later from a given page_token.
+        With a watermark, pagination stops as soon as already known videos are reached.
+        """
+        yielded = 0
+        next_page_token = page_token
+        playlist = Playlist(self._uploads_id(watermark))
 
         while True:
-            max_results_chunk = min(max_results - len(videos), 50)  
+            max_results_chunk = min(max_results - yielded, 50)  
             if max_results_chunk <= 0:
                 break  
             
-            videos_to_add, next_page_token = playlist.get_playlist_videos(max_results=max_results_chunk, page_token=next_page_token)
-            videos.extend(videos_to_add)
+            videos_to_add, next_page_token = playlist.get_playlist_videos(
+                max_results=max_results_chunk, page_token=next_page_token, watermark=watermark
+            )
+            yielded += len(videos_to_add)
+            if videos_to_add:
+                yield videos_to_add, next_page_token
 
-        return videos
+            if next_page_token is None:
+                break
+
+    def _uploads_id(self, watermark: Optional[Watermark]) -> str:
+        # watermarks remember the uploads playlist, which saves a channels.list call
+        if watermark is not None and watermark.uploads_playlist_id:
+            return watermark.uploads_playlist_id
+        return self.uploads_playlist_id
 
     def get_playlist_id(self, type: str = "uploads") -> str:
         """
         Retrieves the ID of a specific type of playlist associated with the channel, 
         e.g., "uploads" for the channel's uploaded videos.
         """
-        channel_response = self.get_response(self.channel_id, 'contentDetails')
-        playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists'][type]
+        content_details = self._get_item(self.channel_id, 'contentDetails')['contentDetails']
+        playlist_id = content_details['relatedPlaylists'][type]
         return playlist_id
     
     
\ No newline at end of file
@@ -0,0 +1,67 @@
+import os
+import json
+import threading
+from typing import Optional
+
+
+class ClientRegistry:
+    """
+    Process-wide registry of YouTube API service objects. The discovery document bundled
+    with googleapiclient is parsed once (no network fetch) and a service is built once per
+    API key and thread, since the underlying httplib2 transport is not thread-safe.
+    Setting api_endpoint (or YOUTUBE_API_ENDPOINT) sends requests to another server,
+    e.g. a local fake API (see tests/fake_api.py).
+    """
+    def __init__(self, service_name: str = 'youtube', version: str = 'v3', api_endpoint: Optional[str] = None):
+        self.service_name = service_name
+        self.version = version
+        self.api_endpoint = api_endpoint
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._document = None
+
+    @property
+    def document(self) -> dict:
+        """
+        Parsed static discovery document, loaded once upon first access.
+        """
+        if self._document is None:
+            with self._lock:
+                if self._document is None:
+                    # googleapiclient is imported upon first use, it is the slowest part of importing the package
+                    from googleapiclient.discovery_cache import get_static_doc
+                    content = get_static_doc(self.service_name, self.version)
+                    if content is None:
+                        raise ValueError(f"No static discovery document for {self.service_name} {self.version}.")
+                    self._document = json.loads(content)
+        return self._document
+
+    def get_client(self, api_key: Optional[str] = None):
+        """
+        Returns the service object for the given API key (defaults to YOUTUBE_API_KEY),
+        building it on first use in the calling thread.
+        """
+        api_key = api_key or os.environ.get('YOUTUBE_API_KEY')
+        if not api_key:
+            raise ValueError("YOUTUBE_API_KEY environment variable is not set.")
+
+        api_endpoint = self.api_endpoint or os.environ.get('YOUTUBE_API_ENDPOINT')
+        client_options = {'api_endpoint': api_endpoint} if api_endpoint else None
+
+        clients = self._local.__dict__.setdefault('clients', {})
+        if (api_key, api_endpoint) not in clients:
+            from googleapiclient.discovery import build_from_document
+            clients[api_key, api_endpoint] = build_from_document(
+                self.document, developerKey=api_key, client_options=client_options
+            )
+        return clients[api_key, api_endpoint]
+
+    def clear(self) -> None:
+        """
+        Drops clients cached for the calling thread, e.g. after the API key has changed.
+        """
+        self._local.__dict__.pop('clients', None)
+
+
+registry = ClientRegistry()
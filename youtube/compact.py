@@ -0,0 +1,239 @@
+from abc import ABC, abstractmethod
+from array import array
+from itertools import accumulate, islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+from .video import Video, PROPERTIES_PARTS
+
+SEPARATOR = b'\n'
+EXTEND_CHUNK_SIZE = 10_000
+
+
+class IdArray(Sequence):
+    """
+    Append-only array of ASCII ids (video, channel or playlist ids, timestamps) kept in a single
+    separator-delimited buffer with an array of offsets, so an id costs its length plus 9 bytes
+    instead of a Python str object (~60 bytes). Membership checks run as a substring search
+    over the buffer.
+    """
+    __slots__ = ('_buffer', '_offsets')
+
+    def __init__(self, ids: Iterable[str] = ()):
+        self._buffer = bytearray(SEPARATOR)
+        self._offsets = array('Q', [1])
+        self.extend(ids)
+
+    def __repr__(self) -> str:
+        return f"IdArray(size={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return IdArray(self[position] for position in range(*index.indices(len(self))))
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("IdArray index out of range")
+
+        # offsets point past the separator, the next offset past the following one
+        return self._buffer[self._offsets[index]:self._offsets[index + 1] - 1].decode('ascii')
+
+    def __iter__(self) -> Iterator[str]:
+        if not len(self):
+            return
+        # splitting the buffer is much faster than indexing id by id
+        for content_id in bytes(self._buffer[1:-1]).split(SEPARATOR):
+            yield content_id.decode('ascii')
+
+    def __contains__(self, content_id) -> bool:
+        if not isinstance(content_id, str):
+            return False
+        return SEPARATOR + content_id.encode('ascii') + SEPARATOR in self._buffer
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IdArray):
+            return self._buffer == other._buffer
+        return NotImplemented
+
+    __hash__ = None
+
+    def append(self, content_id: str) -> None:
+        encoded = content_id.encode('ascii')
+        if SEPARATOR in encoded:
+            raise ValueError(f"Ids can not contain a line break: {content_id!r}")
+
+        self._buffer += encoded + SEPARATOR
+        self._offsets.append(len(self._buffer))
+
+    def extend(self, ids: Iterable[str]) -> None:
+        ids = iter(ids)
+        # encoded in chunks, so that extending from a generator never holds all ids as objects
+        while True:
+            encoded = [content_id.encode('ascii') for content_id in islice(ids, EXTEND_CHUNK_SIZE)]
+            if not encoded:
+                return
+
+            joined = SEPARATOR.join(encoded)
+            if joined.count(SEPARATOR) != len(encoded) - 1:
+                raise ValueError("Ids can not contain a line break.")
+
+            end = len(self._buffer)
+            self._buffer += joined + SEPARATOR
+            self._offsets.extend(islice(accumulate((len(content_id) + 1 for content_id in encoded), initial=end), 1, None))
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory held by the buffer and the offsets.
+        """
+        return len(self._buffer) + self._offsets.itemsize * len(self._offsets)
+
+
+class ContentIds(Sequence, ABC):
+    """
+    Abstract memory-compact collection of YouTube content ids. Ids are stored in an IdArray and a full
+    content object (Video, Channel) is created only when an element is accessed, so million-id
+    workloads fit in tens of megabytes. Elements compare and hash like the content objects
+    themselves, and `in` accepts both objects and raw ids.
+    """
+    __slots__ = ('ids',)
+
+    def __init__(self, ids: Iterable[str] = ()):
+        self.ids = ids if isinstance(ids, IdArray) else IdArray(ids)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            selected = range(*index.indices(len(self)))
+            return self._select(selected)
+        return self._create(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._create(index)
+
+    def __contains__(self, item) -> bool:
+        return self._content_id(item) in self.ids
+
+    def __eq__(self, other) -> bool:
+        if type(other) is type(self):
+            return self.ids == other.ids
+        return NotImplemented
+
+    __hash__ = None
+
+    @abstractmethod
+    def _create(self, index: int):
+        """
+        Abstract method to be overridden by subclasses.
+        Creates the content object of the element at index.
+        """
+        pass
+
+    @abstractmethod
+    def _content_id(self, item) -> Optional[str]:
+        """
+        Abstract method to be overridden by subclasses.
+        Returns the id of a content object or a raw id, None for other values.
+        """
+        pass
+
+    def _select(self, indices: Iterable[int]):
+        return type(self)(self.ids[index] for index in indices)
+
+    def append(self, item) -> None:
+        content_id = self._content_id(item)
+        if content_id is None:
+            raise TypeError(f"{type(self).__name__} can not hold {item!r}")
+        self.ids.append(content_id)
+
+    def extend(self, items: Iterable) -> None:
+        for item in items:
+            self.append(item)
+
+    def unique(self):
+        """
+        Returns a collection without duplicate ids, keeping the first occurrence of each.
+        """
+        seen = set()
+        return self._select(
+            index for index, content_id in enumerate(self.ids)
+            if not (content_id in seen or seen.add(content_id))
+        )
+
+    def to_list(self) -> list:
+        """
+        Materializes all elements as full content objects.
+        """
+        return list(self)
+
+
+class VideoIds(ContentIds):
+    """
+    Compact collection of videos, optionally with the publication timestamps returned by playlistItems,
+    which are passed on to the Video objects it creates.
+    """
+    __slots__ = ('published_at',)
+
+    def __init__(self, ids: Iterable[str] = (), published_at: Optional[Iterable[Optional[str]]] = None):
+        super().__init__(ids)
+        self.published_at = None
+        if published_at is not None:
+            self.published_at = IdArray(timestamp or '' for timestamp in published_at)
+
+    def _create(self, index: int) -> Video:
+        published_at = self.published_at[index] if self.published_at is not None else None
+        return Video(self.ids[index], published_at=published_at or None)
+
+    def _content_id(self, item) -> Optional[str]:
+        if isinstance(item, Video):
+            return item.video_id
+        return item if isinstance(item, str) else None
+
+    def _select(self, indices: Iterable[int]) -> "VideoIds":
+        indices = list(indices)
+        published_at = None
+        if self.published_at is not None:
+            published_at = [self.published_at[index] for index in indices]
+        return VideoIds((self.ids[index] for index in indices), published_at)
+
+    def append(self, item, published_at: Optional[str] = None) -> None:
+        super().append(item)
+        if self.published_at is not None:
+            if published_at is None and isinstance(item, Video):
+                published_at = item._published_at
+            self.published_at.append(published_at or '')
+
+    def hydrate(self, parts: str = PROPERTIES_PARTS) -> List[Video]:
+        """
+        Materializes the videos and fetches their parts in batches of 50 ids (see Video.hydrate_many).
+        """
+        return Video.hydrate_many(self, parts)
+
+
+class ChannelIds(ContentIds):
+    """
+    Compact collection of channels.
+    """
+    __slots__ = ()
+
+    @staticmethod
+    def _channel_class():
+        # imported lazily, channel imports playlist which imports this module
+        from .channel import Channel
+        return Channel
+
+    def _create(self, index: int):
+        return self._channel_class()(self.ids[index])
+
+    def _content_id(self, item) -> Optional[str]:
+        if isinstance(item, self._channel_class()):
+            return item.channel_id
+        return item if isinstance(item, str) else None
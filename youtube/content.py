@@ -1,20 +1,78 @@
-import os
+import time
+import threading
 from abc import ABC, abstractmethod
-from googleapiclient.discovery import build
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
+from .client import registry
+from .cache import ResponseCache
+from .etags import EtagStore
+from .errors import is_quota_exceeded
+from .executor import CircuitOpenError, RequestExecutor, default_executor
+from .keys import ApiKeyPool, get_default_pool
+from .metrics import metrics
+from .quota import QuotaExceededError, QuotaLedger, default_ledger
+
+# maximum number of comma-separated ids accepted by a single *.list request
+MAX_IDS_PER_REQUEST = 50
+
+
+def chunked(items: Sequence, size: int = MAX_IDS_PER_REQUEST) -> Iterator[Sequence]:
+    """
+    Splits a sequence into consecutive chunks of at most `size` elements.
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
 
 
 class YoutubeContent(ABC):
 
-    def __init__(self):        
-        self.youtube = self.build_youtube_object()
+    # optional persistent response cache shared by all content objects,
+    # e.g. YoutubeContent.response_cache = ResponseCache('youtube-cache.sqlite')
+    response_cache: Optional[ResponseCache] = None
+
+    # optional store of etags sending conditional requests (If-None-Match), a 304 Not Modified
+    # answer is served from the stored body, e.g. YoutubeContent.etag_store = EtagStore()
+    etag_store: Optional[EtagStore] = None
+
+    # ledger charged with the quota cost of every request sent to the API
+    quota_ledger: QuotaLedger = default_ledger
+
+    # pool of API keys requests are spread across, defaults to YOUTUBE_API_KEYS / YOUTUBE_API_KEY
+    key_pool: Optional[ApiKeyPool] = None
+
+    # quota units spent by requests of this object
+    quota_credits_used: int = 0
+    # guards quota_credits_used against concurrent requests of one object (e.g. search threads),
+    # shared by all objects so that creating content objects stays cheap
+    _credits_lock = threading.Lock()
+
+    # executor retrying transient errors and rate limits of every request sent to the API
+    request_executor: RequestExecutor = default_executor
+
+    def __init__(self):
+        self._youtube = None
+
+        # raw response item split by part, e.g. {'snippet': {...}, 'statistics': {...}}
+        self._parts = {}
+        # results parsed from the cached parts, reset whenever new parts are stored
+        self._parsed = {}
+
+    @property
+    def youtube(self):
+        """
+        YouTube API service object, borrowed lazily from the shared client registry.
+        """
+        if self._youtube is None:
+            return self.build_youtube_object()
+        return self._youtube
+
+    @youtube.setter
+    def youtube(self, client):
+        self._youtube = client
 
     def build_youtube_object(self):
-        """Builds and returns the YouTube API service object."""
-        api_key = os.environ.get('YOUTUBE_API_KEY')
-        if not api_key:
-            raise ValueError("YOUTUBE_API_KEY environment variable is not set.")
-        
-        return build('youtube', 'v3', developerKey=api_key)
+        """Returns the shared YouTube API service object for the current thread."""
+        pool = self.key_pool or get_default_pool()
+        return registry.get_client(pool.peek().value)
 
     @abstractmethod
     def get_response(self, **kwargs):
@@ -24,5 +82,192 @@ class YoutubeContent(ABC):
         """
         pass
 
+    def _execute(self, endpoint: str, **params) -> dict:
+        """
+        Executes a list request on the given endpoint (videos, channels, playlistItems, search),
+        serving it from the response cache when one is configured. Requests sent to the API
+        are charged on the quota ledger first, which raises QuotaExceededError over budget.
+        """
+        cache = self.response_cache
+        if cache is not None:
+            response = cache.get(endpoint, params)
+            if response is not None:
+                if metrics.enabled:
+                    metrics.count_cache_hit(endpoint)
+                return response
+
+        units = self._charge(endpoint)
+        response = self._send(endpoint, params, units)
+
+        if cache is not None:
+            cache.set(endpoint, params, response)
+        return response
+
+    def _charge(self, endpoint: str) -> int:
+        units = self.quota_ledger.charge(endpoint)
+        with self._credits_lock:
+            self.quota_credits_used += units
+        if metrics.enabled:
+            metrics.count_quota(endpoint, units)
+        return units
+
+    def _send(self, endpoint: str, params: dict, units: int) -> dict:
+        """
+        Sends the request through the request executor, which retries transient errors and rate
+        limits (charging the quota of every repeated request). Keys come from the key pool: when
+        the API reports quotaExceeded, the key is retired and the request is retried transparently
+        on another key. A client set explicitly on the object is used as is.
+        """
+        def send(client, on_retry: Callable[[], None]) -> dict:
+            return self.request_executor.execute(
+                endpoint,
+                lambda: self._request(client, endpoint, params),
+                on_retry=on_retry
+            )
+
+        if self._youtube is not None:
+            return send(self._youtube, lambda: self._charge(endpoint))
+
+        from googleapiclient.errors import HttpError
+
+        pool = self.key_pool or get_default_pool()
+        while True:
+            key = pool.acquire(units)
+
+            # a retried request is sent with the same key, so it is charged there too
+            def on_retry(key=key) -> None:
+                pool.charge(key, self._charge(endpoint))
+
+            try:
+                return send(registry.get_client(key.value), on_retry)
+
+            except HttpError as error:
+                if not is_quota_exceeded(error):
+                    raise
+                pool.retire(key)
+
+    def _request(self, client, endpoint: str, params: dict) -> dict:
+        """
+        Sends a single list request. With an etag store, the etag of the last response to the same
+        request is sent as If-None-Match and a 304 Not Modified answer returns the stored body.
+        """
+        request = getattr(client, endpoint)().list(**params)
+
+        etag_store = self.etag_store
+        stored = etag_store.get(endpoint, params) if etag_store is not None else None
+        if stored is None:
+            response = self._execute_request(request, endpoint, params)
+        else:
+            from googleapiclient.errors import HttpError
+
+            request.headers['If-None-Match'] = stored[0]
+            try:
+                response = self._execute_request(request, endpoint, params)
+
+            except HttpError as error:
+                if error.resp.status != 304:
+                    raise
+                etag_store.record(endpoint, not_modified=True)
+                if metrics.enabled:
+                    metrics.count_not_modified(endpoint)
+                return stored[1]
+
+            etag_store.record(endpoint, not_modified=False)
+
+        if etag_store is not None:
+            etag_store.set(endpoint, params, response)
+        return response
+
+    @staticmethod
+    def _execute_request(request, endpoint: str, params: dict) -> dict:
+        if not metrics.enabled:
+            return request.execute()
+
+        request.postproc = metrics.timed_postproc(endpoint, request.postproc)
+        start_time = time.perf_counter()
+        try:
+            return request.execute()
+        finally:
+            metrics.observe_request(endpoint, params.get('part'), time.perf_counter() - start_time)
+
+    @staticmethod
+    def _fetch_guarded(label: str, stop: threading.Event, fetch: Callable[[], list]) -> list:
+        """
+        Runs one of many concurrent fetches (e.g. a search keyword or a trending chart) and
+        returns its items, or no items if it failed. Once quota runs out (budget or API limit),
+        stop is set and fetches that did not start yet are skipped; other failures only warn.
+        """
+        from googleapiclient.errors import HttpError
+
+        if stop.is_set():
+            return []
+        try:
+            return fetch()
+
+        except QuotaExceededError as error:
+            if not stop.is_set():
+                stop.set()
+                print(f"Quota budget reached! {error}")
+
+        except HttpError as error:
+            if not is_quota_exceeded(error):
+                # retries are exhausted or the request is invalid, other fetches go on
+                print(f"Warning: {label} failed: {error}")
+            elif not stop.is_set():
+                stop.set()
+                print("Quota limit reached!")
+
+        except CircuitOpenError as error:
+            print(f"Warning: {label} skipped: {error}")
+        return []
+
+    def _get_item(self, content_id: str, parts: str) -> dict:
+        """
+        Returns the requested response parts of the content. Parts that are not cached yet
+        are merged into a single request, already cached parts are never fetched again.
+        """
+        requested = self._split_parts(parts)
+        missing = [part for part in requested if part not in self._parts]
+        if missing:
+            response = self.get_response(content_id, ', '.join(missing))
+            self._store_item(response['items'][0], missing)
+        return {part: self._parts[part] for part in requested}
+
+    @staticmethod
+    def _hydrate_many(contents: Iterable["YoutubeContent"], parts: str, content_id: Callable) -> List["YoutubeContent"]:
+        """
+        Fetches the given parts for many content objects of one type, sending one list request
+        per 50 ids instead of one per object. Objects sharing an id (content_id returns it) are
+        filled from the same response item. Returns the objects found by the API.
+        """
+        contents = list(contents)
+        requested = YoutubeContent._split_parts(parts)
+
+        by_id = {}
+        for content in contents:
+            if not content._has_parts(requested):
+                by_id.setdefault(content_id(content), []).append(content)
+
+        for chunk in chunked(list(by_id)):
+            response = by_id[chunk[0]][0].get_response(','.join(chunk), ', '.join(requested))
+
+            for item in response.get('items', []):
+                for content in by_id.get(item['id'], []):
+                    content._store_item(item, requested)
+
+        return [content for content in contents if content._has_parts(requested)]
+
+    def _has_parts(self, parts: List[str]) -> bool:
+        return all(part in self._parts for part in parts)
+
+    def _store_item(self, item: dict, parts: List[str]) -> None:
+        for part in parts:
+            self._parts[part] = item.get(part, {})
+        self._parsed.clear()
+
+    @staticmethod
+    def _split_parts(parts: str) -> List[str]:
+        return [part.strip() for part in parts.split(',') if part.strip()]
+
 
 
@@ -0,0 +1,84 @@
+import sys
+import json
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from googleapiclient.errors import HttpError
+
+# error reasons reported by the YouTube Data API when a project runs out of quota
+QUOTA_REASONS = {'quotaExceeded', 'dailyLimitExceeded'}
+
+# error reasons reported when requests are sent too fast
+RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+
+# error classes, see classify_error
+QUOTA = 'quota'
+RATE_LIMIT = 'rate_limit'
+TRANSIENT = 'transient'
+PERMANENT = 'permanent'
+
+
+def content_reasons(content: bytes) -> set[str]:
+    """
+    Returns the machine readable reasons (e.g. 'quotaExceeded') listed in an API error body.
+    """
+    try:
+        data = json.loads(content.decode('utf-8'))
+        errors = data['error'].get('errors', [])
+        return {item['reason'] for item in errors if 'reason' in item}
+
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return set()
+
+
+def error_reasons(error: "HttpError") -> set[str]:
+    """
+    Returns the machine readable reasons listed in an HttpError raised by googleapiclient.
+    """
+    return content_reasons(error.content)
+
+
+def is_quota_exceeded(error: "HttpError") -> bool:
+    """
+    Checks whether the API rejected the request because the key ran out of quota.
+    """
+    return error.resp.status == 403 and bool(error_reasons(error) & QUOTA_REASONS)
+
+
+def classify_error(error: BaseException) -> str:
+    """
+    Classifies an error raised while sending a request:
+    QUOTA (the key ran out of quota, retrying is pointless until it resets),
+    RATE_LIMIT (429 or a rate limit reason, retry slower),
+    TRANSIENT (5xx, 408, a network error or timeout, retry) or
+    PERMANENT (anything else, e.g. 400 / 404, do not retry).
+    """
+    # imported here, so that importing the package does not load the HTTP stack
+    import ssl
+    import httplib2
+    from googleapiclient.errors import HttpError
+
+    if isinstance(error, HttpError):
+        status = error.resp.status
+        reasons = error_reasons(error)
+
+        if status == 403 and reasons & QUOTA_REASONS:
+            return QUOTA
+        if status == 429 or (status == 403 and reasons & RATE_LIMIT_REASONS):
+            return RATE_LIMIT
+        if status >= 500 or status == 408:
+            return TRANSIENT
+        return PERMANENT
+
+    # network errors raised by the httplib2 transport (timeouts, resets, DNS failures)
+    if isinstance(error, (TimeoutError, ConnectionError, ssl.SSLError, httplib2.HttpLib2Error)):
+        return TRANSIENT
+
+    # network errors and timeouts of the aiohttp transport (AsyncYouTubeClient), checked only
+    # when it is loaded, so that classifying errors does not import it
+    asyncio, aiohttp = sys.modules.get('asyncio'), sys.modules.get('aiohttp')
+    if asyncio is not None and isinstance(error, asyncio.TimeoutError):
+        return TRANSIENT
+    if aiohttp is not None and isinstance(error, aiohttp.ClientError):
+        return TRANSIENT
+    return PERMANENT
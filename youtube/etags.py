@@ -0,0 +1,125 @@
+import json
+import time
+import sqlite3
+import threading
+from collections import Counter
+from typing import Iterable, Optional, Tuple
+
+from .cache import ResponseCache
+
+
+class EtagStore:
+    """
+    Store of the last response body and its etag per request (endpoint and parameters), used to
+    send conditional requests (If-None-Match). When the resource did not change, the API answers
+    304 Not Modified without a body and the stored response is returned instead, which saves
+    the download and JSON decoding of unchanged pages, e.g. on hourly re-polls of channels.list
+    and playlistItems.list. Unlike ResponseCache entries, stored bodies never expire, since every
+    use is validated by the API. Kept in memory by default, or persisted in an SQLite file (path).
+    The store is bounded by max_entries, evicting least recently used requests.
+    """
+    def __init__(
+            self,
+            path: str = ':memory:',
+            endpoints: Optional[Iterable[str]] = None,
+            max_entries: Optional[int] = 100_000
+        ):
+        self.path = path
+        # endpoints sending conditional requests, None for all
+        self.endpoints = set(endpoints) if endpoints is not None else None
+        self.max_entries = max_entries
+
+        # conditional requests sent and answered with 304 Not Modified, per endpoint
+        self.requests = Counter()
+        self.not_modified = Counter()
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS etags (key TEXT PRIMARY KEY, etag TEXT, body TEXT, accessed_at REAL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS etags_accessed ON etags (accessed_at)")
+        self._count = self._connection.execute("SELECT COUNT(*) FROM etags").fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f"EtagStore(path={self.path})"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def handles(self, endpoint: str) -> bool:
+        return self.endpoints is None or endpoint in self.endpoints
+
+    def get(self, endpoint: str, params: dict) -> Optional[Tuple[str, dict]]:
+        """
+        Returns the etag and body of the last response to the request, None if unknown.
+        """
+        if not self.handles(endpoint):
+            return None
+
+        key = ResponseCache.make_key(endpoint, params)
+        with self._lock:
+            row = self._connection.execute("SELECT etag, body FROM etags WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE etags SET accessed_at = ? WHERE key = ?", (time.time(), key))
+
+        return row[0], json.loads(row[1])
+
+    def set(self, endpoint: str, params: dict, response: dict) -> None:
+        """
+        Stores a response carrying an etag, evicting least recently used entries above max_entries.
+        """
+        etag = response.get('etag')
+        if not etag or not self.handles(endpoint):
+            return
+
+        key = ResponseCache.make_key(endpoint, params)
+        with self._lock:
+            known = self._connection.execute("SELECT 1 FROM etags WHERE key = ?", (key,)).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO etags VALUES (?, ?, ?, ?)", (key, etag, json.dumps(response), time.time())
+            )
+            if known is None:
+                self._count += 1
+
+            if self.max_entries is not None and self._count > self.max_entries:
+                excess = self._count - self.max_entries
+                self._connection.execute(
+                    "DELETE FROM etags WHERE key IN (SELECT key FROM etags ORDER BY accessed_at LIMIT ?)", (excess,)
+                )
+                self._count -= excess
+
+    def record(self, endpoint: str, not_modified: bool) -> None:
+        """
+        Counts a conditional request and whether it was answered with 304 Not Modified.
+        """
+        with self._lock:
+            self.requests[endpoint] += 1
+            if not_modified:
+                self.not_modified[endpoint] += 1
+
+    def stats(self) -> dict:
+        """
+        Returns conditional requests, 304 responses and the etag hit rate, in total and per endpoint.
+        """
+        requests, not_modified = sum(self.requests.values()), sum(self.not_modified.values())
+        return {
+            "conditional_requests": requests,
+            "not_modified": not_modified,
+            "hit_rate": not_modified / requests if requests else 0.0,
+            "entries": len(self),
+            "endpoints": {
+                endpoint: {
+                    "conditional_requests": count,
+                    "not_modified": self.not_modified[endpoint],
+                    "hit_rate": self.not_modified[endpoint] / count,
+                }
+                for endpoint, count in sorted(self.requests.items())
+            },
+        }
+
+    def close(self) -> None:
+        self._connection.close()
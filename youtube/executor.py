@@ -0,0 +1,221 @@
+import time
+import threading
+from collections import Counter
+from typing import Awaitable, Callable, Optional
+from .errors import classify_error, QUOTA, RATE_LIMIT, TRANSIENT, PERMANENT
+from .metrics import metrics
+from .ratelimit import AdaptiveTokenBucket
+from .retry import RetryPolicy
+
+DEFAULT_REQUESTS_PER_SECOND = 50.0
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request to an endpoint whose circuit breaker is open.
+    """
+    pass
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to an endpoint after failure_threshold consecutive transient or rate
+    limit failures. After reset_timeout seconds a single trial request is let through
+    (half-open): success closes the circuit again, another failure keeps it open.
+    """
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.failures = 0
+        self.opened_at = None
+        self.trips = 0
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(state={self.state}, failures={self.failures})"
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return 'open'
+        return 'half-open'
+
+    def before_request(self, endpoint: str) -> None:
+        """
+        Raises CircuitOpenError while the circuit is open or a trial request is in flight.
+        """
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return
+            if state == 'half-open' and not self._trial:
+                self._trial = True
+                return
+
+        retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+        raise CircuitOpenError(f"Circuit of {endpoint}.list is open after {self.failures} failures, retry in {retry_in:.1f}s.")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial or (self.opened_at is None and self.failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                self.trips += 1
+            self._trial = False
+
+
+class RequestExecutor:
+    """
+    Shared executor of API requests. Requests pass a token bucket that slows down on rate limit
+    signals; transient errors (5xx, timeouts, connection resets) and rate limits are retried with
+    jittered exponential backoff (RetryPolicy), while quota and permanent errors (e.g. 400, 404)
+    are raised right away. Each endpoint has a circuit breaker, so a failing endpoint is not
+    hammered with retries from every thread.
+    """
+    def __init__(
+            self,
+            retry: Optional[RetryPolicy] = None,
+            requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+            failure_threshold: int = 5,
+            reset_timeout: float = 30.0
+        ):
+        self.retry = retry or RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=32.0)
+        self.limiter = AdaptiveTokenBucket(requests_per_second)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.requests = 0
+        self.retries = 0
+        self.errors = Counter()
+
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"RequestExecutor(requests={self.requests}, retries={self.retries})"
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        with self._lock:
+            if endpoint not in self._breakers:
+                self._breakers[endpoint] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._breakers[endpoint]
+
+    def execute(self, endpoint: str, send: Callable[[], dict], on_retry: Optional[Callable[[], None]] = None) -> dict:
+        """
+        Sends a request with send() and returns its response, retrying retryable errors.
+        on_retry is called before every retry, e.g. to charge the quota of the repeated request.
+        """
+        breaker = self.breaker(endpoint)
+
+        for attempt in range(self.retry.max_attempts):
+            breaker.before_request(endpoint)
+            self.limiter.acquire()
+
+            try:
+                with self._lock:
+                    self.requests += 1
+                response = send()
+
+            except Exception as error:
+                if not self._should_retry(endpoint, breaker, error, attempt):
+                    raise
+                time.sleep(self.retry.delay(attempt))
+                if on_retry is not None:
+                    on_retry()
+                continue
+
+            self.limiter.reward()
+            breaker.record_success()
+            return response
+
+    async def execute_async(
+            self,
+            endpoint: str,
+            send: Callable[[], Awaitable[dict]],
+            on_retry: Optional[Callable[[], None]] = None
+        ) -> dict:
+        """
+        Asynchronous counterpart of execute, awaiting send() (e.g. an aiohttp request of
+        AsyncYouTubeClient). Rate limiting and backoff delays do not block the event loop.
+        """
+        import asyncio
+
+        breaker = self.breaker(endpoint)
+
+        for attempt in range(self.retry.max_attempts):
+            breaker.before_request(endpoint)
+            await self.limiter.acquire_async()
+
+            try:
+                with self._lock:
+                    self.requests += 1
+                response = await send()
+
+            except Exception as error:
+                if not self._should_retry(endpoint, breaker, error, attempt):
+                    raise
+                await asyncio.sleep(self.retry.delay(attempt))
+                if on_retry is not None:
+                    on_retry()
+                continue
+
+            self.limiter.reward()
+            breaker.record_success()
+            return response
+
+    def _should_retry(self, endpoint: str, breaker: CircuitBreaker, error: Exception, attempt: int) -> bool:
+        """
+        Records a failed attempt and decides whether the request is retried.
+        """
+        kind = classify_error(error)
+        with self._lock:
+            self.errors[kind] += 1
+        if metrics.enabled:
+            metrics.count_error(endpoint, kind)
+
+        if kind in (QUOTA, PERMANENT):
+            # the endpoint works, the request itself can not succeed
+            breaker.record_success()
+            return False
+
+        if kind == RATE_LIMIT:
+            self.limiter.penalize()
+        breaker.record_failure()
+
+        if attempt == self.retry.max_attempts - 1:
+            return False
+
+        with self._lock:
+            self.retries += 1
+        if metrics.enabled:
+            metrics.count_retry(endpoint)
+        return True
+
+    def stats(self) -> dict:
+        """
+        Returns request, retry and error counts, the current request rate and breaker states.
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": {kind: self.errors[kind] for kind in (QUOTA, RATE_LIMIT, TRANSIENT, PERMANENT)},
+            "requests_per_second": round(self.limiter.rate, 2),
+            "circuits": {endpoint: breaker.state for endpoint, breaker in breakers.items()},
+            "circuit_trips": sum(breaker.trips for breaker in breakers.values()),
+        }
+
+
+default_executor = RequestExecutor()
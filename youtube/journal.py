@@ -0,0 +1,126 @@
+import sqlite3
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+
+class RunJournal:
+    """
+    Persistent SQLite journal of a collector run. It records which sources (channels, playlists)
+    are finished, the playlist page token reached in each source and which items (video ids) were
+    already produced, so that a run interrupted by an exception, exhausted quota or Ctrl-C can be
+    resumed from the last checkpoint without repeating work or spending the quota again.
+    Runs are identified by run_id, reusing the id resumes the run.
+    """
+    def __init__(self, path: str = 'youtube-journal.sqlite', run_id: str = 'default'):
+        self.path = path
+        self.run_id = run_id
+
+        self.sources_skipped = 0
+        self.items_skipped = 0
+        self.items_new = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS sources ("
+            "run_id TEXT, source_id TEXT, page_token TEXT, items_done INTEGER, finished INTEGER, "
+            "PRIMARY KEY (run_id, source_id))"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS items (run_id TEXT, item_id TEXT, PRIMARY KEY (run_id, item_id))"
+        )
+
+    def __repr__(self) -> str:
+        return f"RunJournal(path={self.path}, run_id={self.run_id})"
+
+    def begin(self) -> None:
+        """
+        Resets the skipped / new counters at the start of a (resumed) run.
+        """
+        self.sources_skipped = self.items_skipped = self.items_new = 0
+
+    def pending_sources(self, source_ids: Iterable[str]) -> List[str]:
+        """
+        Returns the sources that are not finished yet, preserving order.
+        """
+        source_ids = list(source_ids)
+        with self._lock:
+            finished = {row[0] for row in self._connection.execute(
+                "SELECT source_id FROM sources WHERE run_id = ? AND finished = 1", (self.run_id,)
+            )}
+
+        pending = [source_id for source_id in source_ids if source_id not in finished]
+        self.sources_skipped += len(source_ids) - len(pending)
+        return pending
+
+    def position(self, source_id: str) -> Tuple[Optional[str], int]:
+        """
+        Returns the page token to resume the source from and the number of items already
+        done in it, (None, 0) for a source that was not started.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT page_token, items_done FROM sources WHERE run_id = ? AND source_id = ?",
+                (self.run_id, source_id)
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, 0)
+
+    def checkpoint(self, source_id: str, page_token: Optional[str], items_done: int, finished: bool = False) -> None:
+        """
+        Records that all items of the source up to page_token were produced.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?)",
+                (self.run_id, source_id, page_token, items_done, int(finished))
+            )
+
+    def new_items(self, item_ids: Iterable[str]) -> List[str]:
+        """
+        Returns the items that were not produced yet, counting the others as skipped.
+        """
+        item_ids = list(item_ids)
+        with self._lock:
+            done = set()
+            for start in range(0, len(item_ids), 500):
+                chunk = item_ids[start:start + 500]
+                done.update(row[0] for row in self._connection.execute(
+                    f"SELECT item_id FROM items WHERE run_id = ? AND item_id IN ({','.join('?' * len(chunk))})",
+                    (self.run_id, *chunk)
+                ))
+
+        self.items_skipped += sum(item_id in done for item_id in item_ids)
+        return [item_id for item_id in item_ids if item_id not in done]
+
+    def mark_done(self, item_id: str) -> None:
+        with self._lock:
+            inserted = self._connection.execute(
+                "INSERT OR IGNORE INTO items VALUES (?, ?)", (self.run_id, item_id)
+            ).rowcount
+        self.items_new += inserted
+
+    def report(self) -> dict:
+        """
+        Returns how many sources and items were skipped (done in a previous attempt)
+        and how many items are new in this attempt.
+        """
+        return {
+            "run_id": self.run_id,
+            "sources_skipped": self.sources_skipped,
+            "items_skipped": self.items_skipped,
+            "items_new": self.items_new,
+        }
+
+    def reset(self) -> None:
+        """
+        Forgets the progress of the run, so that it starts from scratch.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM sources WHERE run_id = ?", (self.run_id,))
+            self._connection.execute("DELETE FROM items WHERE run_id = ?", (self.run_id,))
+        self.begin()
+
+    def close(self) -> None:
+        self._connection.close()
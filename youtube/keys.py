@@ -0,0 +1,119 @@
+import os
+import threading
+from typing import List
+from .quota import DEFAULT_DAILY_QUOTA, QuotaExceededError
+
+
+class ApiKey:
+    """
+    A single YouTube API key with its own quota counter. Keys are retired once the API
+    reports their quota as exceeded.
+    """
+    def __init__(self, value: str, daily_quota: int = DEFAULT_DAILY_QUOTA):
+        self.value = value
+        self.daily_quota = daily_quota
+        self.used = 0
+        self.retired = False
+
+    def __repr__(self) -> str:
+        return f"ApiKey(key=...{self.value[-4:]}, used={self.used}, retired={self.retired})"
+
+    @property
+    def remaining(self) -> int:
+        if self.retired:
+            return 0
+        return max(self.daily_quota - self.used, 0)
+
+
+class ApiKeyPool:
+    """
+    Pool of API keys, each with its own client (see ClientRegistry) and quota counter. Requests are
+    spread across keys by remaining budget and keys reporting quotaExceeded are retired, so that
+    the work is retried on another key.
+    """
+    def __init__(self, keys: List[str], daily_quota: int = DEFAULT_DAILY_QUOTA):
+        if not keys:
+            raise ValueError("ApiKeyPool requires at least one API key.")
+
+        self.keys = [ApiKey(key, daily_quota) for key in dict.fromkeys(keys)]
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"ApiKeyPool(keys={len(self.keys)}, remaining={self.remaining})"
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def from_env(cls, daily_quota: int = DEFAULT_DAILY_QUOTA) -> "ApiKeyPool":
+        """
+        Builds the pool from YOUTUBE_API_KEYS (comma-separated) or a single YOUTUBE_API_KEY.
+        """
+        keys = os.environ.get('YOUTUBE_API_KEYS') or os.environ.get('YOUTUBE_API_KEY')
+        if not keys:
+            raise ValueError("YOUTUBE_API_KEY environment variable is not set.")
+
+        return cls([key.strip() for key in keys.split(',') if key.strip()], daily_quota)
+
+    @property
+    def remaining(self) -> int:
+        return sum(key.remaining for key in self.keys)
+
+    def peek(self) -> ApiKey:
+        """
+        Returns the key with the most remaining budget without charging it.
+        """
+        with self._lock:
+            return max(self.keys, key=lambda api_key: api_key.remaining)
+
+    def acquire(self, units: int = 1) -> ApiKey:
+        """
+        Picks the key with the most remaining budget and charges it with the units.
+        Raises QuotaExceededError when no key can afford the request.
+        """
+        with self._lock:
+            key = max(self.keys, key=lambda api_key: api_key.remaining)
+            if key.remaining < units:
+                raise QuotaExceededError(f"All {len(self.keys)} API keys ran out of quota.")
+
+            key.used += units
+            return key
+
+    def charge(self, key: ApiKey, units: int) -> None:
+        """
+        Charges an already acquired key with further units, e.g. for a retried request.
+        """
+        with self._lock:
+            key.used += units
+
+    def retire(self, key: ApiKey) -> None:
+        """
+        Takes the key out of rotation, e.g. after the API reported quotaExceeded for it.
+        """
+        with self._lock:
+            key.retired = True
+
+    def reset(self) -> None:
+        """
+        Restores all keys with empty counters, e.g. after the daily quota reset.
+        """
+        with self._lock:
+            for key in self.keys:
+                key.used = 0
+                key.retired = False
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> ApiKeyPool:
+    """
+    Returns the process-wide key pool built from the environment upon first use.
+    """
+    global _default_pool
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                _default_pool = ApiKeyPool.from_env()
+    return _default_pool
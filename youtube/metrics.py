@@ -0,0 +1,290 @@
+import json
+import time
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+# upper bounds (seconds) of latency histogram buckets, the last bucket is +Inf
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# upper bounds (seconds) of JSON parse time buckets
+PARSE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram (Prometheus style) with count and sum; quantiles are estimated
+    from the bucket bounds.
+    """
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def __repr__(self) -> str:
+        return f"Histogram(count={self.count}, sum={self.sum:.3f})"
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the upper bound of the bucket holding the q-quantile (the largest bound for +Inf).
+        """
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for position, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.buckets[min(position, len(self.buckets) - 1)]
+        return self.buckets[-1]
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "sum_seconds": round(self.sum, 6),
+            "p50_seconds": self.quantile(0.50),
+            "p99_seconds": self.quantile(0.99),
+        }
+
+
+class Metrics:
+    """
+    Instrumentation of a collector run: request latency histograms per endpoint and part set,
+    bytes received, JSON parse time, quota units, cache hits, 304 Not Modified answers to
+    conditional requests, retries and errors by class, and transcript fetch latency and outcome.
+    Hooks check `enabled` first, so a disabled instance costs a single attribute lookup per request.
+    Exporters (JsonExporter, PrometheusExporter, CallbackExporter or any callable taking the Metrics
+    object) run on export(), which VideoDataCollector calls at the end of every run.
+    """
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.exporters: List[Callable[["Metrics"], None]] = []
+
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f"Metrics(enabled={self.enabled}, requests={sum(self.requests.values())})"
+
+    def enable(self, *exporters: Callable[["Metrics"], None]) -> "Metrics":
+        self.enabled = True
+        self.exporters.extend(exporters)
+        return self
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.latency: Dict[Tuple[str, str], Histogram] = {}
+            self.parse_time: Dict[str, Histogram] = {}
+            self.transcript_latency = Histogram()
+            self.requests = Counter()
+            self.bytes_received = Counter()
+            self.quota_units = Counter()
+            self.cache_hits = Counter()
+            self.not_modified = Counter()
+            self.retries = Counter()
+            self.errors = Counter()
+            self.transcripts = Counter()
+
+    # hooks
+
+    @staticmethod
+    def part_label(parts: Optional[str]) -> str:
+        return ','.join(sorted(part.strip() for part in (parts or '').split(',') if part.strip()))
+
+    def observe_request(self, endpoint: str, parts: Optional[str], seconds: float) -> None:
+        key = (endpoint, self.part_label(parts))
+        with self._lock:
+            if key not in self.latency:
+                self.latency[key] = Histogram()
+            self.latency[key].observe(seconds)
+            self.requests[endpoint] += 1
+
+    def observe_response(self, endpoint: str, size: int, parse_seconds: float) -> None:
+        with self._lock:
+            if endpoint not in self.parse_time:
+                self.parse_time[endpoint] = Histogram(PARSE_BUCKETS)
+            self.parse_time[endpoint].observe(parse_seconds)
+            self.bytes_received[endpoint] += size
+
+    def count_quota(self, endpoint: str, units: int) -> None:
+        with self._lock:
+            self.quota_units[endpoint] += units
+
+    def count_cache_hit(self, endpoint: str) -> None:
+        with self._lock:
+            self.cache_hits[endpoint] += 1
+
+    def count_not_modified(self, endpoint: str) -> None:
+        with self._lock:
+            self.not_modified[endpoint] += 1
+
+    def count_retry(self, endpoint: str) -> None:
+        with self._lock:
+            self.retries[endpoint] += 1
+
+    def count_error(self, endpoint: str, kind: str) -> None:
+        with self._lock:
+            self.errors[endpoint, kind] += 1
+
+    def observe_transcript(self, seconds: float, outcome: str) -> None:
+        with self._lock:
+            self.transcript_latency.observe(seconds)
+            self.transcripts[outcome] += 1
+
+    def timed_postproc(self, endpoint: str, postproc: Callable) -> Callable:
+        """
+        Wraps the postproc of a googleapiclient request (JSON decoding of the raw response)
+        to measure bytes received and parse time.
+        """
+        def postproc_with_metrics(resp, content):
+            start_time = time.perf_counter()
+            result = postproc(resp, content)
+            self.observe_response(endpoint, len(content or b''), time.perf_counter() - start_time)
+            return result
+        return postproc_with_metrics
+
+    # reporting
+
+    def summary(self) -> dict:
+        """
+        Returns all metrics as a JSON-serializable dict.
+        """
+        with self._lock:
+            endpoints = sorted(set(self.requests) | set(self.cache_hits) | set(self.quota_units) | {endpoint for endpoint, _ in self.errors})
+            return {
+                "endpoints": {
+                    endpoint: {
+                        "requests": self.requests[endpoint],
+                        "cache_hits": self.cache_hits[endpoint],
+                        "not_modified": self.not_modified[endpoint],
+                        "quota_units": self.quota_units[endpoint],
+                        "bytes_received": self.bytes_received[endpoint],
+                        "retries": self.retries[endpoint],
+                        "errors": {kind: count for (name, kind), count in self.errors.items() if name == endpoint},
+                        "parse": self.parse_time[endpoint].summary() if endpoint in self.parse_time else None,
+                        "latency": {
+                            parts: histogram.summary()
+                            for (name, parts), histogram in sorted(self.latency.items()) if name == endpoint
+                        },
+                    }
+                    for endpoint in endpoints
+                },
+                "transcripts": {
+                    "outcomes": dict(self.transcripts),
+                    "latency": self.transcript_latency.summary(),
+                },
+            }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.summary(), indent=indent)
+
+    def to_prometheus(self, prefix: str = 'youtube') -> str:
+        """
+        Renders the metrics in the classic Prometheus text exposition format (version 0.0.4),
+        as read by the node_exporter textfile collector.
+        """
+        lines = []
+
+        def counter(name: str, help_text: str, values: Dict[str, float]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for labels, value in values.items():
+                lines.append(f"{prefix}_{name}{{{labels}}} {value}")
+
+        def histogram(name: str, help_text: str, values: Dict[str, Histogram]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for labels, data in values.items():
+                separator = ',' if labels else ''
+                cumulative = 0
+                for bound, count in zip(data.buckets + (float('inf'),), data.counts):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{prefix}_{name}_bucket{{{labels}{separator}le="{le}"}} {cumulative}')
+                label_set = f"{{{labels}}}" if labels else ''
+                lines.append(f"{prefix}_{name}_sum{label_set} {data.sum}")
+                lines.append(f"{prefix}_{name}_count{label_set} {data.count}")
+
+        with self._lock:
+            counter("requests_total", "Requests sent to the API.",
+                    {f'endpoint="{endpoint}"': count for endpoint, count in self.requests.items()})
+            counter("cache_hits_total", "Requests served from the response cache.",
+                    {f'endpoint="{endpoint}"': count for endpoint, count in self.cache_hits.items()})
+            counter("not_modified_total", "Conditional requests answered with 304 Not Modified.",
+                    {f'endpoint="{endpoint}"': count for endpoint, count in self.not_modified.items()})
+            counter("quota_units_total", "Quota units charged.",
+                    {f'endpoint="{endpoint}"': count for endpoint, count in self.quota_units.items()})
+            counter("received_bytes_total", "Response bytes received.",
+                    {f'endpoint="{endpoint}"': count for endpoint, count in self.bytes_received.items()})
+            counter("retries_total", "Retried requests.",
+                    {f'endpoint="{endpoint}"': count for endpoint, count in self.retries.items()})
+            counter("errors_total", "Failed requests by error class.",
+                    {f'endpoint="{endpoint}",kind="{kind}"': count for (endpoint, kind), count in self.errors.items()})
+            counter("transcripts_total", "Transcript fetches by outcome.",
+                    {f'outcome="{outcome}"': count for outcome, count in self.transcripts.items()})
+            histogram("request_duration_seconds", "Request latency by endpoint and part set.",
+                      {f'endpoint="{endpoint}",part="{parts}"': data for (endpoint, parts), data in self.latency.items()})
+            histogram("parse_duration_seconds", "JSON decoding time of responses.",
+                      {f'endpoint="{endpoint}"': data for endpoint, data in self.parse_time.items()})
+            histogram("transcript_duration_seconds", "Transcript fetch latency.",
+                      {'': self.transcript_latency})
+
+        return '\n'.join(lines) + '\n'
+
+    def export(self) -> None:
+        """
+        Passes the metrics to every exporter, a no-op while disabled.
+        """
+        if self.enabled:
+            for exporter in self.exporters:
+                exporter(self)
+
+
+class JsonExporter:
+    """
+    Writes the JSON summary to a file, or prints it when no path is given.
+    """
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+
+    def __call__(self, metrics: Metrics) -> None:
+        if self.path is None:
+            print(metrics.to_json())
+            return
+        with open(self.path, 'w') as file:
+            file.write(metrics.to_json())
+
+
+class PrometheusExporter:
+    """
+    Writes the Prometheus text format to a file, e.g. for the node_exporter textfile collector.
+    """
+    def __init__(self, path: str):
+        self.path = path
+
+    def __call__(self, metrics: Metrics) -> None:
+        with open(self.path, 'w') as file:
+            file.write(metrics.to_prometheus())
+
+
+class CallbackExporter:
+    """
+    Passes the summary dict to a callback, e.g. to push it to a monitoring system.
+    """
+    def __init__(self, callback: Callable[[dict], None]):
+        self.callback = callback
+
+    def __call__(self, metrics: Metrics) -> None:
+        self.callback(metrics.summary())
+
+
+# process-wide metrics, disabled by default: metrics.enable(JsonExporter('metrics.json'))
+metrics = Metrics()
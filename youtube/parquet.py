@@ -0,0 +1,159 @@
+import os
+import uuid
+from datetime import date
+from typing import List, Optional
+from .sinks import Sink
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Parquet output requires pyarrow, install it with: pip install pyarrow")
+
+
+def video_properties_schema() -> "pa.Schema":
+    """
+    Arrow schema of records produced by Video.get_video_properties
+    (optionally merged with Video.get_video_transcript).
+    """
+    _require_pyarrow()
+    return pa.schema([
+        ("video_id", pa.string()),
+        ("video_name", pa.string()),
+        ("channel_id", pa.string()),
+        ("channel_name", pa.string()),
+        ("category_id", pa.string()),
+        ("published_at", pa.date32()),
+        ("length", pa.int32()),
+        ("type", pa.dictionary(pa.int8(), pa.string())),
+        ("license", pa.dictionary(pa.int8(), pa.string())),
+        ("made_for_kids", pa.bool_()),
+        ("user_tags", pa.list_(pa.string())),
+        ("description", pa.string()),
+        ("transcript", pa.string()),
+    ])
+
+
+def video_statistics_schema() -> "pa.Schema":
+    """
+    Arrow schema of records produced by Video.get_video_statistics.
+    """
+    _require_pyarrow()
+    return pa.schema([
+        ("date", pa.date32()),
+        ("video_id", pa.string()),
+        ("views", pa.int64()),
+        ("likes", pa.int64()),
+        ("comments", pa.int64()),
+    ])
+
+
+def _normalize(value, data_type: "pa.DataType"):
+    """
+    Converts a raw record value to the Python type expected by the Arrow field,
+    mapping placeholders such as 'Not Found' to null.
+    """
+    if value is None:
+        return None
+
+    if pa.types.is_integer(data_type):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    if pa.types.is_date(data_type):
+        if isinstance(value, date):
+            return value
+        try:
+            return date.fromisoformat(str(value)[:10])
+        except ValueError:
+            return None
+
+    if pa.types.is_boolean(data_type):
+        return value if isinstance(value, bool) else None
+
+    if pa.types.is_list(data_type):
+        return list(value) if isinstance(value, (list, tuple)) else []
+
+    return str(value)
+
+
+def to_arrow_table(records: List[dict], schema: "pa.Schema") -> "pa.Table":
+    """
+    Builds a typed Arrow table from collector records. Fields missing from the schema are dropped,
+    fields missing from a record are null.
+    """
+    _require_pyarrow()
+    rows = [
+        {field.name: _normalize(record.get(field.name), field.type) for field in schema}
+        for record in records
+    ]
+    return pa.Table.from_pylist(rows, schema=schema)
+
+
+class ParquetSink(Sink):
+    """
+    Writes records to Parquet, appending one row group per batch. Without partition_by records go
+    to a single file at path. With partition_by (e.g. 'date' for daily statistics) path is a directory
+    with hive-style partitions, path/date=2024-01-31/part-<uuid>.parquet, so that downstream scans
+    can prune both partitions and columns.
+    """
+    def __init__(
+            self,
+            path: str,
+            schema: "pa.Schema",
+            partition_by: Optional[str] = None,
+            batch_size: int = 10_000,
+            compression: str = 'zstd'
+        ):
+        _require_pyarrow()
+        super().__init__(batch_size)
+        self.path = path
+        self.schema = schema
+        self.partition_by = partition_by
+        self.compression = compression
+
+        self._writers = {}
+
+    def __repr__(self) -> str:
+        return f"ParquetSink(path={self.path}, partition_by={self.partition_by})"
+
+    def _writer(self, partition: Optional[str], schema: "pa.Schema") -> "pq.ParquetWriter":
+        if partition not in self._writers:
+            if partition is None:
+                path = self.path
+            else:
+                directory = os.path.join(self.path, f"{self.partition_by}={partition}")
+                os.makedirs(directory, exist_ok=True)
+                path = os.path.join(directory, f"part-{uuid.uuid4().hex}.parquet")
+
+            self._writers[partition] = pq.ParquetWriter(path, schema, compression=self.compression)
+        return self._writers[partition]
+
+    def _write_batch(self, records: List[dict]) -> None:
+        table = to_arrow_table(records, self.schema)
+
+        if self.partition_by is None:
+            self._writer(None, self.schema).write_table(table)
+            return
+
+        # the partition value is encoded in the directory name, not stored in the files
+        keys = table.column(self.partition_by).to_pylist()
+        data = table.drop_columns([self.partition_by])
+
+        for partition in dict.fromkeys(keys):
+            mask = pa.array([key == partition for key in keys])
+            self._writer(str(partition), data.schema).write_table(data.filter(mask))
+
+    def close(self) -> None:
+        super().close()
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
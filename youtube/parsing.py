@@ -0,0 +1,184 @@
+from typing import Dict, Iterable, List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .video import SHORTS_MAX_LENGTH
+
+# seconds per ISO 8601 duration designator, in the date part (before T) and in the time part
+DATE_UNITS = {'W': 604800, 'D': 86400}
+TIME_UNITS = {'H': 3600, 'M': 60, 'S': 1}
+
+# positions of the digits and separators in YYYY-MM-DDTHH:MM:SS
+TIMESTAMP_DIGITS = (0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18)
+TIMESTAMP_SEPARATORS = {4: '-', 7: '-', 13: ':', 16: ':'}
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Bulk parsing requires numpy, install it with: pip install numpy")
+
+
+def _columns(values: Iterable[str], min_width: int = 0) -> "np.ndarray":
+    """
+    Returns the code points of the strings as a (width, rows) matrix, zero padded. Character
+    positions are rows of the matrix, so every position is a contiguous array.
+    """
+    strings = np.ascontiguousarray(values if isinstance(values, np.ndarray) else list(values), dtype=str).reshape(-1)
+    width = max(strings.dtype.itemsize // 4, 1)
+    codes = strings.view(np.uint32).reshape(-1, width) if strings.size else np.zeros((0, width), dtype=np.uint32)
+
+    columns = np.zeros((max(width, min_width), len(strings)), dtype=np.int32)
+    columns[:width] = codes.T
+    return columns
+
+
+def _unit_table(units: Dict[str, int]) -> "np.ndarray":
+    table = np.zeros(128, dtype=np.int64)
+    for designator, seconds in units.items():
+        table[ord(designator)] = seconds
+    return table
+
+
+def parse_durations(values: Iterable[str]) -> "np.ndarray":
+    """
+    Parses ISO 8601 durations (contentDetails.duration, e.g. PT1H2M3S, P1DT2H, P0D) into seconds
+    as an int32 array; missing or malformed durations become 0, like Video._convert_time_to_seconds.
+    The strings are scanned column by column over the whole array, so the Python-level work
+    does not grow with the number of values.
+    """
+    _require_numpy()
+    columns = _columns(values)
+    rows = columns.shape[1]
+
+    date_units, time_units = _unit_table(DATE_UNITS), _unit_table(TIME_UNITS)
+    total = np.zeros(rows, dtype=np.int64)
+    number = np.zeros(rows, dtype=np.int64)
+    in_time = np.zeros(rows, dtype=bool)
+    in_fraction = np.zeros(rows, dtype=bool)
+    # digits not yet followed by their designator, and the last designator seen (they must descend)
+    pending = np.zeros(rows, dtype=bool)
+    previous_digit = np.zeros(rows, dtype=bool)
+    last_unit = np.full(rows, np.iinfo(np.int64).max, dtype=np.int64)
+    valid = columns[0] == ord('P')
+
+    for column in columns[1:]:
+        is_digit = (column >= ord('0')) & (column <= ord('9'))
+        # fractional seconds (PT1.5S) are truncated
+        number = np.where(is_digit & ~in_fraction, number * 10 + (column - ord('0')), number)
+        is_point = column == ord('.')
+
+        table_index = np.minimum(column, 127)
+        unit = np.where(in_time, time_units[table_index], date_units[table_index])
+        is_time = (column == ord('T')) & ~in_time
+        is_unit = unit > 0
+
+        valid &= is_digit | is_point | is_unit | is_time | (column == 0)
+        valid &= ~(is_unit & ((unit >= last_unit) | ~pending | (in_fraction & (unit != 1))))
+        valid &= ~(is_time & pending)
+        valid &= ~(is_point & (~previous_digit | in_fraction)) & ~(is_unit & in_fraction & ~previous_digit)
+
+        total += number * unit
+        number[is_unit] = 0
+        last_unit = np.where(is_unit, unit, last_unit)
+        pending = (pending | is_digit) & ~is_unit
+        in_fraction = (in_fraction | is_point) & ~is_unit
+        in_time |= is_time
+        previous_digit = is_digit
+
+    # durations beyond int32 (over 68 years) saturate
+    total = np.minimum(total, np.iinfo(np.int32).max)
+    return np.where(valid & ~pending & ~in_fraction, total, 0).astype(np.int32)
+
+
+def _parse_rfc3339(values: Iterable[str]):
+    """
+    Returns local times (datetime64[s]), UTC offsets (seconds) and validity of RFC 3339 timestamps.
+    """
+    columns = _columns(values, min_width=26)
+    rows = np.arange(columns.shape[1])
+
+    digits = columns[list(TIMESTAMP_DIGITS)] - ord('0')
+    valid = ((digits >= 0) & (digits <= 9)).all(axis=0)
+    for position, separator in TIMESTAMP_SEPARATORS.items():
+        valid &= columns[position] == ord(separator)
+    valid &= (columns[10] == ord('T')) | (columns[10] == ord('t')) | (columns[10] == ord(' '))
+    digits = np.where(valid, digits, 0).astype(np.int64)
+
+    year = digits[0] * 1000 + digits[1] * 100 + digits[2] * 10 + digits[3]
+    month, day = digits[4] * 10 + digits[5], digits[6] * 10 + digits[7]
+    hour, minute, second = digits[8] * 10 + digits[9], digits[10] * 10 + digits[11], digits[12] * 10 + digits[13]
+    valid &= (month >= 1) & (month <= 12) & (day >= 1) & (hour <= 23) & (minute <= 59) & (second <= 60)
+
+    months = np.where(valid, (year - 1970) * 12 + np.maximum(month, 1) - 1, 0).astype('datetime64[M]')
+    days = months.astype('datetime64[D]') + (np.maximum(day, 1) - 1).astype('timedelta64[D]')
+    # days beyond the end of the month (e.g. 2024-02-30) roll over into the next one
+    valid &= days.astype('datetime64[M]') == months
+    local = days.astype('datetime64[s]') + (hour * 3600 + minute * 60 + second).astype('timedelta64[s]')
+
+    # offset (Z, +HH:MM or -HH:MM) follows the seconds and optional fraction, none means UTC
+    tail = columns[19:]
+    is_offset = (tail == ord('Z')) | (tail == ord('z')) | (tail == ord('+')) | (tail == ord('-'))
+    start = 19 + np.argmax(is_offset, axis=0)
+    marker = np.where(is_offset.any(axis=0), columns[start, rows], 0)
+    sign = np.where(marker == ord('+'), 1, np.where(marker == ord('-'), -1, 0))
+
+    offset_digits = columns[np.minimum(start + np.array([[1], [2], [4], [5]]), len(columns) - 1), rows] - ord('0')
+    valid &= (sign == 0) | ((offset_digits >= 0) & (offset_digits <= 9)).all(axis=0)
+    offset_digits = offset_digits.astype(np.int64)
+    offset = sign * ((offset_digits[0] * 10 + offset_digits[1]) * 3600 + (offset_digits[2] * 10 + offset_digits[3]) * 60)
+
+    return local, np.where(valid, offset, 0), valid
+
+
+def parse_timestamps(values: Iterable[str]) -> "np.ndarray":
+    """
+    Parses RFC 3339 timestamps (e.g. snippet.publishedAt) into a datetime64[s] array in UTC,
+    NaT for missing or malformed values.
+    """
+    _require_numpy()
+    local, offset, valid = _parse_rfc3339(values)
+    utc = local - offset.astype('timedelta64[s]')
+    return np.where(valid, utc, np.datetime64('NaT', 's'))
+
+
+def parse_dates(values: Iterable[str]) -> "np.ndarray":
+    """
+    Returns the dates of RFC 3339 timestamps as written (like Video._parse_date) in a
+    datetime64[D] array, NaT for missing or malformed values.
+    """
+    _require_numpy()
+    local, _, valid = _parse_rfc3339(values)
+    return np.where(valid, local.astype('datetime64[D]'), np.datetime64('NaT', 'D'))
+
+
+def classify_video_types(lengths: Iterable[int]) -> "np.ndarray":
+    """
+    Classifies video lengths (seconds) as 'unknown' (0), 'shorts' or 'video' over the whole array,
+    like Video._extract_video_type.
+    """
+    _require_numpy()
+    lengths = np.asarray(lengths)
+    shorts = (lengths > 0) & (lengths <= SHORTS_MAX_LENGTH)
+    return np.where(lengths == 0, 'unknown', np.where(shorts, 'shorts', 'video'))
+
+
+def parse_video_items(items: List[dict]) -> Dict[str, "np.ndarray"]:
+    """
+    Parses the items of videos.list responses (e.g. a 50-id page, or many pages concatenated)
+    in one pass: video ids, publication time (datetime64[s], UTC), length in seconds (int32)
+    and video type.
+    """
+    _require_numpy()
+    durations = [item.get('contentDetails', {}).get('duration', '') for item in items]
+    published = [item.get('snippet', {}).get('publishedAt', '') for item in items]
+
+    lengths = parse_durations(durations)
+    return {
+        "video_id": np.array([item.get('id', '') for item in items], dtype=str),
+        "published_at": parse_timestamps(published),
+        "length": lengths,
+        "type": classify_video_types(lengths),
+    }
@@ -1,6 +1,8 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
+from .compact import VideoIds
 from .content import YoutubeContent
 from .video import Video
+from .watermarks import Watermark
 
 
 class Playlist(YoutubeContent):
@@ -32,27 +34,56 @@ class Playlist(YoutubeContent):
             page_token = None
         ):
 
-        return self.youtube.playlistItems().list(
+        return self._execute(
+                'playlistItems',
                 part=part,
                 playlistId=playlist_id,
                 maxResults=max_results,
                 pageToken=page_token
-            ).execute()
+            )
     
     def get_playlist_videos(
             self, 
             max_results: int = 50, 
-            page_token: str = None
-        ) -> Tuple[List[Video], str]: 
+            page_token: str = None,
+            watermark: Optional[Watermark] = None,
+            compact: bool = False
+        ) -> Tuple[Union[List[Video], VideoIds], str]: 
         """
         Fetches videos contained in the playlist, up to the specified max_results. 
         It can also continue from a specific page in case of paginated results, using the page_token. 
         Returns a tuple containing a list of Video objects and a token for the next page of results.
+        With a watermark (newest known video, for playlists ordered newest first) only videos newer 
+        than the watermark are returned and the next page token is None once it is reached.
+        With compact=True videos are returned as a memory-compact VideoIds collection.
         """
         
         playlist_response = self.get_response(self.playlist_id, 'contentDetails', max_results, page_token)
 
-        video_ids = [Video(item['contentDetails']['videoId']) for item in playlist_response['items']]
+        video_ids = VideoIds(published_at=[]) if compact else []
+        for item in playlist_response['items']:
+            details = item['contentDetails']
+            if watermark is not None and self._is_known(details, watermark):
+                return video_ids, None
+
+            # compact collections keep the id and publication time, no Video is created per item
+            if compact:
+                video_ids.append(details['videoId'], details.get('videoPublishedAt'))
+            else:
+                video_ids.append(Video(details['videoId'], published_at=details.get('videoPublishedAt')))
+
         next_page_token = playlist_response.get('nextPageToken')
 
-        return video_ids, next_page_token
\ No newline at end of file
+        return video_ids, next_page_token
+
+    @staticmethod
+    def _is_known(details: dict, watermark: Watermark) -> bool:
+        """
+        Checks whether a playlist item is the watermark video or was published before it
+        (the latter covers watermark videos that were deleted or made private since).
+        """
+        if details['videoId'] == watermark.video_id:
+            return True
+
+        published_at = details.get('videoPublishedAt')
+        return bool(published_at and watermark.published_at and published_at < watermark.published_at)
\ No newline at end of file
@@ -0,0 +1,195 @@
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterable, Optional, Union
+
+# default daily quota of a Google Cloud project for the YouTube Data API v3
+DEFAULT_DAILY_QUOTA = 10_000
+
+# quota units charged per list call of each endpoint
+QUOTA_COSTS = {
+    'search': 100,
+    'videos': 1,
+    'channels': 1,
+    'playlistItems': 1,
+}
+
+
+class QuotaExceededError(Exception):
+    """
+    Raised before a request that would exceed the declared quota budget.
+    """
+    pass
+
+
+# scheduler of the run active in the calling thread / task (see QuotaScheduler.run), run budgets
+# are kept per context, so concurrent runs never change the shared ledger or each other's budget
+_active_run: ContextVar[Optional["QuotaScheduler"]] = ContextVar('active_quota_run', default=None)
+
+
+class QuotaLedger:
+    """
+    Central, thread-safe record of quota units spent per endpoint. Every API call is charged
+    here before it is sent, so a declared budget stops work before the daily quota runs out.
+    """
+    def __init__(self, budget: Optional[int] = None):
+        self.budget = budget
+        self.used = 0
+        self.calls = Counter()
+        self.units = Counter()
+
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"QuotaLedger(used={self.used}, budget={self.budget})"
+
+    @staticmethod
+    def cost(endpoint: str) -> int:
+        """
+        Returns the quota units charged for a single list call of the endpoint.
+        """
+        return QUOTA_COSTS.get(endpoint, 1)
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """
+        Units left in the budget, None when no budget is declared.
+        """
+        if self.budget is None:
+            return None
+        return max(self.budget - self.used, 0)
+
+    def can_afford(self, units: int) -> bool:
+        remaining = self.remaining
+        return remaining is None or units <= remaining
+
+    def charge(self, endpoint: str) -> int:
+        """
+        Records a call of the endpoint and returns its cost. Raises QuotaExceededError
+        (without recording the call) if it does not fit in the budget, or in the budget
+        of the run active in the calling context.
+        """
+        units = self.cost(endpoint)
+        run = _active_run.get()
+        with self._lock:
+            if self.budget is not None and self.used + units > self.budget:
+                raise QuotaExceededError(
+                    f"Quota budget of {self.budget} units reached, {endpoint}.list costs {units}."
+                )
+            if run is not None:
+                run.charge(endpoint, units)
+            self.used += units
+            self.calls[endpoint] += 1
+            self.units[endpoint] += units
+        return units
+
+    def snapshot(self) -> Counter:
+        """
+        Returns units spent so far per endpoint.
+        """
+        with self._lock:
+            return Counter(self.units)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.used = 0
+            self.calls.clear()
+            self.units.clear()
+
+
+default_ledger = QuotaLedger()
+
+
+class QuotaScheduler:
+    """
+    Plans a collection run against a quota budget: work items are trimmed (and optionally ordered
+    cheapest first) so that their projected cost fits the budget, and requests charged on any
+    ledger while the run is active in the calling thread / task count against the budget.
+    The budget is kept here, not on the shared ledger. After the run, report() compares
+    projected and actual usage.
+    """
+    def __init__(self, budget: Optional[int] = None, ledger: Optional[QuotaLedger] = None):
+        self.budget = budget
+        # ledger whose remaining budget also limits planning, e.g. YoutubeContent.quota_ledger
+        self.ledger = ledger or default_ledger
+
+        self.projected = 0
+        self.actual = Counter()
+        self.scheduled = 0
+        self.skipped = []
+        self.exhausted = False
+
+        self._lock = threading.Lock()
+
+    def plan(
+            self,
+            items: Iterable,
+            cost: Union[int, Callable[..., int]],
+            cheapest_first: bool = False
+        ) -> list:
+        """
+        Returns the items that fit in the remaining budget (of the run and of the ledger), given
+        their projected cost (a number of units or a function of the item). Items that do not fit
+        are skipped.
+        """
+        budget, remaining = self.budget, self.ledger.remaining
+        if remaining is not None:
+            budget = self.projected + remaining if budget is None else min(budget, self.projected + remaining)
+
+        items = list(items)
+        costs = {id(item): cost(item) if callable(cost) else cost for item in items}
+        if cheapest_first:
+            items.sort(key=lambda item: costs[id(item)])
+
+        scheduled = []
+        for item in items:
+            units = costs[id(item)]
+            if budget is not None and self.projected + units > budget:
+                self.skipped.append(item)
+                continue
+            scheduled.append(item)
+            self.projected += units
+
+        self.scheduled += len(scheduled)
+        return scheduled
+
+    def charge(self, endpoint: str, units: int) -> None:
+        """
+        Counts a request of the run, raises QuotaExceededError if it does not fit in the budget.
+        """
+        with self._lock:
+            if self.budget is not None and sum(self.actual.values()) + units > self.budget:
+                raise QuotaExceededError(
+                    f"Run budget of {self.budget} units reached, {endpoint}.list costs {units}."
+                )
+            self.actual[endpoint] += units
+
+    @contextmanager
+    def run(self):
+        """
+        Activates the run budget in the calling context for the duration of the run. If the budget
+        runs out anyway (projection too low, retries, ...), the run stops early instead of raising.
+        """
+        token = _active_run.set(self)
+        try:
+            yield self
+        except QuotaExceededError as error:
+            self.exhausted = True
+            print(f"Warning: {error} Stopping the run early.")
+        finally:
+            _active_run.reset(token)
+
+    def report(self) -> dict:
+        """
+        Returns projected versus actual quota usage of the run.
+        """
+        return {
+            "budget": self.budget,
+            "projected": self.projected,
+            "actual": sum(self.actual.values()),
+            "actual_by_endpoint": dict(self.actual),
+            "scheduled": self.scheduled,
+            "skipped": len(self.skipped),
+            "exhausted": self.exhausted,
+        }
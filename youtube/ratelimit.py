@@ -0,0 +1,119 @@
+import time
+import threading
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: allows `rate` acquisitions per second on average,
+    with bursts of up to `capacity` acquisitions.
+    """
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"TokenBucket(rate={self.rate}, capacity={self.capacity})"
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def _take(self, tokens: float) -> float:
+        """
+        Takes the tokens if available and returns 0, otherwise the delay until they will be.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Blocks until the tokens are available and returns the time spent waiting.
+        """
+        waited = 0.0
+        while True:
+            delay = self._take(tokens)
+            if not delay:
+                return waited
+
+            time.sleep(delay)
+            waited += delay
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        Same as acquire, but waits without blocking the event loop.
+        """
+        import asyncio
+
+        waited = 0.0
+        while True:
+            delay = self._take(tokens)
+            if not delay:
+                return waited
+
+            await asyncio.sleep(delay)
+            waited += delay
+
+
+class HostRateLimiter:
+    """
+    Keeps a separate token bucket per host, created upon first use.
+    """
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity
+
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.capacity)
+            return self._buckets[host]
+
+    def acquire(self, host: str) -> float:
+        return self.bucket(host).acquire()
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """
+    Token bucket whose rate adapts to the server (AIMD): the rate is halved on every rate limit
+    signal (429, rateLimitExceeded) down to min_rate, and grows back by `increase` per second
+    with every successful request up to max_rate.
+    """
+    def __init__(
+            self,
+            rate: float,
+            capacity: Optional[float] = None,
+            min_rate: float = 1.0,
+            max_rate: Optional[float] = None,
+            increase: float = 0.1
+        ):
+        super().__init__(rate, capacity)
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate
+        self.increase = increase
+
+    def __repr__(self) -> str:
+        return f"AdaptiveTokenBucket(rate={self.rate:.2f}, max_rate={self.max_rate})"
+
+    def penalize(self) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate / 2)
+            # drop the burst allowance, so the slower rate applies right away
+            self._tokens = min(self._tokens, 1.0)
+
+    def reward(self) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.increase)
@@ -0,0 +1,44 @@
+import time
+import random
+from typing import Callable, Tuple, Type
+
+
+class RetryPolicy:
+    """
+    Retries a callable on the given exception types with jittered exponential backoff
+    ("full jitter": a random delay between 0 and base_delay * 2 ** attempt, capped at max_delay).
+    """
+    def __init__(
+            self,
+            max_attempts: int = 3,
+            base_delay: float = 1.0,
+            max_delay: float = 30.0,
+            retry_on: Tuple[Type[BaseException], ...] = (Exception,)
+        ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+
+    def __repr__(self) -> str:
+        return f"RetryPolicy(max_attempts={self.max_attempts}, base_delay={self.base_delay})"
+
+    def delay(self, attempt: int) -> float:
+        """
+        Returns the backoff delay before retry number `attempt` (starting at 0).
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def call(self, func: Callable, *args, **kwargs):
+        """
+        Calls func, retrying on retry_on exceptions. The last exception is re-raised
+        once all attempts are used.
+        """
+        for attempt in range(self.max_attempts):
+            try:
+                return func(*args, **kwargs)
+
+            except self.retry_on:
+                if attempt == self.max_attempts - 1:
+                    raise
+                time.sleep(self.delay(attempt))
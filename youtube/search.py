@@ -1,11 +1,12 @@
-from tqdm import tqdm
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Literal, Union, List
-
-from googleapiclient.errors import HttpError
+from typing import Optional, Literal, Union, List, Tuple
 
 from .video import Video
 from .channel import Channel
+from .compact import VideoIds, ChannelIds
 from .content import YoutubeContent
 
 
@@ -16,9 +17,10 @@ class YouTubeSearch(YoutubeContent):
     specific keyword-based searches for videos and channels, gather top-ranking channels 
     based on recent video performance, and identify channels whose names exactly match given keywords.
     """
-    def __init__(self, keywords: list[str]):
+    def __init__(self, keywords: list[str], max_workers: int = 8):
         super().__init__()
         self.keywords = keywords
+        self.max_workers = max_workers
         self.quota_credits_used = 0
     
     def get_response(
@@ -30,10 +32,12 @@ class YouTubeSearch(YoutubeContent):
             max_results: int,
             published_after = None,
             region_code: Optional[str] = "US",
-            relevance_language: Optional[str] = "en"
+            relevance_language: Optional[str] = "en",
+            page_token: Optional[str] = None
             ):
         
-        return self.youtube.search().list(
+        return self._execute(
+                'search',
                 q=key,
                 type=type,
                 order=order_by,
@@ -41,8 +45,9 @@ class YouTubeSearch(YoutubeContent):
                 part=part,
                 maxResults=max_results,
                 regionCode=region_code, 
-                relevanceLanguage=relevance_language
-            ).execute()
+                relevanceLanguage=relevance_language,
+                pageToken=page_token
+            )
 
 
     def execute_search(
@@ -50,13 +55,18 @@ class YouTubeSearch(YoutubeContent):
             type: Literal["video", "channel", "playlist", "movie"], 
             max_results: int = 1, 
             published_after = None, 
-            order_by: Literal["viewCount", "relevance", "date"] = 'relevance'
-        ) -> Union[List[Video], List[Channel]]:
+            order_by: Literal["viewCount", "relevance", "date"] = 'relevance',
+            compact: bool = False
+        ) -> Union[List[Video], List[Channel], VideoIds, ChannelIds]:
         """
         Executes a search on YouTube based on given criteria (provided keywords). 
         Ability to specify number of results per term with max_results and publishing 
         timeframe thanks to published_after. Fetch results based on selected order method:
         view count, relevance and date. Currently only supports 'video' and 'channel' types.
+        Keywords are searched concurrently (max_workers), results keep the order of keywords and
+        max_results above 50 are fetched page by page. Results carry the fields of the search
+        snippet (title, channel ID, publication time), so reading them needs no further requests.
+        With compact=True results are returned as a memory-compact VideoIds / ChannelIds collection.
         """
 
         if type in ["playlist", "movie"]:
@@ -65,44 +75,109 @@ class YouTubeSearch(YoutubeContent):
         if type not in ["video", "channel"]:
             raise KeyError("Only types: 'video' and 'channel' are supported")
 
+        keyword_results = self._search_keywords(type, max_results, published_after, order_by)
+
         all_search_data = []
+        if compact:
+            all_search_data = VideoIds() if type == "video" else ChannelIds()
+
+        for _, items in keyword_results:
+            for item in items:
+                if compact:
+                    all_search_data.append(item['id'][f'{type}Id'])
+                elif type == "video":
+                    all_search_data.append(Video.from_search_result(item))
+                else:
+                    all_search_data.append(Channel.from_search_result(item))
 
-        for key in tqdm(self.keywords, desc="Collecting results for keyword..."):
-            try:
-                search_response = self.get_response(key, 'id, snippet', type, order_by, max_results, published_after)
+        return all_search_data
 
-                for item in search_response.get('items', []):
-                        result = item['id'][f'{type}Id']
-                        if type == "video": 
-                            all_search_data.append(Video(result))
-                        else: 
-                            all_search_data.append(Channel(result))
-            
-            except HttpError:
-                print("Quota limit reached!")
+    def _search_keywords(
+            self,
+            type: Literal["video", "channel"],
+            max_results: int,
+            published_after,
+            order_by: Literal["viewCount", "relevance", "date"]
+        ) -> List[Tuple[str, List[dict]]]:
+        """
+        Searches all keywords concurrently and returns (keyword, result items) pairs in the order
+        of keywords. Keywords that failed or were skipped once quota ran out have no items.
+        """
+        from tqdm import tqdm
+
+        # set once quota runs out, keywords that did not start yet are skipped
+        stop = threading.Event()
+
+        def search_keyword(key: str) -> list:
+            return self._fetch_guarded(
+                f"search for '{key}'",
+                stop,
+                lambda: self._search_keyword(key, type, max_results, published_after, order_by)
+            )
+
+        # workers run in a copy of the calling context, so they charge its quota run (QuotaScheduler.run)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(copy_context().run, search_keyword, key) for key in self.keywords]
+            for _ in tqdm(as_completed(futures), total=len(futures), desc="Collecting results for keyword..."):
+                pass
+
+        return [(key, future.result()) for key, future in zip(self.keywords, futures)]
+
+    def _search_keyword(
+            self,
+            key: str,
+            type: Literal["video", "channel"],
+            max_results: int,
+            published_after,
+            order_by: Literal["viewCount", "relevance", "date"]
+        ) -> List[dict]:
+        """
+        Returns up to max_results search result items of a single keyword, requesting
+        further pages (50 results each) while the API reports a next page.
+        """
+        items = []
+        page_token = None
+
+        while len(items) < max_results:
+            max_results_chunk = min(max_results - len(items), 50)
+            search_response = self.get_response(
+                key, 'id, snippet', type, order_by, max_results_chunk, published_after, page_token=page_token
+            )
+            items.extend(search_response.get('items', [])[:max_results_chunk])
+
+            page_token = search_response.get('nextPageToken')
+            if page_token is None:
                 break
 
-        return all_search_data
+        return items
 
     def collect_exact_terms(self) -> List[Channel]:
         """
         Searches for channels using keywords and returns channel IDs that exactly match the keywords.
         """
-        search_results = self.execute_search('channel')
+        # keywords stay paired with their own result, failed keywords have none
+        keyword_channels = [
+            (key, Channel.from_search_result(items[0]) if items else None)
+            for key, items in self._search_keywords('channel', 1, None, 'relevance')
+        ]
+
+        # names of all found channels are fetched in batches of 50, the returned channels
+        # keep the fetched details, so a following info() does not call the API again
+        found_channels = set(Channel.hydrate_many([channel for _, channel in keyword_channels if channel is not None]))
 
-        channel_ids = []
+        exact_channels = []
         not_found_keywords = []
 
-        for key, channel in zip(self.keywords, search_results):
-            if key.lower() == channel.channel_name.lower():
-                channel_ids.append(channel.channel_id)
+        for key, channel in keyword_channels:
+            if channel in found_channels and key.lower() == channel.channel_name.lower():
+                exact_channels.append(channel)
             else: 
                 not_found_keywords.append(key)
 
         if not_found_keywords:
             print(f'Warning: some of the provided keywords were not found: {not_found_keywords}')
         
-        return [Channel(id) for id in channel_ids]
+        return exact_channels
             
     def collect_best_ranking_channels(
             self, 
@@ -118,6 +193,8 @@ class YouTubeSearch(YoutubeContent):
         guarante general best ranking results.
         """
 
+        from tqdm import tqdm
+
         ranking_start_date = (datetime.now(timezone.utc) - timedelta(days=timeframe)).strftime("%Y-%m-%dT%H:%M:%SZ")
         best_ranking_videos = self.execute_search(type='video', max_results=max_results, published_after=ranking_start_date, order_by=order_by)
 
@@ -0,0 +1,409 @@
+import os
+import re
+import json
+import shutil
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .sinks import Sink
+from .transcript_store import NEGATIVE_RESULTS
+from .video import Video
+
+# weight of a term occurrence per record field, titles and tags describe a video best
+FIELD_WEIGHTS = {
+    'video_name': 3.0,
+    'user_tags': 2.0,
+    'description': 1.0,
+    'transcript': 1.0,
+}
+
+VIDEO_TYPES = ('unknown', 'shorts', 'video')
+
+TOKEN_PATTERN = re.compile(r'\w+')
+# longer tokens (URLs, hashes) are not indexed, terms are stored as fixed-width strings
+MAX_TERM_LENGTH = 32
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in TOKEN_PATTERN.findall(text.casefold()) if len(token) <= MAX_TERM_LENGTH]
+
+
+class SearchIndex(Sink):
+    """
+    Local full-text index of collected videos, built incrementally from VideoDataCollector records
+    (video_name, user_tags, description and transcript), queried with BM25 ranking and channel,
+    publication date and video type filters. Repeated discovery queries are answered locally
+    instead of spending 100 quota units per search.list call.
+
+    The index is a sink: records are buffered and every batch is written as an immutable segment
+    of sorted terms and postings (document keys and field-weighted term frequencies), read back
+    memory-mapped. A video indexed again is served from its newest segment only; merge() rewrites
+    all segments into one, dropping the outdated postings.
+
+    Layout of the index directory:
+        manifest.json            segments (name, documents, postings) in write order
+        video_ids.txt            video id per document key, append-only
+        channel_ids.txt          channel id per integer channel key, append-only
+        documents.npz            segment holding the current version of every document (-1 if none),
+                                 document length, channel key, publication day and video type
+        segments/<name>/         terms.npy (sorted), offsets.npy, documents.npy, weights.npy
+    """
+    def __init__(self, path: str, batch_size: int = 5000):
+        if np is None:
+            raise ImportError("SearchIndex requires numpy, install it with: pip install numpy")
+
+        super().__init__(batch_size)
+        self.path = path
+        os.makedirs(os.path.join(path, 'segments'), exist_ok=True)
+
+        self.segments = self._read_json('manifest.json', [])
+        self.video_ids = self._read_lines('video_ids.txt')
+        self.channel_ids = self._read_lines('channel_ids.txt')
+
+        self._video_keys = {video_id: key for key, video_id in enumerate(self.video_ids)}
+        self._channel_keys = {channel_id: key for key, channel_id in enumerate(self.channel_ids)}
+        self._loaded_segments = {}
+
+        documents = self._file('documents.npz')
+        if os.path.exists(documents):
+            with np.load(documents) as arrays:
+                self._documents = {name: arrays[name] for name in arrays.files}
+        else:
+            self._documents = {
+                'segment': np.zeros(0, dtype=np.int32),
+                'length': np.zeros(0, dtype=np.float32),
+                'channel': np.zeros(0, dtype=np.int32),
+                'published': np.zeros(0, dtype='datetime64[D]'),
+                'type': np.zeros(0, dtype=np.int8),
+            }
+
+    def __repr__(self) -> str:
+        return f"SearchIndex(path={self.path}, videos={len(self)}, segments={len(self.segments)})"
+
+    def __len__(self) -> int:
+        return int((self._documents['segment'] >= 0).sum())
+
+    # persistence
+
+    def _file(self, *names: str) -> str:
+        return os.path.join(self.path, *names)
+
+    def _read_json(self, name: str, default):
+        if not os.path.exists(self._file(name)):
+            return default
+        with open(self._file(name), 'r') as file:
+            return json.load(file)
+
+    def _read_lines(self, name: str) -> List[str]:
+        if not os.path.exists(self._file(name)):
+            return []
+        with open(self._file(name), 'r') as file:
+            return file.read().splitlines()
+
+    def _append_lines(self, name: str, lines: List[str]) -> None:
+        if lines:
+            with open(self._file(name), 'a') as file:
+                file.write('\n'.join(lines) + '\n')
+
+    def _save_state(self) -> None:
+        temporary_path = self._file('documents.tmp.npz')
+        np.savez(temporary_path, **self._documents)
+        os.replace(temporary_path, self._file('documents.npz'))
+
+        temporary_path = self._file('manifest.json.tmp')
+        with open(temporary_path, 'w') as file:
+            json.dump(self.segments, file)
+        os.replace(temporary_path, self._file('manifest.json'))
+
+    def _segment(self, position: int) -> Dict[str, "np.ndarray"]:
+        name = self.segments[position]['name']
+        if name not in self._loaded_segments:
+            directory = self._file('segments', name)
+            self._loaded_segments[name] = {
+                array: np.load(os.path.join(directory, f'{array}.npy'), mmap_mode='r')
+                for array in ('terms', 'offsets', 'documents', 'weights')
+            }
+        return self._loaded_segments[name]
+
+    def _next_segment_name(self) -> str:
+        return f"{max((int(segment['name']) for segment in self.segments), default=-1) + 1:06d}"
+
+    def _write_segment(
+            self,
+            terms: "np.ndarray",
+            offsets: "np.ndarray",
+            documents: "np.ndarray",
+            weights: "np.ndarray",
+            name: Optional[str] = None
+        ) -> int:
+        name = name or self._next_segment_name()
+        directory = self._file('segments', name)
+        os.makedirs(directory)
+
+        np.save(os.path.join(directory, 'terms.npy'), terms)
+        np.save(os.path.join(directory, 'offsets.npy'), offsets)
+        np.save(os.path.join(directory, 'documents.npy'), documents)
+        np.save(os.path.join(directory, 'weights.npy'), weights)
+
+        self.segments.append({"name": name, "documents": int(len(np.unique(documents))), "postings": int(len(documents))})
+        return len(self.segments) - 1
+
+    # keys
+
+    def _document_keys_for(self, video_ids: List[str]) -> "np.ndarray":
+        """
+        Returns document keys of the videos, assigning new keys to unknown ids.
+        """
+        new_ids = []
+        for video_id in video_ids:
+            if video_id not in self._video_keys:
+                self._video_keys[video_id] = len(self.video_ids)
+                self.video_ids.append(video_id)
+                new_ids.append(video_id)
+
+        if new_ids:
+            self._append_lines('video_ids.txt', new_ids)
+            grow = len(new_ids)
+            defaults = {'segment': -1, 'length': 0, 'channel': -1, 'published': np.datetime64('NaT'), 'type': 0}
+            for name, default in defaults.items():
+                column = self._documents[name]
+                self._documents[name] = np.concatenate([column, np.full(grow, default, dtype=column.dtype)])
+
+        return np.fromiter((self._video_keys[video_id] for video_id in video_ids), dtype=np.int64, count=len(video_ids))
+
+    def _channel_key(self, channel_id: Optional[str]) -> int:
+        if not channel_id or channel_id == 'Not Found':
+            return -1
+        if channel_id not in self._channel_keys:
+            self._channel_keys[channel_id] = len(self.channel_ids)
+            self.channel_ids.append(channel_id)
+            self._append_lines('channel_ids.txt', [channel_id])
+        return self._channel_keys[channel_id]
+
+    # indexing
+
+    @staticmethod
+    def _field_text(record: dict, field: str) -> str:
+        value = record.get(field)
+        if not value or value == 'Not Found' or (field == 'transcript' and value in NEGATIVE_RESULTS):
+            return ''
+        if isinstance(value, (list, tuple)):
+            return ' '.join(str(item) for item in value)
+        return str(value)
+
+    def _write_batch(self, records: List[dict]) -> None:
+        """
+        Indexes a batch of records as a new segment, the last record of a video wins.
+        """
+        records = list({record['video_id']: record for record in records}.values())
+        keys = self._document_keys_for([record['video_id'] for record in records])
+
+        # batch vocabulary (term -> id in order of appearance) and postings in document order
+        vocabulary = {}
+        term_ids, weights, sizes = [], [], []
+        lengths = np.zeros(len(records), dtype=np.float32)
+        for position, record in enumerate(records):
+            frequencies = Counter()
+            for field, weight in FIELD_WEIGHTS.items():
+                for token, count in Counter(tokenize(self._field_text(record, field))).items():
+                    frequencies[token] += weight * count
+
+            lengths[position] = sum(frequencies.values())
+            term_ids.extend(vocabulary.setdefault(term, len(vocabulary)) for term in frequencies)
+            weights.extend(frequencies.values())
+            sizes.append(len(frequencies))
+
+        # postings are sorted by term, then by document
+        terms = np.array(list(vocabulary), dtype=f'<U{MAX_TERM_LENGTH}')
+        term_order = np.argsort(terms)
+        term_ranks = np.empty(len(terms), dtype=np.int64)
+        term_ranks[term_order] = np.arange(len(terms))
+
+        ranks = term_ranks[np.array(term_ids, dtype=np.int64)]
+        documents = np.repeat(keys, sizes).astype(np.uint32)
+        order = np.lexsort((documents, ranks))
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(ranks, minlength=len(terms)))]).astype(np.int64)
+
+        segment = self._write_segment(
+            terms[term_order], offsets, documents[order], np.array(weights, dtype=np.float32)[order]
+        )
+
+        self._documents['segment'][keys] = segment
+        self._documents['length'][keys] = lengths
+        self._documents['channel'][keys] = [self._channel_key(record.get('channel_id')) for record in records]
+        self._documents['published'][keys] = [self._published_day(record.get('published_at')) for record in records]
+        self._documents['type'][keys] = [
+            VIDEO_TYPES.index(record.get('type')) if record.get('type') in VIDEO_TYPES else 0 for record in records
+        ]
+        self._save_state()
+
+    @staticmethod
+    def _published_day(published_at: Optional[str]) -> "np.datetime64":
+        try:
+            return np.datetime64(str(published_at)[:10], 'D')
+        except ValueError:
+            return np.datetime64('NaT')
+
+    def merge(self) -> None:
+        """
+        Rewrites all segments into a single one, dropping postings of outdated document versions.
+        """
+        self.flush()
+        if len(self.segments) <= 1:
+            return
+
+        current = self._documents['segment']
+        segment_terms, term_ids, documents, weights = [], [], [], []
+        for position in range(len(self.segments)):
+            segment = self._segment(position)
+            segment_terms.append(np.asarray(segment['terms']))
+
+            live = current[segment['documents']] == position
+            term_ids.append(np.repeat(np.arange(len(segment['terms'])), np.diff(segment['offsets']))[live])
+            documents.append(np.asarray(segment['documents'])[live])
+            weights.append(np.asarray(segment['weights'])[live])
+
+        # terms of every segment are mapped onto one sorted vocabulary
+        vocabulary = np.unique(np.concatenate(segment_terms))
+        term_ids = np.concatenate([
+            np.searchsorted(vocabulary, terms)[ids] for terms, ids in zip(segment_terms, term_ids)
+        ])
+        documents, weights = np.concatenate(documents), np.concatenate(weights)
+
+        order = np.lexsort((documents, term_ids))
+        term_ids, documents, weights = term_ids[order], documents[order], weights[order]
+        used, starts = np.unique(term_ids, return_index=True)
+        offsets = np.concatenate([starts, [len(term_ids)]]).astype(np.int64)
+
+        old_names = [segment['name'] for segment in self.segments]
+        name = self._next_segment_name()
+        self.segments = []
+        self._loaded_segments = {}
+        segment = self._write_segment(vocabulary[used], offsets, documents, weights, name)
+
+        self._documents['segment'][current >= 0] = segment
+        self._save_state()
+        for name in old_names:
+            shutil.rmtree(self._file('segments', name), ignore_errors=True)
+
+    # queries
+
+    def _postings(self, term: str):
+        """
+        Returns the document keys and weights of a term over all segments, current versions only.
+        """
+        current = self._documents['segment']
+        documents, weights = [], []
+        for position in range(len(self.segments)):
+            segment = self._segment(position)
+            index = int(np.searchsorted(segment['terms'], term))
+            if index == len(segment['terms']) or segment['terms'][index] != term:
+                continue
+
+            start, end = segment['offsets'][index], segment['offsets'][index + 1]
+            segment_documents = np.asarray(segment['documents'][start:end], dtype=np.int64)
+            live = current[segment_documents] == position
+            documents.append(segment_documents[live])
+            weights.append(np.asarray(segment['weights'][start:end])[live])
+
+        if not documents:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        return np.concatenate(documents), np.concatenate(weights)
+
+    def _filter(
+            self,
+            channel_ids: Optional[Iterable[str]],
+            published_after: Optional[str],
+            published_before: Optional[str],
+            type: Optional[str]
+        ) -> "np.ndarray":
+        mask = self._documents['segment'] >= 0
+        if channel_ids is not None:
+            channel_keys = [self._channel_keys[channel_id] for channel_id in channel_ids if channel_id in self._channel_keys]
+            mask &= np.isin(self._documents['channel'], channel_keys)
+        if published_after is not None:
+            mask &= self._documents['published'] >= np.datetime64(published_after[:10], 'D')
+        if published_before is not None:
+            mask &= self._documents['published'] < np.datetime64(published_before[:10], 'D')
+        if type is not None:
+            if type not in VIDEO_TYPES:
+                raise KeyError(f"Type must be one of: {VIDEO_TYPES}")
+            mask &= self._documents['type'] == VIDEO_TYPES.index(type)
+        return mask
+
+    def search(
+            self,
+            query: str,
+            max_results: int = 10,
+            channel_ids: Optional[Iterable[str]] = None,
+            published_after: Optional[str] = None,
+            published_before: Optional[str] = None,
+            type: Optional[str] = None
+        ) -> List[dict]:
+        """
+        Returns up to max_results videos best matching the query (BM25), optionally restricted to
+        channels, a publication window (published_after <= day < published_before, ISO dates)
+        and a video type ('shorts', 'video', 'unknown'). Hits are dicts with video_id, score,
+        channel_id, published_at and type.
+        """
+        if max_results <= 0:
+            return []
+
+        self.flush()
+        mask = self._filter(channel_ids, published_after, published_before, type)
+
+        live = self._documents['segment'] >= 0
+        n_documents = int(live.sum())
+        if not n_documents:
+            return []
+        lengths = self._documents['length']
+        average_length = max(float(lengths[live].mean()), 1.0)
+
+        scores = np.zeros(len(self.video_ids), dtype=np.float64)
+        for term in dict.fromkeys(tokenize(query)):
+            documents, frequencies = self._postings(term)
+            if not len(documents):
+                continue
+            # document frequency counts all current documents, filters apply to ranking only
+            idf = np.log(1 + (n_documents - len(documents) + 0.5) / (len(documents) + 0.5))
+            norms = K1 * (1 - B + B * lengths[documents] / average_length)
+            scores[documents] += idf * frequencies * (K1 + 1) / (frequencies + norms)
+
+        candidates = np.flatnonzero(mask & (scores > 0))
+        if len(candidates) > max_results:
+            candidates = candidates[np.argpartition(scores[candidates], -max_results)[-max_results:]]
+        candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+        hits = []
+        for key in candidates:
+            channel, published = self._documents['channel'][key], self._documents['published'][key]
+            hits.append({
+                "video_id": self.video_ids[key],
+                "score": float(scores[key]),
+                "channel_id": self.channel_ids[channel] if channel >= 0 else None,
+                "published_at": str(published) if not np.isnat(published) else None,
+                "type": VIDEO_TYPES[self._documents['type'][key]],
+            })
+        return hits
+
+    def search_videos(self, query: str, max_results: int = 10, **filters) -> List[Video]:
+        """
+        Same as search, but returns Video objects (like YouTubeSearch.execute_search)
+        carrying the channel id of the index. Indexed records only hold the publication day,
+        so Video.published_at (an RFC 3339 timestamp) is requested from the API when read.
+        """
+        videos = []
+        for hit in self.search(query, max_results, **filters):
+            video = Video(hit['video_id'])
+            video._channel_id = hit['channel_id']
+            videos.append(video)
+        return videos
@@ -0,0 +1,127 @@
+import csv
+import json
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+class Sink(ABC):
+    """
+    Abstract destination for collected records. Records are buffered and written in batches
+    of batch_size, so memory stays bounded no matter how many records a run produces.
+    Sinks are context managers: remaining records are flushed and files closed on exit.
+    """
+    def __init__(self, batch_size: int = 500):
+        self.batch_size = batch_size
+        self.records_written = 0
+        self._buffer = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, record: dict) -> None:
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, records: Iterable[dict]) -> int:
+        """
+        Consumes records (e.g. from VideoDataCollector.iter_* methods), returns how many were written.
+        """
+        count = 0
+        for record in records:
+            self.write(record)
+            count += 1
+        self.flush()
+        return count
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self.records_written += len(self._buffer)
+            self._buffer = []
+
+    @abstractmethod
+    def _write_batch(self, records: List[dict]) -> None:
+        """
+        Abstract method to be overridden by subclasses.
+        Writes a batch of records to the destination.
+        """
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class CsvSink(Sink):
+    """
+    Writes records to a CSV file. The header is taken from fieldnames or from the keys
+    of the first record, columns renames record keys in the header, e.g. {'length': 'video_length'}.
+    """
+    def __init__(
+            self,
+            path: str,
+            fieldnames: Optional[List[str]] = None,
+            batch_size: int = 500,
+            mode: str = 'w',
+            columns: Optional[Dict[str, str]] = None
+        ):
+        super().__init__(batch_size)
+        self.path = path
+        self.fieldnames = fieldnames
+        self.columns = columns or {}
+
+        self._file = open(path, mode, newline='')
+        self._writer = None
+
+    def __repr__(self) -> str:
+        return f"CsvSink(path={self.path})"
+
+    def _write_batch(self, records: List[dict]) -> None:
+        if self._writer is None:
+            self.fieldnames = self.fieldnames or list(records[0])
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction='ignore')
+            if self._file.tell() == 0:
+                self._writer.writer.writerow([self.columns.get(name, name) for name in self.fieldnames])
+
+        self._writer.writerows(records)
+        self._file.flush()
+
+    def close(self) -> None:
+        super().close()
+        self._file.close()
+
+
+class JsonlSink(Sink):
+    """
+    Writes records to a JSON Lines file, one record per line.
+    """
+    def __init__(self, path: str, batch_size: int = 500, mode: str = 'w'):
+        super().__init__(batch_size)
+        self.path = path
+        self._file = open(path, mode, encoding='utf-8')
+
+    def __repr__(self) -> str:
+        return f"JsonlSink(path={self.path})"
+
+    def _write_batch(self, records: List[dict]) -> None:
+        self._file.writelines(json.dumps(record, ensure_ascii=False, default=str) + '\n' for record in records)
+        self._file.flush()
+
+    def close(self) -> None:
+        super().close()
+        self._file.close()
+
+
+class CallbackSink(Sink):
+    """
+    Passes each batch of records to a callback, e.g. a database or BigQuery insert.
+    """
+    def __init__(self, callback: Callable[[List[dict]], None], batch_size: int = 500):
+        super().__init__(batch_size)
+        self.callback = callback
+
+    def _write_batch(self, records: List[dict]) -> None:
+        self.callback(records)
@@ -0,0 +1,300 @@
+import os
+import json
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+METRICS = ('views', 'likes', 'comments')
+
+
+class StatisticsStore:
+    """
+    Compact, append-only store of daily video statistics snapshots (as produced by
+    Video.get_video_statistics). Video ids are mapped to integer keys, and each append is written
+    as a segment of typed NumPy arrays holding the keys and the delta of every counter against the
+    previous snapshot of the same video. Segments are memory-mapped on read, so growth queries
+    (views velocity, top-N growth over a window, per-channel rollups) are vectorized and never
+    load the history into Python objects.
+
+    Layout of the store directory:
+        manifest.json            segments (name, day, rows) in append order
+        video_ids.txt            video id per integer key
+        channel_ids.txt          channel id per integer channel key
+        latest.npy               last known counters per video key (int64, keys x metrics)
+        seen.npy                 whether a video key has a snapshot yet
+        video_channels.npy       channel key per video key (-1 if unknown)
+        segments/<name>/         keys.npy, initial.npy and one delta array per metric
+
+    Every file is replaced atomically (written to a temporary file, then renamed), ids before the
+    arrays and the manifest, so an interrupted write never leaves keys without an id. Ids saved
+    ahead of the arrays are padded as unseen videos when the store is opened.
+    """
+    def __init__(self, path: str):
+        if np is None:
+            raise ImportError("StatisticsStore requires numpy, install it with: pip install numpy")
+
+        self.path = path
+        os.makedirs(os.path.join(path, 'segments'), exist_ok=True)
+
+        self.segments = self._read_json('manifest.json', [])
+        self.video_ids = self._read_lines('video_ids.txt')
+        self.channel_ids = self._read_lines('channel_ids.txt')
+
+        self._video_keys = {video_id: key for key, video_id in enumerate(self.video_ids)}
+        self._channel_keys = {channel_id: key for key, channel_id in enumerate(self.channel_ids)}
+
+        self._latest = self._read_array('latest.npy', np.zeros((0, len(METRICS)), dtype=np.int64))
+        self._seen = self._read_array('seen.npy', np.zeros(0, dtype=bool))
+        self._video_channels = self._read_array('video_channels.npy', np.zeros(0, dtype=np.int32))
+        self._grow(len(self.video_ids) - len(self._latest))
+
+    def __repr__(self) -> str:
+        return f"StatisticsStore(path={self.path}, videos={len(self)}, days={len(self.days)})"
+
+    def __len__(self) -> int:
+        return len(self.video_ids)
+
+    @property
+    def days(self) -> List[str]:
+        """
+        Days with at least one snapshot, in ascending order.
+        """
+        return sorted({segment['day'] for segment in self.segments})
+
+    # persistence
+
+    def _file(self, *names: str) -> str:
+        return os.path.join(self.path, *names)
+
+    def _read_json(self, name: str, default):
+        if not os.path.exists(self._file(name)):
+            return default
+        with open(self._file(name), 'r') as file:
+            return json.load(file)
+
+    def _read_lines(self, name: str) -> List[str]:
+        if not os.path.exists(self._file(name)):
+            return []
+        with open(self._file(name), 'r') as file:
+            return file.read().splitlines()
+
+    def _read_array(self, name: str, default: "np.ndarray") -> "np.ndarray":
+        if not os.path.exists(self._file(name)):
+            return default
+        return np.load(self._file(name))
+
+    def _replace(self, name: str, write, mode: str = 'w') -> None:
+        """
+        Writes a file through write(file) to a temporary file and renames it over the old one.
+        """
+        temporary_path = self._file(f'{name}.tmp')
+        with open(temporary_path, mode) as file:
+            write(file)
+        os.replace(temporary_path, self._file(name))
+
+    def _save_state(self) -> None:
+        for name, ids in (('video_ids.txt', self.video_ids), ('channel_ids.txt', self.channel_ids)):
+            self._replace(name, lambda file: file.writelines(f'{content_id}\n' for content_id in ids))
+
+        for name, array in (('latest.npy', self._latest), ('seen.npy', self._seen), ('video_channels.npy', self._video_channels)):
+            self._replace(name, lambda file: np.save(file, array), mode='wb')
+
+        self._replace('manifest.json', lambda file: json.dump(self.segments, file))
+
+    # keys
+
+    def _video_keys_for(self, video_ids: List[str]) -> "np.ndarray":
+        """
+        Returns integer keys of the videos, assigning new keys to unknown ids.
+        """
+        known = len(self.video_ids)
+        for video_id in video_ids:
+            if video_id not in self._video_keys:
+                self._video_keys[video_id] = len(self.video_ids)
+                self.video_ids.append(video_id)
+
+        self._grow(len(self.video_ids) - known)
+        return np.fromiter((self._video_keys[video_id] for video_id in video_ids), dtype=np.uint32, count=len(video_ids))
+
+    def _grow(self, grow: int) -> None:
+        """
+        Adds grow unseen videos (without a channel) to the state arrays.
+        """
+        if grow > 0:
+            self._latest = np.vstack([self._latest, np.zeros((grow, len(METRICS)), dtype=np.int64)])
+            self._seen = np.concatenate([self._seen, np.zeros(grow, dtype=bool)])
+            self._video_channels = np.concatenate([self._video_channels, np.full(grow, -1, dtype=np.int32)])
+
+    def set_channels(self, video_channels: Dict[str, str]) -> None:
+        """
+        Assigns videos to channels (video id -> channel id) for per-channel rollups,
+        e.g. from the video_id / channel_id fields of Video.get_video_properties records.
+        """
+        new_ids = [channel_id for channel_id in dict.fromkeys(video_channels.values()) if channel_id not in self._channel_keys]
+        for channel_id in new_ids:
+            self._channel_keys[channel_id] = len(self.channel_ids)
+            self.channel_ids.append(channel_id)
+
+        keys = self._video_keys_for(list(video_channels))
+        self._video_channels[keys] = [self._channel_keys[channel_id] for channel_id in video_channels.values()]
+        self._save_state()
+
+    # writes
+
+    def append(self, records: Iterable[dict]) -> int:
+        """
+        Appends statistics records ({"date", "video_id", "views", "likes", "comments"}),
+        one segment per day present in the records. Returns the number of rows written.
+        """
+        by_day = {}
+        for record in records:
+            by_day.setdefault(record['date'], []).append(record)
+
+        rows = 0
+        for day in sorted(by_day):
+            day_records = by_day[day]
+            counters = np.array(
+                [[int(record.get(metric) or 0) for metric in METRICS] for record in day_records], dtype=np.int64
+            )
+            rows += self.append_day(day, [record['video_id'] for record in day_records], counters)
+        return rows
+
+    def append_day(self, day: str, video_ids: List[str], counters: "np.ndarray") -> int:
+        """
+        Appends one snapshot segment: counters is an (n, 3) array of views, likes and comments.
+        Days must not go back in time; several segments of the same day are allowed.
+        """
+        date.fromisoformat(day)
+        if self.segments and day < self.segments[-1]['day']:
+            raise ValueError(f"Snapshots are append-only, {day} is older than the last day {self.segments[-1]['day']}.")
+
+        keys = self._video_keys_for(list(video_ids))
+        counters = np.asarray(counters, dtype=np.int64).reshape(len(keys), len(METRICS))
+
+        # the last snapshot of a video wins if it appears more than once
+        _, last = np.unique(keys[::-1], return_index=True)
+        index = np.sort(len(keys) - 1 - last)
+        keys, counters = keys[index], counters[index]
+
+        deltas = counters - self._latest[keys]
+        initial = ~self._seen[keys]
+        self._latest[keys] = counters
+        self._seen[keys] = True
+
+        name = f"{day}-{len(self.segments):06d}"
+        directory = self._file('segments', name)
+        os.makedirs(directory, exist_ok=True)
+
+        np.save(os.path.join(directory, 'keys.npy'), keys)
+        np.save(os.path.join(directory, 'initial.npy'), initial)
+        for position, metric in enumerate(METRICS):
+            np.save(os.path.join(directory, f'{metric}.npy'), self._compact(deltas[:, position]))
+
+        self.segments.append({"name": name, "day": day, "rows": int(len(keys))})
+        self._save_state()
+        return int(len(keys))
+
+    @staticmethod
+    def _compact(deltas: "np.ndarray") -> "np.ndarray":
+        """
+        Stores deltas as int32 when they fit, which halves the size of typical segments.
+        """
+        limits = np.iinfo(np.int32)
+        if not len(deltas) or (deltas.min() >= limits.min and deltas.max() <= limits.max):
+            return deltas.astype(np.int32)
+        return deltas
+
+    # queries
+
+    def _segment(self, segment: dict, name: str) -> "np.ndarray":
+        return np.load(self._file('segments', segment['name'], f'{name}.npy'), mmap_mode='r')
+
+    def _window(self, start: Optional[str], end: Optional[str]) -> List[dict]:
+        return [
+            segment for segment in self.segments
+            if (start is None or segment['day'] > start) and (end is None or segment['day'] <= end)
+        ]
+
+    def growth(self, metric: str = 'views', start: Optional[str] = None, end: Optional[str] = None) -> "np.ndarray":
+        """
+        Returns the growth of the metric per video key over the window (start, end].
+        First snapshots of a video do not count as growth.
+        """
+        if metric not in METRICS:
+            raise KeyError(f"Metric must be one of: {METRICS}")
+
+        total = np.zeros(len(self.video_ids), dtype=np.int64)
+        for segment in self._window(start, end):
+            keys = self._segment(segment, 'keys')
+            growing = ~self._segment(segment, 'initial')
+            total[keys[growing]] += self._segment(segment, metric)[growing]
+        return total
+
+    def velocity(self, metric: str = 'views', start: Optional[str] = None, end: Optional[str] = None) -> "np.ndarray":
+        """
+        Returns the average daily growth of the metric per video key over the window (start, end].
+        """
+        days = self.days
+        start = start or (days[0] if days else None)
+        end = end or (days[-1] if days else None)
+        if start is None or end is None or end <= start:
+            return np.zeros(len(self.video_ids), dtype=np.float64)
+
+        n_days = (date.fromisoformat(end) - date.fromisoformat(start)).days
+        return self.growth(metric, start, end) / n_days
+
+    def top_growth(
+            self,
+            n: int = 10,
+            metric: str = 'views',
+            start: Optional[str] = None,
+            end: Optional[str] = None
+        ) -> List[Tuple[str, int]]:
+        """
+        Returns the n videos with the largest growth over the window, as (video_id, growth) pairs.
+        """
+        growth = self.growth(metric, start, end)
+        n = min(n, len(growth))
+        if n == 0:
+            return []
+
+        top = np.argpartition(growth, -n)[-n:]
+        top = top[np.argsort(growth[top])[::-1]]
+        return [(self.video_ids[key], int(growth[key])) for key in top]
+
+    def channel_rollup(self, metric: str = 'views', start: Optional[str] = None, end: Optional[str] = None) -> Dict[str, int]:
+        """
+        Returns the growth of the metric summed per channel (see set_channels) over the window.
+        """
+        growth = self.growth(metric, start, end)
+        known = self._video_channels >= 0
+        # accumulated in int64, bincount weights would sum in float64 and round large counts
+        totals = np.zeros(len(self.channel_ids), dtype=np.int64)
+        np.add.at(totals, self._video_channels[known], growth[known])
+        return {channel_id: int(total) for channel_id, total in zip(self.channel_ids, totals)}
+
+    def latest(self, video_id: str) -> Dict[str, int]:
+        """
+        Returns the last known counters of the video.
+        """
+        counters = self._latest[self._video_keys[video_id]]
+        return {metric: int(value) for metric, value in zip(METRICS, counters)}
+
+    def history(self, video_id: str, metric: str = 'views') -> List[Tuple[str, int]]:
+        """
+        Reconstructs (day, value) snapshots of a single video from the delta segments.
+        """
+        key = self._video_keys[video_id]
+
+        value, history = 0, []
+        for segment in self.segments:
+            # keys are unique within a segment
+            match = np.flatnonzero(self._segment(segment, 'keys') == key)
+            if len(match):
+                value += int(self._segment(segment, metric)[match[0]])
+                history.append((segment['day'], value))
+        return history
@@ -0,0 +1,235 @@
+import gzip
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import List, Optional, Tuple
+
+from .cache import DAY
+
+# markers returned by Video.get_video_transcript for videos without a transcript
+NEGATIVE_RESULTS = ('transcript-disabled', 'transcript-not-found', 'transcript-unavailable')
+
+CODECS = ('zstd', 'gzip')
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+class TranscriptStore:
+    """
+    Persistent SQLite store of video transcripts keyed by video id and language, so repeated crawls
+    do not scrape them again. Transcripts are content-addressed: the text and the timing of its
+    segments are compressed (zstd, or gzip without the zstandard package) and stored once per
+    distinct content, identified by its SHA-256 digest. Negative results (transcripts disabled,
+    not found, video unavailable) are remembered too, but expire after negative_ttl seconds,
+    since captions may be added later. Transcripts themselves never expire.
+    """
+    def __init__(
+            self,
+            path: str = 'youtube-transcripts.sqlite',
+            negative_ttl: Optional[float] = 7 * DAY,
+            compression: Optional[str] = None,
+            level: int = 3
+        ):
+        if compression is None:
+            compression = 'zstd' if _zstandard() is not None else 'gzip'
+        if compression not in CODECS:
+            raise ValueError(f"Unsupported compression {compression}, use one of: {', '.join(CODECS)}")
+        if compression == 'zstd' and _zstandard() is None:
+            raise ImportError("zstd compression requires zstandard, install it with: pip install zstandard")
+
+        self.path = path
+        self.negative_ttl = negative_ttl
+        self.compression = compression
+        self.level = level
+
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS transcripts ("
+            "video_id TEXT, language TEXT, status TEXT, digest TEXT, fetched_at REAL, expires_at REAL, "
+            "PRIMARY KEY (video_id, language))"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS contents ("
+            "digest TEXT PRIMARY KEY, codec TEXT, body BLOB, size INTEGER, raw_size INTEGER)"
+        )
+
+    def __repr__(self) -> str:
+        return f"TranscriptStore(path={self.path})"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM transcripts").fetchone()[0]
+
+    # compression
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == 'zstd':
+            return _zstandard().ZstdCompressor(level=self.level).compress(data)
+        return gzip.compress(data, compresslevel=min(self.level * 2, 9))
+
+    @staticmethod
+    def _decompress(codec: str, body: bytes) -> bytes:
+        if codec == 'zstd':
+            zstandard = _zstandard()
+            if zstandard is None:
+                raise ImportError("Transcript was stored with zstd, install zstandard to read it: pip install zstandard")
+            return zstandard.ZstdDecompressor().decompress(body)
+        return gzip.decompress(body)
+
+    @staticmethod
+    def _payload(transcript: dict) -> bytes:
+        """
+        Serializes the text and the timing of its segments. The text is kept once, segments refer
+        to it by end offset: [start, duration, end] with segment texts joined by single spaces.
+        """
+        segments, position = [], 0
+        for segment in transcript.get('segments') or []:
+            end = position + len(segment['text'])
+            segments.append([segment['start'], segment['duration'], end])
+            position = end + 1
+
+        return json.dumps({"text": transcript['transcript'], "segments": segments}, ensure_ascii=False).encode('utf-8')
+
+    # reading
+
+    def _lookup(self, video_id: str, language: str) -> Optional[Tuple[str, Optional[dict]]]:
+        """
+        Returns the status and payload of a stored transcript, None if it is missing or expired.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT t.status, t.expires_at, c.codec, c.body FROM transcripts t "
+                "LEFT JOIN contents c ON c.digest = t.digest WHERE t.video_id = ? AND t.language = ?",
+                (video_id, language)
+            ).fetchone()
+
+            if row is None or (row[1] is not None and row[1] < time.time()):
+                self.misses += 1
+                return None
+
+            status, _, codec, body = row
+            if status != 'ok':
+                self.negative_hits += 1
+                return status, None
+            self.hits += 1
+
+        return status, json.loads(self._decompress(codec, body))
+
+    def get(self, video_id: str, language: str = 'en') -> Optional[dict]:
+        """
+        Returns the stored transcript as {"transcript": ...}, like Video.get_video_transcript
+        (including its negative results), or None if it is missing or expired.
+        """
+        stored = self._lookup(video_id, language)
+        if stored is None:
+            return None
+
+        status, payload = stored
+        return {"transcript": payload['text'] if payload is not None else status}
+
+    def get_segments(self, video_id: str, language: str = 'en') -> Optional[List[dict]]:
+        """
+        Returns the timed segments ({"text", "start", "duration"}) of a stored transcript, None if
+        it is missing, expired or negative. Transcripts stored without timing have no segments.
+        """
+        stored = self._lookup(video_id, language)
+        if stored is None or stored[1] is None:
+            return None
+
+        text, segments, start = stored[1]['text'], [], 0
+        for segment_start, duration, end in stored[1]['segments']:
+            segments.append({"text": text[start:end], "start": segment_start, "duration": duration})
+            start = end + 1
+        return segments
+
+    # writing
+
+    def put(self, video_id: str, transcript: dict, language: str = 'en') -> None:
+        """
+        Stores a result of Video.get_video_transcript, with its segments when fetched
+        with with_segments=True. Negative results expire after negative_ttl.
+        """
+        now = time.time()
+        status = transcript['transcript'] if transcript['transcript'] in NEGATIVE_RESULTS else 'ok'
+
+        if status != 'ok':
+            if not self.negative_ttl:
+                return
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?, NULL, ?, ?)",
+                    (video_id, language, status, now, now + self.negative_ttl)
+                )
+            return
+
+        payload = self._payload(transcript)
+        digest = hashlib.sha256(payload).hexdigest()
+
+        with self._lock:
+            known = self._connection.execute("SELECT 1 FROM contents WHERE digest = ?", (digest,)).fetchone()
+            if known is None:
+                body = self._compress(payload)
+                self._connection.execute(
+                    "INSERT INTO contents VALUES (?, ?, ?, ?, ?)",
+                    (digest, self.compression, body, len(body), len(payload))
+                )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO transcripts VALUES (?, ?, 'ok', ?, ?, NULL)",
+                (video_id, language, digest, now)
+            )
+
+    def purge(self) -> int:
+        """
+        Removes expired negative results and contents no longer referenced by any transcript.
+        Returns the number of removed transcripts.
+        """
+        with self._lock:
+            removed = self._connection.execute(
+                "DELETE FROM transcripts WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),)
+            ).rowcount
+            self._connection.execute(
+                "DELETE FROM contents WHERE digest NOT IN (SELECT digest FROM transcripts WHERE digest IS NOT NULL)"
+            )
+        return removed
+
+    def stats(self) -> dict:
+        """
+        Returns hit / miss counters, the hit rate and the compression ratio of stored contents.
+        """
+        with self._lock:
+            transcripts, negatives = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(status != 'ok'), 0) FROM transcripts"
+            ).fetchone()
+            contents, size, raw_size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(raw_size), 0) FROM contents"
+            ).fetchone()
+
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+            "transcripts": transcripts,
+            "negative_results": negatives,
+            "contents": contents,
+            "stored_bytes": size,
+            "compression_ratio": raw_size / size if size else 0.0,
+        }
+
+    def close(self) -> None:
+        self._connection.close()
@@ -0,0 +1,115 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional
+from .metrics import metrics
+from .ratelimit import HostRateLimiter
+from .retry import RetryPolicy
+from .transcript_store import TranscriptStore
+from .video import Video
+
+# transcripts are scraped from the watch page, not served by the Data API
+TRANSCRIPT_HOST = 'www.youtube.com'
+
+
+class TranscriptFetcher:
+    """
+    Fetches video transcripts in a bounded thread pool. Transcript scraping does not use API quota
+    but is slow, so requests run in parallel, rate limited per host, and the rare connection errors
+    (raised as ValueError by Video.get_video_transcript) are retried with backoff.
+    The provider can be replaced, e.g. with a stub returning canned transcripts.
+    With a TranscriptStore, stored transcripts (and unexpired negative results) are served without
+    scraping, and scraped ones are stored together with their segment timing.
+    """
+    def __init__(
+            self,
+            max_workers: int = 8,
+            requests_per_second: float = 10.0,
+            retry: Optional[RetryPolicy] = None,
+            provider: Optional[Callable[[Video], dict]] = None,
+            store: Optional[TranscriptStore] = None,
+            language: str = 'en'
+        ):
+        self.max_workers = max_workers
+        self.retry = retry or RetryPolicy(max_attempts=3, base_delay=1.0, retry_on=(ValueError,))
+        self.provider = provider or self._scrape
+        self.store = store
+        self.language = language
+
+        self._limiter = HostRateLimiter(requests_per_second)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='transcripts')
+
+    def __repr__(self) -> str:
+        return f"TranscriptFetcher(max_workers={self.max_workers})"
+
+    def __enter__(self) -> "TranscriptFetcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def fetch(self, video: Video) -> dict:
+        """
+        Fetches the transcript of a single video in the calling thread,
+        from the transcript store when it is already known.
+        """
+        if self.store is None:
+            return self._fetch_timed(video)
+
+        transcript = self.store.get(video.video_id, self.language)
+        if transcript is not None:
+            if metrics.enabled:
+                metrics.count_cache_hit('transcripts')
+            return transcript
+
+        transcript = self._fetch_timed(video)
+        self.store.put(video.video_id, transcript, self.language)
+        # segments are kept in the store only, records carry the text
+        return {"transcript": transcript['transcript']}
+
+    def _fetch_timed(self, video: Video) -> dict:
+        if not metrics.enabled:
+            return self.retry.call(self._fetch_once, video)
+
+        start_time = time.perf_counter()
+        try:
+            transcript = self.retry.call(self._fetch_once, video)
+        except ValueError:
+            metrics.observe_transcript(time.perf_counter() - start_time, 'error')
+            raise
+
+        metrics.observe_transcript(time.perf_counter() - start_time, 'ok')
+        return transcript
+
+    def _scrape(self, video: Video) -> dict:
+        return video.get_video_transcript(languages=(self.language,), with_segments=self.store is not None)
+
+    def _fetch_once(self, video: Video) -> dict:
+        self._limiter.acquire(TRANSCRIPT_HOST)
+        return self.provider(video)
+
+    def submit(self, video: Video) -> Future:
+        """
+        Schedules the transcript of the video, returns a future resolving to {"transcript": ...}.
+        """
+        return self._executor.submit(self.fetch, video)
+
+    def fetch_many(self, videos: Iterable[Video]) -> List[Optional[dict]]:
+        """
+        Fetches transcripts of many videos in parallel, preserving order.
+        Videos whose transcript still fails after retries get None.
+        """
+        futures = [self.submit(video) for video in videos]
+        return [self.result(future) for future in futures]
+
+    @staticmethod
+    def result(future: Future) -> Optional[dict]:
+        """
+        Returns the transcript of a submitted video or None if it could not be extracted.
+        """
+        try:
+            return future.result()
+        except ValueError:
+            return None
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
@@ -1,4 +1,141 @@
-# TODO: write class for trending content
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import datetime, timezone
+from itertools import product
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-class YoutubeTrending:
-    pass
\ No newline at end of file
+from .video import Video, PROPERTIES_PARTS, STATISTICS_PARTS
+from .content import YoutubeContent
+
+TRENDING_PARTS = f"{PROPERTIES_PARTS}, {STATISTICS_PARTS}"
+
+
+class TrendingSnapshot(NamedTuple):
+    """
+    Trending videos captured at one point in time. Every video appears once, with its rank
+    in each chart it trends in, e.g. {'US': 3, 'GB': 12} (or {'US:10': 1} per category).
+    charts maps every requested chart to the number of videos it returned.
+    """
+    captured_at: str
+    videos: List[dict]
+    charts: Dict[str, int]
+
+
+class YoutubeTrending(YoutubeContent):
+    """
+    Captures the most popular videos (videos.list with chart='mostPopular') of many regions and
+    video categories concurrently. Snippet, contentDetails, status and statistics come with the
+    chart itself, so records are parsed from the chart pages without any per-video requests.
+    """
+    def __init__(
+            self,
+            region_codes: List[str],
+            category_ids: Optional[List[str]] = None,
+            max_workers: int = 8
+        ):
+        super().__init__()
+        self.region_codes = region_codes
+        self.category_ids = category_ids
+        self.max_workers = max_workers
+
+    def __repr__(self):
+        return f"YoutubeTrending(region_codes={self.region_codes}, category_ids={self.category_ids})"
+
+    def get_response(
+            self,
+            region_code: str,
+            part: str,
+            category_id: Optional[str] = None,
+            max_results: int = 50,
+            page_token: Optional[str] = None
+        ):
+
+        return self._execute(
+                'videos',
+                part=part,
+                chart='mostPopular',
+                regionCode=region_code,
+                videoCategoryId=category_id,
+                maxResults=max_results,
+                pageToken=page_token
+            )
+
+    @property
+    def charts(self) -> List[Tuple[str, Optional[str]]]:
+        """
+        Requested (region code, category id) pairs, category None for all categories.
+        """
+        return list(product(self.region_codes, self.category_ids or [None]))
+
+    @staticmethod
+    def chart_name(region_code: str, category_id: Optional[str] = None) -> str:
+        return region_code if category_id is None else f"{region_code}:{category_id}"
+
+    def get_trending_snapshot(self, max_results: int = 200) -> TrendingSnapshot:
+        """
+        Fetches up to max_results videos of every chart (the API serves at most 200 per chart),
+        page by page, with charts requested concurrently (max_workers). Videos trending in several
+        charts are merged into a single record (video properties and statistics, like
+        VideoDataCollector records) with a rank per chart and the capture time of the snapshot.
+        Charts that fail (e.g. a category not available in a region) are skipped with a warning.
+        """
+        captured_at = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+        # set once quota runs out, charts that did not start yet are skipped
+        stop = threading.Event()
+
+        def fetch_chart(region_code: str, category_id: Optional[str]) -> list:
+            return self._fetch_guarded(
+                f"trending chart '{self.chart_name(region_code, category_id)}'",
+                stop,
+                lambda: self._fetch_chart(region_code, category_id, max_results)
+            )
+
+        charts = self.charts
+        # workers run in a copy of the calling context, so they charge its quota run (QuotaScheduler.run)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(copy_context().run, fetch_chart, region_code, category_id) for region_code, category_id in charts]
+
+        records = {}
+        chart_sizes = {}
+        for (region_code, category_id), future in zip(charts, futures):
+            name = self.chart_name(region_code, category_id)
+            items = future.result()
+            chart_sizes[name] = len(items)
+
+            for rank, item in enumerate(items, start=1):
+                if item['id'] not in records:
+                    records[item['id']] = self._parse_item(item) | {"captured_at": captured_at, "ranks": {}}
+                records[item['id']]["ranks"][name] = rank
+
+        return TrendingSnapshot(captured_at, list(records.values()), chart_sizes)
+
+    def _fetch_chart(self, region_code: str, category_id: Optional[str], max_results: int) -> List[dict]:
+        """
+        Returns up to max_results items of a single chart, requesting further pages
+        (50 videos each) while the API reports a next page.
+        """
+        items = []
+        page_token = None
+
+        while len(items) < max_results:
+            max_results_chunk = min(max_results - len(items), 50)
+            response = self.get_response(region_code, TRENDING_PARTS, category_id, max_results_chunk, page_token)
+            items.extend(response.get('items', [])[:max_results_chunk])
+
+            page_token = response.get('nextPageToken')
+            if page_token is None:
+                break
+
+        return items
+
+    @staticmethod
+    def _parse_item(item: dict) -> dict:
+        """
+        Parses a chart item into a video record, the parts are stored on the Video
+        so get_video_properties / get_video_statistics do not call the API.
+        """
+        video = Video(item['id'])
+        video._store_item(item, YoutubeContent._split_parts(TRENDING_PARTS))
+        return video.get_video_properties() | video.get_video_statistics()
@@ -1,10 +1,20 @@
 import re
-from dateutil.parser import parse
-from datetime import datetime
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
+import html
+from datetime import date, datetime
+from typing import Iterable, List, Optional, Sequence
 from .content import YoutubeContent
 
+PROPERTIES_PARTS = 'contentDetails, snippet, status'
+STATISTICS_PARTS = 'statistics'
+
+# videos up to this length (seconds) are classified as shorts
+SHORTS_MAX_LENGTH = 60
+
+# ISO 8601 durations as used by contentDetails.duration, e.g. PT1H2M3S, P1DT2H, P0D
+DURATION_PATTERN = re.compile(r'P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)(?:\.\d+)?S)?)?$')
+# date part of an RFC 3339 timestamp, e.g. 2024-01-15T12:00:00Z
+RFC3339_DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}[Tt ]')
+
 
 class Video(YoutubeContent):
     """
@@ -12,17 +22,32 @@ class Video(YoutubeContent):
     Functionality to extract static video properties, statisitcs and transcript.
     """
     
-    def __init__(self, video_id:str) -> None:
+    def __init__(self, video_id:str, published_at: Optional[str] = None) -> None:
         super().__init__()
         self.video_id = video_id
       
         self._video_name = None 
         self._video_length = None 
         self._channel_id = None
+        self._published_at = published_at
 
     def __repr__(self):
         return f"Video(video_id={self.video_id})"
 
+    @classmethod
+    def from_search_result(cls, item: dict) -> "Video":
+        """
+        Creates a video from a search.list result item, keeping the snippet fields it carries
+        (title, channel ID, publication time), so that they are not requested again.
+        """
+        snippet = item.get('snippet', {})
+        video = cls(item['id']['videoId'], published_at=snippet.get('publishedAt'))
+        video._channel_id = snippet.get('channelId')
+        if 'title' in snippet:
+            # search snippets are HTML-escaped, unlike videos.list snippets
+            video._video_name = html.unescape(snippet['title'])
+        return video
+
     def __eq__(self, other):
         if isinstance(other, Video):
             return self.video_id == other.video_id
@@ -55,26 +80,50 @@ class Video(YoutubeContent):
             self._channel_id= self.get_video_properties()['channel_id']
         return self._channel_id
     
+    @property
+    def published_at(self) -> str:
+        """
+        Publication timestamp of the video (RFC 3339, as returned by the API). 
+        Known without a request for videos listed from a playlist, otherwise lazily loaded.
+        """
+        if self._published_at is None:
+            self._published_at = self._get_item(self.video_id, PROPERTIES_PARTS)['snippet']['publishedAt']
+        return self._published_at
+
     def get_response(self, video_id: str, part: str):
-        return self.youtube.videos().list(
+        return self._execute(
+            'videos',
             part=part,
             id=video_id
-        ).execute()
-    
+        )
+
+    @classmethod
+    def hydrate_many(cls, videos: Iterable["Video"], parts: str = PROPERTIES_PARTS) -> List["Video"]:
+        """
+        Fetches the given parts for many videos at once, sending one videos.list request 
+        per 50 ids instead of one per video. Responses are cached on each Video, so subsequent 
+        get_video_properties / get_video_statistics calls do not hit the API again.
+        Returns the videos found by the API (deleted or private videos are left out).
+        """
+        return cls._hydrate_many(videos, parts, lambda video: video.video_id)
+
     def get_video_properties(self) -> dict:
         """
         Fetch and return detailed properties of the video, including its name, channel, 
         publication date, length, type, license, etc.
         """
-        response = self.get_response(self.video_id, 'contentDetails, snippet, status')
+        if 'properties' in self._parsed:
+            return dict(self._parsed['properties'])
+
+        item = self._get_item(self.video_id, PROPERTIES_PARTS)
 
         # processing video length
-        duration = response['items'][0].get('contentDetails', {}).get('duration', 'Not Found')
+        duration = item['contentDetails'].get('duration', 'Not Found')
         video_length = self._convert_time_to_seconds(duration)
         
         # processing other response parts
-        snippet = response['items'][0]['snippet']
-        status = response['items'][0]['status']
+        snippet = item['snippet']
+        status = item['status']
 
         video_stats = {
             "video_id": self.video_id,
@@ -90,15 +139,22 @@ class Video(YoutubeContent):
             "user_tags": snippet.get('tags', []),
             "description": snippet.get('description', 'Not Found'),
         }
-        return video_stats
+
+        self._video_name = video_stats['video_name']
+        self._channel_id = video_stats['channel_id']
+        self._video_length = video_length
+
+        self._parsed['properties'] = video_stats
+        return dict(video_stats)
     
     def get_video_statistics(self) -> dict:
         """
         Fetch and return statistics of the video, including views, likes, and comments.
         """
-        response = self.get_response(self.video_id, 'statistics, contentDetails')
-        
-        statistics = response['items'][0].get('statistics', {})
+        if 'statistics' in self._parsed:
+            return dict(self._parsed['statistics'])
+
+        statistics = self._get_item(self.video_id, STATISTICS_PARTS)['statistics']
 
         video_stats = {
             "date": datetime.now().strftime('%Y-%m-%d'),
@@ -108,21 +164,32 @@ class Video(YoutubeContent):
             "comments": statistics.get('commentCount', 0),
         }
 
-        return video_stats
+        self._parsed['statistics'] = video_stats
+        return dict(video_stats)
     
     def get_video_data(self) -> dict:
+        # properties and statistics parts are fetched together in a single request
+        self._get_item(self.video_id, f"{PROPERTIES_PARTS}, {STATISTICS_PARTS}")
         properties = self.get_video_properties()
         statistics = self.get_video_statistics()
         return properties | statistics
 
-    def get_video_transcript(self):
+    def get_video_transcript(self, languages: Sequence[str] = ('en',), with_segments: bool = False):
         """
         Fetch and return the transcript of the video in a consolidated string format.
+        With with_segments=True the timed segments ({"text", "start", "duration"}) 
+        are returned as well, under "segments".
         """
+        # imported upon first use, youtube_transcript_api is slow to import
+        from youtube_transcript_api import YouTubeTranscriptApi
+        from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
+
         id = self.video_id[:11]
         try:
-            transcript = YouTubeTranscriptApi.get_transcript(id)
+            transcript = YouTubeTranscriptApi.get_transcript(id, languages=languages)
             full_transcript = {"transcript": " ".join([part['text'] for part in transcript])}
+            if with_segments:
+                full_transcript["segments"] = transcript
 
         except TranscriptsDisabled:
             full_transcript = {"transcript": "transcript-disabled"}
@@ -133,36 +200,34 @@ class Video(YoutubeContent):
         except VideoUnavailable:
             full_transcript = {"transcript": "transcript-unavailable"}
 
-        except Exception:
-            raise ValueError("Could not extract video transcript, unconventional api error occured.")
+        except Exception as error:
+            raise ValueError("Could not extract video transcript, unconventional api error occured.") from error
 
         return full_transcript  
 
     @staticmethod
     def _convert_time_to_seconds(time_string: str) -> int:
         """
-        Convert a given duration format (used by YouTube) to total seconds.
+        Convert a given duration format (used by YouTube) to total seconds, 
+        0 for missing or malformed durations.
         """
-        try:
-            pattern = r'PT((\d+)H)?((\d+)M)?((\d+)S)?'
-            match = re.match(pattern, time_string)
-
-            hours = int(match.group(2)) if match.group(2) else 0
-            minutes = int(match.group(4)) if match.group(4) else 0
-            seconds = int(match.group(6)) if match.group(6) else 0
-
-            total_seconds = hours * 3600 + minutes * 60 + seconds
+        match = DURATION_PATTERN.match(time_string) if isinstance(time_string, str) else None
+        if match is None:
+            return 0
 
-        except AttributeError:
-            total_seconds = 0
-
-        return total_seconds
+        weeks, days, hours, minutes, seconds = (int(group) if group else 0 for group in match.groups())
+        return weeks * 604800 + days * 86400 + hours * 3600 + minutes * 60 + seconds
 
     @staticmethod
     def _parse_date(date_string: str) -> str:
         """
         Convert a given date string to standard ISO format.
         """
+        # API timestamps are RFC 3339, their date part needs no general-purpose parser
+        if RFC3339_DATE_PATTERN.match(date_string):
+            return date.fromisoformat(date_string[:10]).isoformat()
+
+        from dateutil.parser import parse
         return parse(date_string).date().isoformat()
     
     @staticmethod
@@ -170,11 +235,9 @@ class Video(YoutubeContent):
         """
         Based on provided video length return video type.
         """
-        SHORTS_MAX_LENGTH = 60
-
         if video_length == 0:
             return "unknown"
         elif video_length <= SHORTS_MAX_LENGTH and video_length > 0:
             return "shorts"
         else:
-            return "video"
\ No newline at end of file
+            return "video"
@@ -1,10 +1,33 @@
-from typing import Optional
-from tqdm import tqdm
-from .video import Video
+import math
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from .content import YoutubeContent, chunked, MAX_IDS_PER_REQUEST
+from .metrics import metrics
+from .quota import QuotaScheduler
+from .journal import RunJournal
+from .transcripts import TranscriptFetcher
+from .transcript_store import TranscriptStore
+from .watermarks import WatermarkStore
+from .video import Video, PROPERTIES_PARTS, STATISTICS_PARTS
 from .playlist import Playlist
 from .channel import Channel
 
 
+def _progress(items, desc: str):
+    # tqdm is imported upon first use, it is slow to import
+    from tqdm import tqdm
+    return tqdm(items, desc=desc)
+
+
+def channel_quota_cost(max_videos: int) -> int:
+    """
+    Projected quota units needed to collect max_videos from a channel: uploads playlist lookup,
+    playlistItems pages and batched videos.list calls (50 videos per call each).
+    """
+    pages = math.ceil(max_videos / MAX_IDS_PER_REQUEST)
+    return 1 + 2 * pages
+
+
 class VideoDataCollector:
     """
     YoutubeDataCollector class is responsibe for gathering data via custom interface for
@@ -12,73 +35,240 @@ class VideoDataCollector:
     """
     def __init__(self, channel_ids: Optional[list[str]] = None, 
                  video_ids: Optional[list[str]] = None, 
-                 playlist_ids: Optional[list[str]] = None):
+                 playlist_ids: Optional[list[str]] = None,
+                 quota_budget: Optional[int] = None,
+                 transcript_fetcher: Optional[TranscriptFetcher] = None,
+                 transcript_store: Optional[TranscriptStore] = None,
+                 watermarks: Optional[WatermarkStore] = None,
+                 journal: Optional[RunJournal] = None):
         
         self.channel_ids = channel_ids or []
         self.video_ids = video_ids or []
         self.playlist_ids = playlist_ids or []
 
+        # quota units a single collect_* run may spend, work that does not fit is skipped
+        self.quota_budget = quota_budget
+        # projected vs actual quota usage of the last run
+        self.quota_report = None
+
+        # thread pool fetching transcripts in parallel with the API requests
+        self.transcript_fetcher = transcript_fetcher
+        # transcripts known from previous runs are read from the store instead of being scraped
+        # (used by the default fetcher, a configured transcript_fetcher takes its own store)
+        self.transcript_store = transcript_store
+
+        # incremental mode: only videos uploaded since the previous run are collected from channels
+        self.watermarks = watermarks
+
+        # resumable runs: finished channels / playlists, page tokens and produced video ids are 
+        # recorded, so a repeated run continues where an interrupted one stopped
+        self.journal = journal
+
     def collect_data_from_channels(self, max_videos: int = 50) -> list[dict]:
         """
         Collects data from provieded channel ids. Designed for static data, method combines video properties and 
         video transcript. Results are saved in dictionary format.
         """
-        all_video_data = []
+        return list(self.iter_data_from_channels(max_videos))
 
+    def iter_data_from_channels(self, max_videos: int = 50) -> Iterator[dict]:
+        """
+        Streaming version of collect_data_from_channels, yields records as they are produced.
+        """
         if not len(self.channel_ids):
             raise ValueError("Methods requires channel_ids to collect data.")
 
-        for channel_id in tqdm(self.channel_ids, desc="Processing videos from channel ids"):
-            channel = Channel(channel_id)
-            channel_videos = channel.get_channel_videos(max_videos)
+        channel_ids = self._pending_sources(self.channel_ids)
+        scheduler = QuotaScheduler(self.quota_budget, YoutubeContent.quota_ledger)
+        channel_ids = scheduler.plan(channel_ids, channel_quota_cost(max_videos))
+
+        try:
+            with self._transcripts() as fetcher:
+                pending = ([], None)
 
-            for video in channel_videos:
-                try:
-                    video_data = video.get_video_properties() | video.get_video_transcript()
-                    all_video_data.append(video_data)
+                with scheduler.run():
+                    for channel_id in _progress(channel_ids, desc="Processing videos from channel ids"):
+                        channel = Channel(channel_id)
+                        watermark = self.watermarks.get(channel_id) if self.watermarks is not None else None
+                        page_token, videos_done = self.journal.position(channel_id) if self.journal is not None else (None, 0)
+                        resumed = videos_done > 0
+                        newest = None
 
-                # youtube transcript api sometimes returns connection errors. 
-                # After they occur, Video.get_transcript() method raises ValueError. 
-                # Becouse these are rare, I chose to skip when found.
-                except ValueError:
-                    continue
+                        pages = channel.iter_video_pages(max_videos - videos_done, watermark, page_token)
+                        for page, next_page_token in pages:
+                            newest = newest or page[0]
+                            videos_done += len(page)
 
-        return all_video_data
+                            # one videos.list request per 50 videos instead of one per video
+                            submitted = [
+                                (video.get_video_properties(), fetcher.submit(video))
+                                for video in Video.hydrate_many(self._new_videos(page), PROPERTIES_PARTS)
+                            ]
+
+                            # transcripts of this page are scraped while the previous page 
+                            # is yielded and the next page is requested
+                            yield from self._emit(fetcher, pending)
+                            pending = (submitted, (channel_id, next_page_token, videos_done, False))
+
+                        pending = self._finish_source(channel_id, videos_done, pending)
+
+                        # a resumed channel starts mid-playlist, its first page is not the newest upload
+                        if self.watermarks is not None and newest is not None and not resumed:
+                            channel.update_watermark(self.watermarks, newest)
+
+                yield from self._emit(fetcher, pending)
+
+            # watermarks are persisted only after a complete run, so no uploads are missed after a crash
+            if self.watermarks is not None:
+                self.watermarks.save()
+        finally:
+            self.quota_report = scheduler.report()
+            metrics.export()
 
     def collect_data_from_videos(self) -> list:
         """
         Collects data from video ids. Designed for dynamic data (data that is changing over time).
         Results are saved in dictionary format.
         """
-        all_video_data = []
+        return list(self.iter_data_from_videos())
 
+    def iter_data_from_videos(self) -> Iterator[dict]:
+        """
+        Streaming version of collect_data_from_videos, yields records as they are produced.
+        """
         if not len(self.video_ids):
             raise ValueError("Methods requires video_ids to collect data.")
 
-        for video_id in tqdm(self.video_ids, desc="Processing videos from video ids"):
-            video = Video(video_id)
-            video_data = video.get_video_stats()
-            all_video_data.append(video_data)
+        video_ids = self.video_ids
+        if self.journal is not None:
+            self.journal.begin()
+            video_ids = self.journal.new_items(video_ids)
+
+        scheduler = QuotaScheduler(self.quota_budget, YoutubeContent.quota_ledger)
+        batches = scheduler.plan(chunked(video_ids), cost=1)
+
+        try:
+            with scheduler.run():
+                for batch in _progress(batches, desc="Processing videos from video ids"):
+                    videos = [Video(video_id) for video_id in batch]
 
-        return all_video_data
+                    for video in Video.hydrate_many(videos, STATISTICS_PARTS):
+                        yield video.get_video_statistics()
+
+                        # journaled once the consumer asks for the next record (at least once)
+                        if self.journal is not None:
+                            self.journal.mark_done(video.video_id)
+        finally:
+            self.quota_report = scheduler.report()
+            metrics.export()
     
     def collect_data_from_playlists(self, max_videos: int = 50) -> list:
         """
+        Collects data from provided playlist ids, method combines video properties and video transcript.
+        Results are saved in dictionary format.
         """
-        all_video_data = []
+        return list(self.iter_data_from_playlists(max_videos))
 
+    def iter_data_from_playlists(self, max_videos: int = 50) -> Iterator[dict]:
+        """
+        Streaming version of collect_data_from_playlists, yields records as they are produced.
+        """
         if not len(self.playlist_ids):
             raise ValueError("Methods requires video_ids to collect data.")
         
         if max_videos > 50:
             raise NotImplementedError("Fetching data from more then 50 videos per playlist is currently not supported.")
         
-        for playlist_id in tqdm(self.playlist_ids, desc="Processing videos from playlist ids"):
-            playlist = Playlist(playlist_id)
-            playlist_videos = playlist.get_playlist_videos(max_results=max_videos)
+        playlist_ids = self._pending_sources(self.playlist_ids)
+        scheduler = QuotaScheduler(self.quota_budget, YoutubeContent.quota_ledger)
+        playlist_ids = scheduler.plan(playlist_ids, cost=2)
+
+        try:
+            with self._transcripts() as fetcher:
+                pending = ([], None)
+
+                with scheduler.run():
+                    for playlist_id in _progress(playlist_ids, desc="Processing videos from playlist ids"):
+                        playlist = Playlist(playlist_id)
+                        playlist_videos, _ = playlist.get_playlist_videos(max_results=max_videos)
+
+                        submitted = [
+                            (video.get_video_properties(), fetcher.submit(video))
+                            for video in Video.hydrate_many(self._new_videos(playlist_videos), PROPERTIES_PARTS)
+                        ]
+                        yield from self._emit(fetcher, pending)
+                        pending = (submitted, (playlist_id, None, len(playlist_videos), True))
+
+                yield from self._emit(fetcher, pending)
+        finally:
+            self.quota_report = scheduler.report()
+            metrics.export()
+
+    def _pending_sources(self, source_ids: list[str]) -> list[str]:
+        """
+        Drops channels / playlists finished in a previous attempt of the journaled run.
+        """
+        if self.journal is None:
+            return source_ids
+
+        self.journal.begin()
+        return self.journal.pending_sources(source_ids)
+
+    def _new_videos(self, videos: list[Video]) -> list[Video]:
+        """
+        Drops videos already produced in a previous attempt of the journaled run.
+        """
+        if self.journal is None:
+            return videos
+
+        new_ids = set(self.journal.new_items(video.video_id for video in videos))
+        return [video for video in videos if video.video_id in new_ids]
 
-            for video in playlist_videos:
-                video_data = video[0].get_video_properties() | video[0].get_video_transcript()
-                all_video_data.append(video_data)
+    def _finish_source(self, source_id: str, items_done: int, pending: tuple) -> tuple:
+        """
+        Marks the source as finished in the journal, once its last pending page is yielded.
+        """
+        if self.journal is None:
+            return pending
+
+        submitted, checkpoint = pending
+        if checkpoint is not None and checkpoint[0] == source_id:
+            return (submitted, (source_id, None, items_done, True))
+
+        self.journal.checkpoint(source_id, None, items_done, finished=True)
+        return pending
+
+    def _emit(self, fetcher: TranscriptFetcher, pending: tuple) -> Iterator[dict]:
+        """
+        Waits for submitted transcripts of a page and yields them merged with video properties. 
+        Once the page is yielded, its progress is checkpointed in the journal. A video is journaled
+        once the consumer asks for the next record, so records are delivered at least once: a record
+        whose consumer failed (e.g. a failing sink) is produced again by the resumed run, and so is
+        the last record handed out before the run was stopped.
+        """
+        submitted, checkpoint = pending
+        for properties, future in submitted:
+            # youtube transcript api sometimes returns connection errors. 
+            # After they occur, Video.get_transcript() method raises ValueError. 
+            # Fetcher retries them, videos still failing are skipped.
+            transcript = fetcher.result(future)
+            if transcript is not None:
+                yield properties | transcript
+
+                if self.journal is not None:
+                    self.journal.mark_done(properties['video_id'])
+
+        if self.journal is not None and checkpoint is not None:
+            self.journal.checkpoint(*checkpoint)
+
+    @contextmanager
+    def _transcripts(self) -> Iterator[TranscriptFetcher]:
+        """
+        Yields the configured transcript fetcher, or a default one closed after the run.
+        """
+        if self.transcript_fetcher is not None:
+            yield self.transcript_fetcher
+            return
 
-        return all_video_data
+        with TranscriptFetcher(store=self.transcript_store) as fetcher:
+            yield fetcher
@@ -0,0 +1,55 @@
+import os
+import json
+import threading
+from typing import NamedTuple, Optional
+
+
+class Watermark(NamedTuple):
+    """
+    Newest upload of a channel known from a previous crawl. The uploads playlist id
+    is remembered too, so a refresh does not need a channels.list call.
+    """
+    video_id: str
+    published_at: Optional[str] = None
+    uploads_playlist_id: Optional[str] = None
+
+
+class WatermarkStore:
+    """
+    Per-channel high-water marks persisted in a JSON file, used by incremental channel crawls
+    to stop paginating the uploads playlist as soon as already known videos are reached.
+    """
+    def __init__(self, path: str = 'youtube-watermarks.json'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._watermarks = {}
+
+        if os.path.exists(path):
+            with open(path, 'r') as file:
+                self._watermarks = {channel_id: Watermark(*values) for channel_id, values in json.load(file).items()}
+
+    def __repr__(self) -> str:
+        return f"WatermarkStore(path={self.path}, channels={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._watermarks)
+
+    def __contains__(self, channel_id: str) -> bool:
+        return channel_id in self._watermarks
+
+    def get(self, channel_id: str) -> Optional[Watermark]:
+        return self._watermarks.get(channel_id)
+
+    def set(self, channel_id: str, watermark: Watermark) -> None:
+        with self._lock:
+            self._watermarks[channel_id] = watermark
+
+    def save(self) -> None:
+        """
+        Writes the watermarks to disk atomically (temporary file + rename).
+        """
+        with self._lock:
+            temporary_path = f"{self.path}.tmp"
+            with open(temporary_path, 'w') as file:
+                json.dump({channel_id: list(watermark) for channel_id, watermark in self._watermarks.items()}, file)
+            os.replace(temporary_path, self.path)
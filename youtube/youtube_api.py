@@ -1,53 +1,52 @@
-import os
 from typing import Literal
-from googleapiclient.discovery import build
+from .content import YoutubeContent
 
-class YouTubeAPI:
+class YouTubeAPI(YoutubeContent):
     """
-    A class to interact with the YouTube Data API v3, providing methods to fetch video details, 
-    channel details, search results, and playlist items.
+    A class to interact with the YouTube Data API v3, providing methods to fetch video details,
+    channel details, search results, and playlist items. Like every get_response implementation,
+    requests go through YoutubeContent._execute (response cache, quota ledger, key pool and
+    the shared request executor).
     """
     def __init__(self):
-        self.youtube = self.build_youtube_object()
+        super().__init__()
 
-    def build_youtube_object(self):
-        """Builds and returns the YouTube API service object."""
-        api_key = os.environ.get('YOUTUBE_API_KEY')
-        if not api_key:
-            raise ValueError("YOUTUBE_API_KEY environment variable is not set.")
-        
-        return build('youtube', 'v3', developerKey=api_key)
+    def get_response(self, endpoint: str, **params):
+        return self._execute(endpoint, **params)
 
     def get_video_response(self, video_id: str, part: str):
-        return self.youtube.videos().list(
+        return self._execute(
+            'videos',
             part=part,
             id=video_id
-        ).execute()
+        )
 
     def get_channel_response(self, channel_id: str, part: str):
-        return self.youtube.channels().list(
+        return self._execute(
+            'channels',
             part=part,
             id=channel_id
-        ).execute()
-    
+        )
+
     def get_search_response(
-            self, 
-            key: str, 
+            self,
+            key: str,
             part: str,
             type: Literal["video", "channel", "playlist", "movie"],
             order_by: Literal["viewCount", "relevance", "date"],
             max_results: int,
             published_after = None
             ):
-        
-        return self.youtube.search().list(
+
+        return self._execute(
+                'search',
                 q=key,
                 type=type,
                 order=order_by,
                 publishedAfter=published_after,
                 part=part,
                 maxResults=max_results
-            ).execute()
+            )
 
     def get_playlist_response(
             self,
@@ -57,9 +56,10 @@ class YouTubeAPI:
             page_token = None
         ):
 
-        return self.youtube.playlistItems().list(
+        return self._execute(
+                'playlistItems',
                 part=part,
                 playlistId=playlist_id,
                 maxResults=max_results,
                 pageToken=page_token
-            ).execute()
\ No newline at end of file
+            )